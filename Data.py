@@ -1,87 +1,248 @@
+import argparse
+import functools
+import json
+import os
+import queue
+import threading
+import time
 import tkinter as tk
-from tkinter import ttk, messagebox
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from tkinter import ttk, messagebox, filedialog
 from typing import Dict, Any
 
+from akademik import (LaporanImpor, LogPerintah, Mahasiswa, RepositoriMemori, RepositoriSQLite, baris_transkrip,
+                      buat_repositori, cek_input, ekspor, format_dari_path, impor_csv)
+from akademik.cli import tambah_opsi_data
+
 PRIMARY_COLOR = "#0047AB"  # Biru gelap
 ACCENT_COLOR = "#00BFFF"   # Biru cerah
 BACKGROUND_COLOR = "#F0F0F0" # Abu-abu
 TEXT_COLOR = "#333333"
 
-class Mahasiswa:
-    """Kelas untuk merepresentasikan data seorang Mahasiswa, kini dengan kamus nilai mata kuliah."""
-    def __init__(self, nama: str, nim: str):                  #M4
+# Tabel Mahasiswa otomatis memakai mode virtual (hanya baris yang terlihat yang dibuat) mulai jumlah ini
+AMBANG_TABEL_VIRTUAL = 5_000
+TINGGI_TABEL_MHS = 10     # jumlah baris yang terlihat di tree_mhs
+JEDA_CARI_MS = 250        # debounce kotak pencarian
+BUFFER_VIRTUAL = 20       # baris tambahan yang diambil di atas/bawah jendela terlihat
+DURASI_STATUS_MS = 4_000  # notifikasi di bilah status hilang sendiri setelah selang ini
+AMBANG_UNDO_LATAR = 1_000 # batch undo/redo dengan langkah lebih banyak dari ini dijalankan di latar belakang
+SAMPEL_PROFIL = 1_000     # durasi terbaru per operasi yang disimpan untuk persentil
+JEDA_PANEL_PROFIL_MS = 1_000
+
+class TugasDibatalkan(Exception):
+    """Dilempar di dalam tugas latar belakang ketika pengguna membatalkannya."""
+
+class Tugas:
+    """Pegangan satu tugas latar belakang: pelaporan progres, hasil sebagian, dan pembatalan."""
+    def __init__(self, penjadwal: "PenjadwalTugas", nama: str):
         self.nama = nama
-        self.nim = nim                                         
-        self.matkul_nilai: Dict[str, int] = {}
-
-    def tambah_nilai_matkul(self, matkul: str, nilai: int):
-        """Menambahkan atau memperbarui Nilai Akhir (0-100) untuk mata kuliah tertentu."""
-        self.matkul_nilai[matkul] = nilai
-
-    def konversi_nilai_ke_huruf_dan_bobot(self, nilai: int) -> tuple[str, float]:
-        """Mengkonversi nilai (0-100) ke Nilai Huruf dan Bobot Skala 4.00."""
-        if nilai >= 95:
-            return "A+", 4.0
-        elif nilai >=90:
-            return "A", 4.0
-        elif nilai >= 85:
-            return "AB", 3.5
-        elif nilai >= 75:                         
-            return "B", 3.0
-        elif nilai >= 70:
-            return "BC", 2.5
-        elif nilai >= 65:
-            return "C", 2.0
-        elif nilai >= 50:
-            return "D", 1.0
+        self._penjadwal = penjadwal
+        self._batal = threading.Event()
+        self._progres_terakhir = -1.0
+
+    @property
+    def dibatalkan(self) -> bool:
+        return self._batal.is_set()
+
+    def batal(self):
+        """Meminta tugas berhenti; tugas memeriksanya lewat cek_batal() di antara batch."""
+        self._batal.set()
+
+    def cek_batal(self):
+        if self._batal.is_set():
+            raise TugasDibatalkan(self.nama)
+
+    def progres(self, fraksi: float, pesan: str = ""):
+        """Melaporkan progres 0.0-1.0 ke thread GUI (dibatasi per 1% agar antrean tidak banjir)."""
+        if fraksi - self._progres_terakhir >= 0.01 or fraksi >= 1.0:
+            self._progres_terakhir = fraksi
+            self._penjadwal._antrean.put(("progres", self, (fraksi, pesan)))
+
+    def kirim(self, data: Any):
+        """Mengirim hasil sebagian ke thread GUI."""
+        self._penjadwal._antrean.put(("sebagian", self, data))
+
+class PenjadwalTugas:
+    """Menjalankan tugas berat di thread pekerja; hasilnya dialirkan ke thread Tk lewat antrean + root.after.
+
+    Callback (saat_progres, saat_sebagian, saat_selesai, saat_batal, saat_error) selalu dipanggil
+    di thread Tk, sehingga aman menyentuh widget. Tugas dijalankan berurutan oleh satu pekerja.
+    """
+    INTERVAL_MS = 50
+    PESAN_PER_TICK = 200   # batas pesan per polling agar event loop tetap responsif
+
+    def __init__(self, root):
+        self.root = root
+        self._antrean: queue.Queue = queue.Queue()
+        self._pekerja = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tugas")
+        self._callback: Dict[Tugas, Dict[str, Any]] = {}
+        self._after_id = None
+
+    @property
+    def sibuk(self) -> bool:
+        return bool(self._callback)
+
+    def jalankan(self, nama: str, fungsi, **callback) -> Tugas:
+        """Menjadwalkan fungsi(tugas) di thread pekerja dan mengembalikan pegangan Tugas-nya."""
+        tugas = Tugas(self, nama)
+        self._callback[tugas] = callback
+        self._pekerja.submit(self._bungkus, fungsi, tugas)
+        if self._after_id is None:
+            self._after_id = self.root.after(self.INTERVAL_MS, self._polling)
+        return tugas
+
+    def _bungkus(self, fungsi, tugas: Tugas):
+        try:
+            hasil = fungsi(tugas)
+        except TugasDibatalkan:
+            self._antrean.put(("batal", tugas, None))
+        except Exception as e:
+            self._antrean.put(("error", tugas, e))
         else:
-            return "E", 0.0
-
-    def hitung_rata_rata(self) -> float:
-        """Menghitung rata-rata nilai (0-100) dari semua mata kuliah."""
-        if not self.matkul_nilai:
-            return 0.0
-        total_nilai = sum(self.matkul_nilai.values())
-        return total_nilai / len(self.matkul_nilai)
-
-    def hitung_ipk(self) -> float:
-        """Menghitung IPK (Indeks Prestasi Kumulatif) berdasarkan skala 4.00."""
-        if not self.matkul_nilai:
-            return 0.0
-            
-        total_bobot = 0.0
-        jumlah_matkul = len(self.matkul_nilai)
-        
-        for nilai_akhir in self.matkul_nilai.values():                             
-            _, bobot = self.konversi_nilai_ke_huruf_dan_bobot(nilai_akhir)
-            total_bobot += bobot
-            
-        return total_bobot / jumlah_matkul
+            self._antrean.put(("selesai", tugas, hasil))
+
+    def _polling(self):
+        self._after_id = None
+        for _ in range(self.PESAN_PER_TICK):
+            try:
+                jenis, tugas, data = self._antrean.get_nowait()
+            except queue.Empty:
+                break
+            callback = self._callback.get(tugas, {})
+            if jenis in ("selesai", "batal", "error"):
+                self._callback.pop(tugas, None)
+            fungsi = callback.get(f"saat_{jenis}")
+            if jenis == "progres" and fungsi:
+                fungsi(*data)
+            elif fungsi:
+                fungsi(data)
+        if self._callback or not self._antrean.empty():
+            self._after_id = self.root.after(self.INTERVAL_MS, self._polling)
+
+    def tutup(self):
+        """Membatalkan semua tugas dan menunggu pekerja berhenti (dipanggil saat aplikasi ditutup)."""
+        for tugas in list(self._callback):
+            tugas.batal()
+        self._pekerja.shutdown(wait=True)
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+# INSTRUMENTASI (opt-in)
+class ProfilWaktu:
+    """Penghitung waktu per operasi App: jumlah panggilan, total, maksimum, dan SAMPEL_PROFIL durasi terbaru.
+
+    Hanya aktif jika App dibuat dengan profil (`--profil BERKAS.json` atau AKADEMIK_PROFIL); tanpa itu
+    handler tidak mencatat apa pun. Durasi adalah waktu Python di handler, tidak termasuk gambar ulang Tk.
+    """
+    def __init__(self, path: str | None = None, ukuran_sampel: int = SAMPEL_PROFIL):
+        self.path = path
+        self.ukuran_sampel = ukuran_sampel
+        self._data: Dict[str, list] = {}   # nama -> [jumlah, total detik, maks detik, deque durasi terbaru]
+
+    def catat(self, nama: str, durasi: float):
+        data = self._data.get(nama)
+        if data is None:
+            data = self._data[nama] = [0, 0.0, 0.0, deque(maxlen=self.ukuran_sampel)]
+        data[0] += 1
+        data[1] += durasi
+        if durasi > data[2]:
+            data[2] = durasi
+        data[3].append(durasi)
+
+    def ringkasan(self) -> Dict[str, Dict[str, float]]:
+        """Statistik per operasi (ms), diurutkan dari total waktu terbesar."""
+        hasil = {}
+        for nama, (jumlah, total, maks, sampel) in sorted(self._data.items(), key=lambda item: -item[1][1]):
+            urut = sorted(sampel)
+            hasil[nama] = {"jumlah": jumlah, "total_ms": total * 1e3, "rata_ms": total / jumlah * 1e3,
+                           "p95_ms": urut[min(len(urut) - 1, int(len(urut) * 0.95))] * 1e3, "maks_ms": maks * 1e3}
+        return hasil
+
+    def simpan_json(self, path: str | None = None, **info) -> str:
+        """Menulis ringkasan (plus info tambahan, mis. ukuran data) ke berkas JSON secara atomik."""
+        path = path or self.path
+        sementara = path + ".tmp"
+        with open(sementara, "w", encoding="utf-8") as f:
+            json.dump({"waktu": time.strftime("%Y-%m-%dT%H:%M:%S"), **info, "operasi": self.ringkasan()}, f,
+                      indent=2)
+        os.replace(sementara, path)
+        return path
+
+    def reset(self):
+        self._data.clear()
 
-    def get_predikat_rata_rata(self) -> str:
-        """Dipertahankan di kelas untuk konsistensi, tapi tidak ditampilkan di UI."""
-        rata_rata = self.hitung_rata_rata()
-        if rata_rata >= 85: return "A"
-        elif rata_rata >= 75: return "B"
-        elif rata_rata >= 65: return "C"
-        else: return "D"
+def _diukur(metode):
+    """Dekorator: mencatat durasi handler/refresh tabel ke self.profil, hanya jika instrumentasi aktif."""
+    nama = metode.__name__
+    @functools.wraps(metode)
+    def pembungkus(self, *args, **kwargs):
+        if self.profil is None:
+            return metode(self, *args, **kwargs)
+        mulai = time.perf_counter()
+        try:
+            return metode(self, *args, **kwargs)
+        finally:
+            self.profil.catat(nama, time.perf_counter() - mulai)
+    return pembungkus
 
 #APLIKASI GUI
 class App:
-    def __init__(self, root):
+    def __init__(self, root, repo: RepositoriMemori | RepositoriSQLite | None = None, virtual: bool | None = None,
+                 profil: ProfilWaktu | None = None):
         self.root = root
         self.root.title("Aplikasi Akademik Sederhana")
         
-        self.root.geometry("1050x650") 
-        self.root.resizable(False, False)
+        # Tinggi awal memuat kolom kiri dan tabel kanan; jendela boleh diubah ukurannya untuk layar kecil
+        self.root.geometry("1050x800")
+        self.root.minsize(1050, 600)
         self.root.config(bg=BACKGROUND_COLOR)
 
-        self.data_mahasiswa: list[Mahasiswa] = []
+        # Semua mutasi data lewat repositori (memori atau jurnal persisten), dicatat untuk undo/redo
+        self.repo = repo if repo is not None else RepositoriMemori()
+        self.perintah = LogPerintah(self.repo)
+        self._after_status = None
         self.mahasiswa_terpilih: Mahasiswa | None = None
 
+        # Cache nilai yang sedang tampil per iid, agar tabel hanya diperbarui pada baris yang berubah
+        self._baris_mhs: Dict[str, tuple] = {}
+        self._baris_matkul: Dict[str, tuple] = {}
+        self._matkul_milik: Mahasiswa | None = None
+
+        # Mode virtual: Treeview hanya berisi baris yang terlihat, sisanya diambil dari repositori saat digulir
+        self.virtual = virtual if virtual is not None else len(self.repo) >= AMBANG_TABEL_VIRTUAL
+        self._virtual_awal = 0        # posisi logis baris teratas yang terlihat
+        self._virtual_total = 0
+        self._blok_awal = 0           # posisi logis baris pertama di cache blok
+        self._blok_baris: list[tuple] = []
+        self._iid_terpilih: str | None = None
+
+        # Pencarian: None = semua baris, selain itu daftar id baris hasil filter sesuai urutan tampil
+        self._urutan_tampil: list[int] | None = None
+        self._after_cari = None
+        # Pengurutan lewat klik judul kolom: None = urutan input
+        self._kolom_urut: str | None = None
+        self._urut_menurun = False
+
+        # Tugas berat (impor, hitung ulang) berjalan di thread pekerja agar mainloop tidak membeku
+        self.penjadwal = PenjadwalTugas(self.root)
+        self.tugas_aktif: Tugas | None = None
+
+        self._baris_statistik: Dict[str, tuple] = {}
+        self._statistik_siap = False   # statistik kohort pertama dibangun di latar belakang (muat_statistik)
+
+        # Penghitung waktu handler/refresh tabel (None = nonaktif); panel debug dibuka dengan F12
+        self.profil = profil
+        self._panel_profil: tk.Toplevel | None = None
+
         self.apply_styles()
         self.create_widgets()
         self.update_mahasiswa_table()
+        self.muat_statistik()
+        if self.profil is not None:
+            self.root.bind("<F12>", self.buka_panel_profil)
+            self.tampilkan_status("Profil waktu aktif: F12 untuk panel debug.")
 
     def apply_styles(self):
         """Menerapkan tema dan gaya modern pada widget Tkinter/ttk."""
@@ -114,14 +275,20 @@ class App:
                   background=[('active', ACCENT_COLOR)],
                   foreground=[('active', 'white')])
 
+        style.configure("TNotebook", background=BACKGROUND_COLOR)
+        style.configure("TNotebook.Tab", font=('Arial', 10, 'bold'), padding=[10, 4])
+
         self.card_style = {"bg": "white", "padx": 15, "pady": 15, "bd": 1, "relief": "groove"}
 
     def create_widgets(self):
         """Membuat dan menata semua widget UI."""
         
+        # BILAH STATUS: di-pack paling awal agar selalu mendapat tempat di bawah jendela
+        self.setup_status_bar()
+
         # CONTAINER UTAMA: Menggunakan Frame yang lebih besar (PACK)
         main_container = tk.Frame(self.root, bg=BACKGROUND_COLOR)
-        main_container.pack(pady=10, padx=20, fill="x")
+        main_container.pack(pady=10, padx=20, fill="both", expand=True)
         
         # FRAME KIRI: INPUT & KARTU DATA (PACK di dalam main_container)
         frame_kiri = tk.Frame(main_container, bg=BACKGROUND_COLOR)
@@ -141,22 +308,33 @@ class App:
         card_matkul.pack(pady=10, fill="x")
 
         self.create_input_section(card_matkul, "INPUT NILAI MATA KULIAH (0-100)", 
-                                  ["Matkul", "Nilai"], 
+                                  ["Matkul", "Nilai", "Semester", "SKS"], 
                                   self.create_matkul_buttons)
 
+        #CARD 3: IMPOR MASSAL CSV (PACK di dalam frame_kiri)
+        card_impor = tk.Frame(frame_kiri, **self.card_style)
+        card_impor.pack(pady=10, fill="x")
+        self.create_impor_section(card_impor)
+
         #FRAME KANAN: TABEL DATA (PACK di dalam main_container)
         frame_kanan = tk.Frame(main_container, bg=BACKGROUND_COLOR)
-        frame_kanan.pack(side="right", padx=10, anchor="n")
+        frame_kanan.pack(side="right", padx=10, anchor="n", fill="y")
         
         #TABEL 1: DATA MAHASISWA (PACK di dalam frame_kanan)
         tk.Label(frame_kanan, text="DAFTAR MAHASISWA (Rata-Rata & IPK)", bg=BACKGROUND_COLOR, fg=PRIMARY_COLOR, 
                  font=("Arial", 11, "bold")).pack(anchor="w", pady=(0, 5))
+        self.setup_search_box(frame_kanan)
         self.setup_mahasiswa_table(frame_kanan)
 
-        #TABEL 2: DATA NILAI MATA KULIAH (PACK di dalam frame_kanan)
-        tk.Label(frame_kanan, text="DETAIL NILAI MATA KULIAH", bg=BACKGROUND_COLOR, fg=PRIMARY_COLOR, 
-                 font=("Arial", 11, "bold")).pack(anchor="w", pady=(15, 5))
-        self.setup_matkul_table(frame_kanan)
+        #TABEL 2 & 3: DETAIL NILAI dan STATISTIK PER MATA KULIAH berbagi tempat sebagai tab (PACK di dalam frame_kanan)
+        tab_kanan = ttk.Notebook(frame_kanan)
+        tab_kanan.pack(fill="both", expand=True, pady=(15, 0))
+        tab_nilai = tk.Frame(tab_kanan, bg=BACKGROUND_COLOR)
+        tab_statistik = tk.Frame(tab_kanan, bg=BACKGROUND_COLOR)
+        tab_kanan.add(tab_nilai, text="DETAIL NILAI MATA KULIAH")
+        tab_kanan.add(tab_statistik, text="STATISTIK PER MATA KULIAH")
+        self.setup_matkul_table(tab_nilai)
+        self.setup_statistik_table(tab_statistik)
         
     def create_input_section(self, parent: tk.Frame, title: str, labels: list[str], button_creator: Any):
         """Fungsi pembantu untuk membuat bagian input yang seragam (Mahasiswa/Nilai)."""
@@ -178,6 +356,8 @@ class App:
             elif label_text == "NIM": self.entry_nim = entry
             elif label_text == "Matkul": self.entry_matkul = entry
             elif label_text == "Nilai": self.entry_nilai = entry
+            elif label_text == "Semester": self.entry_semester = entry
+            elif label_text == "SKS": self.entry_sks = entry
 
         button_start_row = len(labels) + 1 
         button_creator(parent, button_start_row) 
@@ -201,7 +381,55 @@ class App:
         self.make_button(btn_frame_matkul, "✅ Tambah/Edit", self.tambah_edit_nilai, 0, width=15)
         self.make_button(btn_frame_matkul, "🗑️ Hapus Nilai", self.hapus_nilai, 1, width=17)
 
+    def create_impor_section(self, parent: tk.Frame):
+        """Membuat tombol impor CSV dan progress bar-nya."""
+        tk.Label(parent, text="IMPOR CSV (nim, nama, matkul, nilai, semester, sks)", bg="white", fg=PRIMARY_COLOR,
+                 font=("Arial", 12, "bold")).grid(row=0, column=0, columnspan=2, pady=(0, 10), sticky="w")
+
+        btn_frame_impor = tk.Frame(parent, bg="white")
+        btn_frame_impor.grid(row=1, column=0, columnspan=2, sticky="w")
+        self.make_button(btn_frame_impor, "📥 Impor CSV", self.impor_csv, 0, width=12)
+        self.make_button(btn_frame_impor, "🔄 Hitung Ulang", self.hitung_ulang, 1, width=13)
+        self.make_button(btn_frame_impor, "⛔ Batal", self.batal_tugas, 2, width=8)
+
+        self.progress_impor = ttk.Progressbar(parent, orient="horizontal", length=180, mode="determinate")
+        self.progress_impor.grid(row=2, column=0, padx=5, pady=(5, 0), sticky="w")
+        self.label_tugas = tk.Label(parent, text="", bg="white", fg=TEXT_COLOR, font=("Arial", 9))
+        self.label_tugas.grid(row=2, column=1, padx=5, pady=(5, 0), sticky="w")
+
+        btn_frame_ekspor = tk.Frame(parent, bg="white")
+        btn_frame_ekspor.grid(row=3, column=0, columnspan=2, sticky="w")
+        self.make_button(btn_frame_ekspor, "📤 Ekspor (CSV/JSONL/TXT)", self.ekspor, 0, width=25)
+
+    def setup_status_bar(self):
+        """Bilah status: notifikasi non-modal yang hilang sendiri, tombol Undo/Redo, dan shortcut-nya."""
+        frame_status = tk.Frame(self.root, bg=PRIMARY_COLOR)
+        frame_status.pack(side="bottom", fill="x")
+        self.label_status = tk.Label(frame_status, text="", bg=PRIMARY_COLOR, fg="white", anchor="w",
+                                     font=("Arial", 10))
+        self.label_status.pack(side="left", fill="x", expand=True, padx=10)
+        ttk.Button(frame_status, text="↪️ Redo", command=self.redo, style='Custom.TButton',
+                   width=8).pack(side="right", padx=5, pady=3)
+        ttk.Button(frame_status, text="↩️ Undo", command=self.undo, style='Custom.TButton',
+                   width=8).pack(side="right", pady=3)
+        self.root.bind("<Control-z>", self.undo)
+        self.root.bind("<Control-y>", self.redo)
+        self.root.bind("<Control-Z>", self.redo)   # Ctrl+Shift+Z
+
     # SETUP TABEL
+    def setup_search_box(self, parent):
+        """Kotak pencarian: angka = awalan NIM, selain itu bagian nama. Di-debounce JEDA_CARI_MS."""
+        frame_cari = tk.Frame(parent, bg=BACKGROUND_COLOR)
+        frame_cari.pack(fill="x", pady=(0, 5))
+        tk.Label(frame_cari, text="🔍 Cari (NIM/Nama):", bg=BACKGROUND_COLOR, fg=TEXT_COLOR,
+                 font=("Arial", 10)).pack(side="left")
+
+        self.var_cari = tk.StringVar()
+        self.var_cari.trace_add("write", self.jadwalkan_cari)
+        self.entry_cari = tk.Entry(frame_cari, textvariable=self.var_cari, width=30, bd=1, relief="solid",
+                                   font=("Arial", 10))
+        self.entry_cari.pack(side="left", padx=5, ipady=2)
+
     def setup_mahasiswa_table(self, parent):
         """Mengatur Treeview untuk daftar Mahasiswa (tanpa Predikat)."""
         frame_mhs_tabel = tk.Frame(parent, bg=BACKGROUND_COLOR)
@@ -209,21 +437,29 @@ class App:
 
         # Kolom yang ditampilkan: Nama, NIM, Rata-Rata, IPK
         self.tree_mhs = ttk.Treeview(frame_mhs_tabel, columns=("nama", "nim", "rata", "ipk"),
-                                     show="headings", height=10)
+                                     show="headings", height=TINGGI_TABEL_MHS)
 
+        self._judul_kolom_mhs = {}
         for col, text, width, anchor in [("nama", "Nama Mahasiswa", 200, "w"), 
                                          ("nim", "NIM", 100, "center"),
                                          ("rata", "Rata-Rata (0-100)", 130, "center"), 
                                          ("ipk", "IPK (4.00)", 100, "center")]: 
-            self.tree_mhs.heading(col, text=text)
+            self._judul_kolom_mhs[col] = text
+            self.tree_mhs.heading(col, text=text, command=lambda c=col: self.urutkan_kolom(c))
             self.tree_mhs.column(col, width=width, anchor=anchor)
 
         self.tree_mhs.bind("<ButtonRelease-1>", self.pilih_mahasiswa)
         self.tree_mhs.pack(side='left', fill="x", expand=True) # Menggunakan pack
 
-        vsb_mhs = ttk.Scrollbar(frame_mhs_tabel, orient="vertical", command=self.tree_mhs.yview)
-        self.tree_mhs.configure(yscrollcommand=vsb_mhs.set)
-        vsb_mhs.pack(side='right', fill='y')
+        if self.virtual:
+            # Scrollbar dipetakan ke jumlah baris logis, bukan ke isi Treeview
+            self.vsb_mhs = ttk.Scrollbar(frame_mhs_tabel, orient="vertical", command=self.gulir_virtual)
+            for event in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+                self.tree_mhs.bind(event, self.roda_virtual)
+        else:
+            self.vsb_mhs = ttk.Scrollbar(frame_mhs_tabel, orient="vertical", command=self.tree_mhs.yview)
+            self.tree_mhs.configure(yscrollcommand=self.vsb_mhs.set)
+        self.vsb_mhs.pack(side='right', fill='y')
 
 
     def setup_matkul_table(self, parent):
@@ -231,13 +467,15 @@ class App:
         frame_matkul_tabel = tk.Frame(parent, bg=BACKGROUND_COLOR)
         frame_matkul_tabel.pack(fill="x")
 
-        # Kolom yang ditampilkan: Mata Kuliah, Nilai, Nilai Huruf
-        self.tree_matkul = ttk.Treeview(frame_matkul_tabel, columns=("matkul", "nilai", "huruf"),
+        # Kolom yang ditampilkan: Semester, Mata Kuliah, SKS, Nilai, Nilai Huruf (semua percobaan)
+        self.tree_matkul = ttk.Treeview(frame_matkul_tabel, columns=("semester", "matkul", "sks", "nilai", "huruf"),
                                         show="headings", height=8)
 
-        for col, text, width, anchor in [("matkul", "Mata Kuliah", 200, "w"), 
-                                         ("nilai", "Nilai", 100, "center"),
-                                         ("huruf", "Nilai Huruf", 130, "center")]:
+        for col, text, width, anchor in [("semester", "Semester", 70, "center"),
+                                         ("matkul", "Mata Kuliah", 170, "w"), 
+                                         ("sks", "SKS", 50, "center"),
+                                         ("nilai", "Nilai", 70, "center"),
+                                         ("huruf", "Nilai Huruf", 100, "center")]:
             self.tree_matkul.heading(col, text=text)
             self.tree_matkul.column(col, width=width, anchor=anchor)
         
@@ -248,6 +486,35 @@ class App:
         self.tree_matkul.configure(yscrollcommand=vsb_matkul.set)
         vsb_matkul.pack(side='right', fill='y')
 
+        # IPS per semester dan IPK Mahasiswa terpilih
+        self.label_transkrip = tk.Label(parent, text="", bg=BACKGROUND_COLOR, fg=TEXT_COLOR,
+                                        font=("Arial", 9), justify="left", anchor="w")
+        self.label_transkrip.pack(fill="x", pady=(3, 0))
+
+    def setup_statistik_table(self, parent):
+        """Mengatur Treeview statistik seluruh Mahasiswa per mata kuliah."""
+        frame_statistik = tk.Frame(parent, bg=BACKGROUND_COLOR)
+        frame_statistik.pack(fill="x")
+
+        self.tree_statistik = ttk.Treeview(frame_statistik, columns=("matkul", "jumlah", "rata", "median", "sd",
+                                                                     "lulus", "distribusi"),
+                                           show="headings", height=8)
+
+        for col, text, width, anchor in [("matkul", "Mata Kuliah", 120, "w"),
+                                         ("jumlah", "N", 45, "center"),
+                                         ("rata", "Rata", 55, "center"),
+                                         ("median", "Median", 55, "center"),
+                                         ("sd", "Std", 55, "center"),
+                                         ("lulus", "Lulus", 55, "center"),
+                                         ("distribusi", "Distribusi Huruf", 145, "w")]:
+            self.tree_statistik.heading(col, text=text)
+            self.tree_statistik.column(col, width=width, anchor=anchor)
+        self.tree_statistik.pack(side='left', fill="x", expand=True)
+
+        vsb_statistik = ttk.Scrollbar(frame_statistik, orient="vertical", command=self.tree_statistik.yview)
+        self.tree_statistik.configure(yscrollcommand=vsb_statistik.set)
+        vsb_statistik.pack(side='right', fill='y')
+
     # BUTTON FACTORY
     def make_button(self, parent: tk.Frame, text: str, cmd: Any, col: int, width: int = 12):
         """Membuat dan menempatkan tombol dengan gaya kustom ttk."""
@@ -257,30 +524,18 @@ class App:
         button.grid(row=0, column=col, pady=5, padx=5, ipady=5)
 
     # VALIDASI & LOGIKA
-    def validasi_input(self, nama: str, nim: str, matkul: str | None = None, nilai: str | None = None) -> bool:
+    @_diukur
+    def validasi_input(self, nama: str, nim: str, matkul: str | None = None, nilai: str | None = None,
+                       semester: str | None = None, sks: str | None = None) -> bool:
         """Melakukan validasi input Mahasiswa dan Nilai Matkul."""
-        if nama and not all(c.isalpha() or c.isspace() or c == '.' for c in nama):
-            messagebox.showerror("Error", "Nama hanya boleh huruf, spasi, atau titik!")
+        pesan = cek_input(nama, nim, matkul, nilai, semester, sks)
+        if pesan:
+            messagebox.showerror("Error", pesan)
             return False
-        if nim and not nim.isdigit():
-            messagebox.showerror("Error", "NIM harus berisi angka!")
-            return False
-
-        if matkul or nilai:
-            if not matkul:
-                 messagebox.showerror("Error", "Nama Mata Kuliah tidak boleh kosong!")
-                 return False
-            if not nilai or not nilai.isdigit():
-                messagebox.showerror("Error", "Nilai harus berupa angka (0 - 100)!")
-                return False
-            
-            nilai_int = int(nilai)
-            if not (0 <= nilai_int <= 100):
-                messagebox.showerror("Error", "Nilai harus berada dalam rentang 0 - 100!")
-                return False
         return True
 
     # CRUD MAHASISWA
+    @_diukur
     def tambah_mahasiswa(self):
         """Menambahkan Mahasiswa baru."""
         nama = self.entry_nama.get().strip()
@@ -291,15 +546,16 @@ class App:
             messagebox.showerror("Error", "Nama dan NIM harus diisi!")
             return
 
-        if any(mhs.nim == nim for mhs in self.data_mahasiswa):
+        if nim in self.repo:
             messagebox.showerror("Error", f"NIM {nim} sudah terdaftar!")
             return
 
-        self.data_mahasiswa.append(Mahasiswa(nama, nim))
-        self.update_mahasiswa_table()
+        mhs_baru = self.perintah.tambah_mahasiswa(nama, nim)
+        self.update_baris_mahasiswa(mhs_baru)
         self.clear_input_mhs()
-        messagebox.showinfo("Sukses", "Mahasiswa berhasil ditambahkan!")
+        self.tampilkan_status(f"Mahasiswa {nama} ({nim}) berhasil ditambahkan!")
 
+    @_diukur
     def edit_mahasiswa(self):
         """Mengedit data Mahasiswa yang dipilih."""
         selected = self.tree_mhs.selection()
@@ -312,22 +568,19 @@ class App:
         
         if not self.validasi_input(nama, nim): return
 
-        index = self.tree_mhs.index(selected)
-        
-        for i, mhs in enumerate(self.data_mahasiswa):
-            if i != index and mhs.nim == nim:
-                messagebox.showerror("Error", f"NIM {nim} sudah terdaftar pada data lain!")
-                return
+        mhs = self.repo.cari_id(int(selected[0]))
+        if nim != mhs.nim and nim in self.repo:
+            messagebox.showerror("Error", f"NIM {nim} sudah terdaftar pada data lain!")
+            return
 
-        mhs = self.data_mahasiswa[index]
-        mhs.nama = nama
-        mhs.nim = nim
+        self.perintah.edit_mahasiswa(mhs, nama, nim)
 
-        self.update_mahasiswa_table()
+        self.update_baris_mahasiswa(mhs)
         self.clear_input_mhs()
         self.mahasiswa_terpilih = None
-        messagebox.showinfo("Sukses", "Data Mahasiswa berhasil diedit!")
+        self.tampilkan_status("Data Mahasiswa berhasil diedit!")
 
+    @_diukur
     def hapus_mahasiswa(self):
         """Menghapus data Mahasiswa yang dipilih."""
         selected = self.tree_mhs.selection()
@@ -337,19 +590,20 @@ class App:
 
         if messagebox.askyesno("Konfirmasi Hapus", "Apakah Anda yakin ingin menghapus Mahasiswa ini dan semua nilainya?"):
             # Cari objek Mahasiswa yang benar untuk dihapus
-            index = self.tree_mhs.index(selected)
-            if index < len(self.data_mahasiswa):
-                mhs_dihapus = self.data_mahasiswa[index]
-                if mhs_dihapus == self.mahasiswa_terpilih:
+            mhs_dihapus = self.repo.cari_id(int(selected[0]))
+            if mhs_dihapus is not None:
+                if self.mahasiswa_terpilih and mhs_dihapus.nim == self.mahasiswa_terpilih.nim:
                     self.mahasiswa_terpilih = None
-                del self.data_mahasiswa[index]
+                self.perintah.hapus_mahasiswa(mhs_dihapus)
+                self.hapus_baris_mahasiswa(selected[0])
+                self.update_statistik_table()
                 
-            self.update_mahasiswa_table()
             self.clear_input_mhs()
             self.update_matkul_table() # Kosongkan tabel nilai
-            messagebox.showinfo("Sukses", "Mahasiswa berhasil dihapus!")
+            self.tampilkan_status("Mahasiswa berhasil dihapus! (Ctrl+Z untuk membatalkan)")
             
     # CRUD NILAI MATA KULIAH
+    @_diukur
     def tambah_edit_nilai(self):
         """Menambahkan atau mengedit nilai mata kuliah untuk Mahasiswa yang dipilih."""
         if not self.mahasiswa_terpilih:
@@ -358,17 +612,26 @@ class App:
             
         matkul = self.entry_matkul.get().strip()
         nilai = self.entry_nilai.get().strip()
+        semester = self.entry_semester.get().strip()
+        sks = self.entry_sks.get().strip()
         
-        if not self.validasi_input("", "", matkul, nilai): return
+        if not self.validasi_input("", "", matkul, nilai, semester, sks): return
         
         nilai_int = int(nilai)
-        self.mahasiswa_terpilih.tambah_nilai_matkul(matkul, nilai_int)
+        try:
+            self.perintah.simpan_nilai(self.mahasiswa_terpilih, matkul, nilai_int,
+                                       int(semester) if semester else None, int(sks) if sks else None)
+        except KeyError:
+            self.mahasiswa_terpilih_hilang()
+            return
         
-        self.update_mahasiswa_table() 
+        self.update_baris_mahasiswa(self.mahasiswa_terpilih)
         self.update_matkul_table(self.mahasiswa_terpilih)
+        self.update_statistik_table()
         self.clear_input_matkul()
-        messagebox.showinfo("Sukses", f"Nilai {matkul} berhasil ditambahkan/diperbarui untuk {self.mahasiswa_terpilih.nama}!")
+        self.tampilkan_status(f"Nilai {matkul} berhasil ditambahkan/diperbarui untuk {self.mahasiswa_terpilih.nama}!")
 
+    @_diukur
     def hapus_nilai(self):
         """Menghapus nilai mata kuliah yang dipilih dari Mahasiswa yang aktif."""
         if not self.mahasiswa_terpilih:
@@ -380,45 +643,511 @@ class App:
             messagebox.showwarning("Peringatan", "Pilih baris Mata Kuliah yang ingin dihapus!")
             return
             
-        # Mengambil nama mata kuliah dari baris yang dipilih
-        matkul_nama = self.tree_matkul.item(selected_matkul, 'values')[0]
+        # iid baris tabel nilai adalah "semester|mata kuliah"
+        semester, matkul_nama = selected_matkul[0].split("|", 1)
         
-        if messagebox.askyesno("Konfirmasi Hapus", f"Hapus nilai {matkul_nama} dari {self.mahasiswa_terpilih.nama}?"):
-            if matkul_nama in self.mahasiswa_terpilih.matkul_nilai:
-                del self.mahasiswa_terpilih.matkul_nilai[matkul_nama]
-                
-                self.update_mahasiswa_table() 
+        if messagebox.askyesno("Konfirmasi Hapus",
+                               f"Hapus nilai {matkul_nama} semester {semester} dari {self.mahasiswa_terpilih.nama}?"):
+            try:
+                dihapus = self.perintah.hapus_nilai(self.mahasiswa_terpilih, matkul_nama, int(semester))
+            except KeyError:
+                self.mahasiswa_terpilih_hilang()
+                return
+            if dihapus:
+                self.update_baris_mahasiswa(self.mahasiswa_terpilih)
                 self.update_matkul_table(self.mahasiswa_terpilih)
+                self.update_statistik_table()
                 self.clear_input_matkul()
-                messagebox.showinfo("Sukses", "Nilai berhasil dihapus!")
+                self.tampilkan_status("Nilai berhasil dihapus! (Ctrl+Z untuk membatalkan)")
+
+    def mahasiswa_terpilih_hilang(self):
+        """Mahasiswa terpilih sudah dihapus/dibuat ulang (mis. oleh undo atau tugas latar belakang)."""
+        messagebox.showwarning("Peringatan", "Mahasiswa terpilih sudah tidak terdaftar; tampilan dimuat ulang.")
+        self.segarkan_tampilan()
+
+    # TUGAS LATAR BELAKANG
+    def mulai_tugas(self, nama: str, fungsi, saat_selesai, saat_sebagian=None) -> bool:
+        """Menjalankan fungsi(tugas) di latar belakang; hanya satu tugas aktif pada satu waktu."""
+        if self.tugas_aktif is not None:
+            messagebox.showwarning("Peringatan", f"Tugas '{self.tugas_aktif.nama}' masih berjalan!")
+            return False
 
+        def selesai(hasil):
+            self._akhiri_tugas(f"{nama} selesai")
+            saat_selesai(hasil)
+
+        def batal(_):
+            self._akhiri_tugas(f"{nama} dibatalkan")
+
+        def error(e: Exception):
+            self._akhiri_tugas(f"{nama} gagal")
+            messagebox.showerror("Error", f"{nama} gagal: {e}")
+
+        self.progress_impor["value"] = 0
+        self.label_tugas.config(text=f"{nama}...")
+        self.tugas_aktif = self.penjadwal.jalankan(
+            nama, fungsi, saat_progres=self._progres_tugas, saat_sebagian=saat_sebagian,
+            saat_selesai=selesai, saat_batal=batal, saat_error=error)
+        return True
+
+    def muat_statistik(self):
+        """Membangun statistik kohort pertama kali di thread pekerja (pada SQLite: GROUP BY atas seluruh nilai),
+        agar jendela tidak membeku saat dibuka; sesudahnya tabel statistik diperbarui inkremental."""
+        def selesai(_):
+            self._statistik_siap = True
+            self.update_statistik_table()
+
+        self.penjadwal.jalankan("Statistik", lambda tugas: self.repo.statistik_matkul(), saat_selesai=selesai,
+                                saat_error=lambda e: self.tampilkan_status(f"Statistik gagal dimuat: {e}"))
+
+    def _progres_tugas(self, fraksi: float, pesan: str):
+        self.progress_impor["value"] = 100 * fraksi
+        if pesan:
+            self.label_tugas.config(text=pesan)
+
+    def _akhiri_tugas(self, status: str):
+        """Dipanggil di thread Tk saat tugas berakhir: sinkronkan UI dengan data terbaru."""
+        self.tugas_aktif = None
+        self.label_tugas.config(text=status)
+        self.segarkan_tampilan()
+
+    @_diukur
+    def segarkan_tampilan(self):
+        """Menyinkronkan semua tabel dengan repositori setelah perubahan massal (tugas, undo/redo)."""
+        if self._urutan_tampil is not None:
+            self.terapkan_filter()   # id hasil pencarian bisa berubah (mis. Mahasiswa dipulihkan)
+        else:
+            self.update_mahasiswa_table()
+        self.update_statistik_table()
+        if self.mahasiswa_terpilih:
+            # Objek terpilih mungkin basi (mis. repositori SQLite, atau dibuat ulang oleh undo), ambil ulang
+            self.mahasiswa_terpilih = self.repo.cari(self.mahasiswa_terpilih.nim)
+        self.update_matkul_table(self.mahasiswa_terpilih)
+
+    def batal_tugas(self):
+        """Meminta tugas yang sedang berjalan berhenti di batas batch berikutnya."""
+        if self.tugas_aktif is None:
+            messagebox.showwarning("Peringatan", "Tidak ada tugas yang sedang berjalan!")
+            return
+        self.tugas_aktif.batal()
+        self.label_tugas.config(text="Membatalkan...")
+
+    # IMPOR MASSAL
+    def impor_csv(self):
+        """Mengimpor berkas CSV besar di latar belakang; tabel diperbarui sekali di akhir.
+
+        Batch yang sudah tersimpan tetap ada jika impor dibatalkan. Seluruh impor (juga yang dibatalkan)
+        menjadi satu unit undo.
+        """
+        path = filedialog.askopenfilename(title="Pilih berkas CSV",
+                                          filetypes=[("CSV", "*.csv"), ("Semua berkas", "*.*")])
+        if not path: return
+
+        def kerja(tugas: Tugas) -> LaporanImpor:
+            def progres(laporan: LaporanImpor):
+                tugas.progres(laporan.byte_terbaca / laporan.byte_total if laporan.byte_total else 1.0,
+                              f"{laporan.baris_diproses} baris")
+                tugas.cek_batal()
+            # Batch kecil: kunci repositori cepat dilepas sehingga CRUD di GUI tetap responsif
+            with self.perintah.batch(f"Impor {os.path.basename(path)}"):
+                return impor_csv(self.perintah, path, ukuran_batch=1_000, progres=progres)
+
+        def selesai(laporan: LaporanImpor):
+            # Hanya laporan dengan baris gagal yang perlu perhatian (dialog); selebihnya cukup di bilah status
+            if laporan.jumlah_error:
+                messagebox.showwarning("Impor Selesai", laporan.ringkasan())
+            else:
+                self.tampilkan_status(laporan.ringkasan())
+
+        self.mulai_tugas("Impor CSV", kerja, selesai)
+
+    # EKSPOR
+    def ekspor(self):
+        """Mengekspor seluruh Mahasiswa di latar belakang; format mengikuti ekstensi berkas yang dipilih."""
+        path = filedialog.asksaveasfilename(title="Simpan ekspor", defaultextension=".csv",
+                                            filetypes=[("CSV (roster)", "*.csv"),
+                                                       ("JSON Lines (roster + transkrip)", "*.jsonl"),
+                                                       ("Teks (transkrip)", "*.txt")])
+        if not path: return
+
+        def kerja(tugas: Tugas) -> int:
+            def progres(jumlah: int, total: int):
+                tugas.progres(jumlah / total if total else 1.0, f"{jumlah} Mahasiswa")
+                tugas.cek_batal()
+            return ekspor(self.repo, path, format_dari_path(path), progres=progres)
+
+        self.mulai_tugas("Ekspor", kerja, lambda jumlah: self.tampilkan_status(f"{jumlah} Mahasiswa diekspor ke {path}"))
+
+    # UNDO/REDO & NOTIFIKASI
+    @_diukur
+    def undo(self, event: tk.Event | None = None):
+        """Membatalkan batch perubahan terakhir (Ctrl+Z)."""
+        self._balik_perubahan(redo=False)
+
+    @_diukur
+    def redo(self, event: tk.Event | None = None):
+        """Menerapkan ulang batch yang terakhir dibatalkan (Ctrl+Y / Ctrl+Shift+Z)."""
+        self._balik_perubahan(redo=True)
+
+    def _balik_perubahan(self, redo: bool):
+        judul = "Redo" if redo else "Undo"
+        nama = self.perintah.label_redo if redo else self.perintah.label_undo
+        if nama is None:
+            self.tampilkan_status(f"Tidak ada yang bisa di-{judul.lower()}.")
+            return
+        if self.tugas_aktif is not None:
+            self.tampilkan_status(f"Tunggu tugas '{self.tugas_aktif.nama}' selesai sebelum {judul}.")
+            return
+        aksi = self.perintah.redo if redo else self.perintah.undo
+        if self.perintah.ukuran_undo(redo) <= AMBANG_UNDO_LATAR:
+            aksi()
+            self.segarkan_tampilan()
+            self.tampilkan_status(f"{judul}: {nama}")
+            return
+
+        # Batch besar (mis. impor) dibalik di latar belakang, per kelompok langkah
+        def kerja(tugas: Tugas):
+            return aksi(progres=lambda selesai, total: tugas.progres(selesai / total, f"{selesai} langkah"))
+
+        self.mulai_tugas(judul, kerja, lambda _: self.tampilkan_status(f"{judul}: {nama}"))
+
+    def tampilkan_status(self, pesan: str):
+        """Notifikasi non-modal di bilah status, hilang sendiri setelah DURASI_STATUS_MS."""
+        self.label_status.config(text=pesan.replace("\n", "  "))
+        if self._after_status is not None:
+            self.root.after_cancel(self._after_status)
+        self._after_status = self.root.after(DURASI_STATUS_MS, self._hapus_status)
+
+    def _hapus_status(self):
+        self._after_status = None
+        self.label_status.config(text="")
+
+    # PANEL PROFIL (debug)
+    def buka_panel_profil(self, event: tk.Event | None = None):
+        """Jendela debug berisi penghitung waktu per operasi, diperbarui setiap JEDA_PANEL_PROFIL_MS."""
+        if self.profil is None: return
+        if self._panel_profil is not None and self._panel_profil.winfo_exists():
+            self._panel_profil.lift()
+            return
+        panel = tk.Toplevel(self.root)
+        panel.title("Profil Waktu")
+        panel.config(bg=BACKGROUND_COLOR)
+
+        self.tree_profil = ttk.Treeview(panel, columns=("operasi", "jumlah", "rata", "p95", "maks", "total"),
+                                        show="headings", height=15)
+        for col, text, width, anchor in [("operasi", "Operasi", 170, "w"),
+                                         ("jumlah", "N", 60, "center"),
+                                         ("rata", "Rata (ms)", 75, "center"),
+                                         ("p95", "p95 (ms)", 75, "center"),
+                                         ("maks", "Maks (ms)", 75, "center"),
+                                         ("total", "Total (ms)", 85, "center")]:
+            self.tree_profil.heading(col, text=text)
+            self.tree_profil.column(col, width=width, anchor=anchor)
+        self.tree_profil.pack(fill="both", expand=True, padx=10, pady=10)
+
+        btn_frame_profil = tk.Frame(panel, bg=BACKGROUND_COLOR)
+        btn_frame_profil.pack(pady=(0, 10))
+        self.make_button(btn_frame_profil, "💾 Simpan JSON", self.simpan_profil, 0, width=15)
+        self.make_button(btn_frame_profil, "🔄 Reset", self.profil.reset, 1)
+
+        self._panel_profil = panel
+        self._segarkan_panel_profil()
+
+    def _segarkan_panel_profil(self):
+        if self._panel_profil is None or not self._panel_profil.winfo_exists():
+            self._panel_profil = None
+            return
+        self.tree_profil.delete(*self.tree_profil.get_children())
+        for nama, s in self.profil.ringkasan().items():
+            self.tree_profil.insert("", tk.END, values=(nama, s["jumlah"], f"{s['rata_ms']:.2f}", f"{s['p95_ms']:.2f}",
+                                                        f"{s['maks_ms']:.2f}", f"{s['total_ms']:.1f}"))
+        self.root.after(JEDA_PANEL_PROFIL_MS, self._segarkan_panel_profil)
+
+    def simpan_profil(self, path: str | None = None) -> str | None:
+        """Menyimpan penghitung waktu ke JSON (berkas --profil, atau dipilih lewat dialog)."""
+        if self.profil is None: return None
+        path = path or self.profil.path or filedialog.asksaveasfilename(
+            title="Simpan profil waktu", defaultextension=".json", filetypes=[("JSON", "*.json")])
+        if not path: return None
+        self.profil.simpan_json(path, jumlah_mahasiswa=len(self.repo), virtual=self.virtual)
+        self.tampilkan_status(f"Profil waktu disimpan ke {path}")
+        return path
+
+    def hitung_ulang(self):
+        """Menghitung ulang rata-rata dan IPK seluruh Mahasiswa di latar belakang, per potongan."""
+        ukuran_potongan = 1_000
+
+        def kerja(tugas: Tugas) -> int:
+            # Paging per id baris: CRUD yang berjalan bersamaan tidak membuat Mahasiswa terlewat
+            id_terakhir, jumlah = -1, 0
+            total = len(self.repo)
+            while True:
+                tugas.cek_batal()
+                baris = self.repo.hitung_ulang_setelah(id_terakhir, ukuran_potongan)
+                if not baris:
+                    return jumlah
+                tugas.kirim(baris)
+                id_terakhir = baris[-1][0]
+                jumlah += len(baris)
+                tugas.progres(min(1.0, jumlah / total) if total else 1.0, f"{jumlah} Mahasiswa")
+
+        def sebagian(baris: list[tuple]):
+            if not self.virtual and self._urutan_tampil is None and self._kolom_urut is None:
+                for b in baris:
+                    self.tampilkan_baris_mahasiswa(*b)
+
+        self.mulai_tugas("Hitung Ulang", kerja, lambda jumlah: self.update_mahasiswa_table(), saat_sebagian=sebagian)
+
+    @_diukur
+    def update_baris_mahasiswa(self, m: Mahasiswa):
+        """Menyisipkan atau memperbarui baris milik satu Mahasiswa."""
+        if self._urutan_tampil is not None:
+            self.terapkan_filter()   # data berubah: cocok/tidaknya baris dengan filter bisa ikut berubah
+            return
+        if self.virtual:
+            self.render_virtual(muat_ulang=True)
+            return
+        with self.repo.kunci:   # Hitung Ulang di latar belakang bisa sedang memasang ulang array objek ini
+            id_baris = self.repo.id_dari(m.nim)
+            rata, ipk = m.hitung_rata_rata(), m.hitung_ipk()
+        self.tampilkan_baris_mahasiswa(id_baris, m.nama, m.nim, rata, ipk)
+        if self._kolom_urut is not None:
+            # Hanya baris ini yang berpindah; detach dulu agar posisi dihitung tanpa baris itu sendiri
+            self.tree_mhs.detach(str(id_baris))
+            self.tree_mhs.move(str(id_baris), "", self.repo.posisi_urut(id_baris, self._kolom_urut, self._urut_menurun))
+
+    def tampilkan_baris_mahasiswa(self, id_baris: int, nama: str, nim: str, rata: float, ipk: float):
+        """Menyisipkan atau memperbarui satu baris tabel; baris yang tidak berubah tidak disentuh."""
+        iid = str(id_baris)
+        values = (nama, nim, f"{rata:.2f}", f"{ipk:.2f}")
+        lama = self._baris_mhs.get(iid)
+        if lama is None:
+            self.tree_mhs.insert("", tk.END, iid=iid, values=values)
+        elif lama != values:
+            self.tree_mhs.item(iid, values=values)
+        self._baris_mhs[iid] = values
+
+    @_diukur
+    def hapus_baris_mahasiswa(self, iid: str):
+        """Menghapus satu baris dari tabel Mahasiswa."""
+        if self._urutan_tampil is not None:
+            self.terapkan_filter()
+            return
+        if self.virtual:
+            self.render_virtual(muat_ulang=True)
+            return
+        if self._baris_mhs.pop(iid, None) is not None:
+            self.tree_mhs.delete(iid)
+
+    @_diukur
     def update_mahasiswa_table(self):
-        """Memperbarui tampilan tabel Mahasiswa."""
-        for item in self.tree_mhs.get_children(): 
-            self.tree_mhs.delete(item)
-        for m in self.data_mahasiswa:
-            rata = m.hitung_rata_rata()
-            ipk = m.hitung_ipk() 
-            self.tree_mhs.insert("", tk.END, values=(m.nama, m.nim, f"{rata:.2f}", f"{ipk:.2f}"))
+        """Menyinkronkan tabel Mahasiswa dengan data: hanya baris yang berubah yang diperbarui."""
+        if not self.virtual and len(self.repo) >= AMBANG_TABEL_VIRTUAL:
+            self.aktifkan_virtual()
+        if self.virtual:
+            self.render_virtual(muat_ulang=True)
+            return
+        if self._urutan_tampil is not None:
+            sumber = self.repo.ringkasan_id(self._urutan_tampil)
+        elif self._kolom_urut is not None:
+            sumber = self.repo.ringkasan_id(self.repo.id_urut(self._kolom_urut, self._urut_menurun))
+        else:
+            sumber = self.repo.ringkasan()
+        urutan = []
+        for baris in sumber:
+            self.tampilkan_baris_mahasiswa(*baris)
+            urutan.append(str(baris[0]))
+        iid_aktif = set(urutan)
+        for iid in [iid for iid in self._baris_mhs if iid not in iid_aktif]:
+            self.tree_mhs.delete(iid)
+            del self._baris_mhs[iid]
+        # Baris yang muncul kembali (mis. filter dihapus) disisipkan di akhir, dan pengurutan bisa berganti;
+        # kembalikan ke urutan yang benar
+        if list(self.tree_mhs.get_children()) != urutan:
+            for posisi, iid in enumerate(urutan):
+                self.tree_mhs.move(iid, "", posisi)
+
+    # PENCARIAN
+    def jadwalkan_cari(self, *_):
+        """Dipanggil setiap ketikan; filter baru diterapkan setelah pengguna berhenti mengetik."""
+        if self._after_cari is not None:
+            self.root.after_cancel(self._after_cari)
+        self._after_cari = self.root.after(JEDA_CARI_MS, self.terapkan_filter)
+
+    @_diukur
+    def terapkan_filter(self):
+        """Menjalankan pencarian lewat indeks repositori lalu memperbarui tabel."""
+        self._after_cari = None
+        teks = self.var_cari.get().strip()
+        if not teks:
+            self._urutan_tampil = None
+        else:
+            cocok = self.repo.cari_teks(teks)
+            if self._kolom_urut is not None:
+                himpunan = set(cocok)
+                cocok = [i for i in self.repo.id_urut(self._kolom_urut, self._urut_menurun) if i in himpunan]
+            self._urutan_tampil = cocok
+        self._virtual_awal = 0
+        self.update_mahasiswa_table()
+
+    # PENGURUTAN
+    @_diukur
+    def urutkan_kolom(self, kolom: str):
+        """Klik judul kolom: naik -> turun -> kembali ke urutan input."""
+        if self._kolom_urut != kolom:
+            self._kolom_urut, self._urut_menurun = kolom, False
+        elif not self._urut_menurun:
+            self._urut_menurun = True
+        else:
+            self._kolom_urut = None
+        for col, text in self._judul_kolom_mhs.items():
+            if col == self._kolom_urut:
+                text += " ▼" if self._urut_menurun else " ▲"
+            self.tree_mhs.heading(col, text=text)
+        self.terapkan_filter()
+
+    # TABEL VIRTUAL
+    def aktifkan_virtual(self):
+        """Beralih ke mode virtual saat data melewati ambang (mis. setelah impor massal)."""
+        self.tree_mhs.delete(*self._baris_mhs)
+        self._baris_mhs = {}
+        self.virtual = True
+        self.tree_mhs.configure(yscrollcommand="")
+        self.vsb_mhs.configure(command=self.gulir_virtual)
+        for event in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree_mhs.bind(event, self.roda_virtual)
+
+    @_diukur
+    def render_virtual(self, muat_ulang: bool = False):
+        """Mengisi tree_mhs hanya dengan baris pada jendela terlihat, diambil dari cache blok atau repositori."""
+        if muat_ulang:
+            self._virtual_total = len(self.repo) if self._urutan_tampil is None else len(self._urutan_tampil)
+            self._blok_baris = []
+        self._virtual_awal = max(0, min(self._virtual_awal, self._virtual_total - TINGGI_TABEL_MHS))
+        awal, akhir = self._virtual_awal, min(self._virtual_awal + TINGGI_TABEL_MHS, self._virtual_total)
+
+        blok_akhir = self._blok_awal + len(self._blok_baris)
+        if awal < self._blok_awal or akhir > blok_akhir:
+            self._blok_awal = max(0, awal - BUFFER_VIRTUAL)
+            jumlah = TINGGI_TABEL_MHS + 2 * BUFFER_VIRTUAL
+            if self._urutan_tampil is not None:
+                self._blok_baris = self.repo.ringkasan_id(self._urutan_tampil[self._blok_awal:self._blok_awal + jumlah])
+            elif self._kolom_urut is not None:
+                self._blok_baris = self.repo.ringkasan_id(
+                    self.repo.id_urut(self._kolom_urut, self._urut_menurun, self._blok_awal, jumlah))
+            else:
+                self._blok_baris = self.repo.ringkasan_rentang(self._blok_awal, jumlah)
+        terlihat = self._blok_baris[awal - self._blok_awal:akhir - self._blok_awal]
+
+        baru: Dict[str, tuple] = {}
+        for id_baris, nama, nim, rata, ipk in terlihat:
+            baru[str(id_baris)] = (nama, nim, f"{rata:.2f}", f"{ipk:.2f}")
+        for iid in [iid for iid in self._baris_mhs if iid not in baru]:
+            self.tree_mhs.delete(iid)
+            del self._baris_mhs[iid]
+        for posisi, (iid, values) in enumerate(baru.items()):
+            lama = self._baris_mhs.get(iid)
+            if lama is None:
+                self.tree_mhs.insert("", posisi, iid=iid, values=values)
+            else:
+                if self.tree_mhs.index(iid) != posisi:
+                    self.tree_mhs.move(iid, "", posisi)
+                if lama != values:
+                    self.tree_mhs.item(iid, values=values)
+        self._baris_mhs = baru
+
+        if self._iid_terpilih in baru:
+            self.tree_mhs.selection_set(self._iid_terpilih)
+        if self._virtual_total:
+            self.vsb_mhs.set(awal / self._virtual_total, akhir / self._virtual_total)
+        else:
+            self.vsb_mhs.set(0.0, 1.0)
+
+    def gulir_virtual(self, aksi: str, jumlah: str, satuan: str | None = None):
+        """Perintah scrollbar virtual: ("moveto", fraksi) atau ("scroll", n, "units"/"pages")."""
+        if aksi == "moveto":
+            self._virtual_awal = int(float(jumlah) * self._virtual_total)
+        elif aksi == "scroll":
+            langkah = TINGGI_TABEL_MHS if satuan == "pages" else 1
+            self._virtual_awal += int(jumlah) * langkah
+        self.render_virtual()
 
+    def roda_virtual(self, event: tk.Event):
+        """Menggulir tabel virtual dengan roda mouse (Windows/macOS: delta, X11: Button-4/5)."""
+        if getattr(event, "num", None) == 4 or getattr(event, "delta", 0) > 0:
+            self.gulir_virtual("scroll", "-3", "units")
+        else:
+            self.gulir_virtual("scroll", "3", "units")
+        return "break"
+
+    @_diukur
     def update_matkul_table(self, mhs: Mahasiswa | None = None):
-        """Memperbarui tampilan tabel Nilai Mata Kuliah."""
-        for item in self.tree_matkul.get_children(): 
-            self.tree_matkul.delete(item)
+        """Memperbarui tampilan tabel Nilai Mata Kuliah secara inkremental (iid = "semester|mata kuliah")."""
+        if mhs is not self._matkul_milik:
+            # Ganti Mahasiswa: urutan baris harus mengikuti data Mahasiswa baru, jadi bangun ulang
+            for iid in self._baris_matkul:
+                self.tree_matkul.delete(iid)
+            self._baris_matkul.clear()
+            self._matkul_milik = mhs
+
+        riwayat, transkrip, ipk = [], [], 0.0
+        if mhs:
+            with self.repo.kunci:   # lihat update_baris_mahasiswa
+                riwayat, transkrip, ipk = mhs.riwayat_nilai(), mhs.transkrip_semester(), mhs.hitung_ipk()
+        target: Dict[str, tuple] = {}
+        for values in baris_transkrip(riwayat):
+            target[f"{values[0]}|{values[1]}"] = values
 
-        if mhs and mhs.matkul_nilai:
-            for matkul, nilai in mhs.matkul_nilai.items():
-                nilai_huruf, _ = mhs.konversi_nilai_ke_huruf_dan_bobot(nilai) 
-                self.tree_matkul.insert("", tk.END, values=(matkul, nilai, nilai_huruf))
+        for iid in [iid for iid in self._baris_matkul if iid not in target]:
+            self.tree_matkul.delete(iid)
+            del self._baris_matkul[iid]
+        for posisi, (iid, values) in enumerate(target.items()):
+            lama = self._baris_matkul.get(iid)
+            if lama is None:
+                self.tree_matkul.insert("", posisi, iid=iid, values=values)
+            elif lama != values:
+                self.tree_matkul.item(iid, values=values)
+            self._baris_matkul[iid] = values
+
+        if transkrip:
+            ips = "  ".join(f"S{semester}: {ips:.2f}" for semester, _, ips, _, _ in transkrip)
+            self.label_transkrip.config(text=f"IPS {ips}\nIPK {ipk:.2f} ({transkrip[-1][3]} SKS)")
+        else:
+            self.label_transkrip.config(text="")
 
+    @_diukur
+    def update_statistik_table(self):
+        """Menyinkronkan tabel statistik dengan agregat repositori (iid = nama mata kuliah)."""
+        if not self._statistik_siap:
+            return   # muat_statistik() mengisi tabel begitu pembangunan pertama selesai
+        target: Dict[str, tuple] = {}
+        for matkul, stat in self.repo.statistik_matkul().items():
+            distribusi = " ".join(f"{huruf}:{banyak}" for huruf, banyak in stat["distribusi"].items() if banyak)
+            target[matkul] = (matkul, stat["jumlah"], f"{stat['rata']:.2f}", f"{stat['median']:.1f}",
+                              f"{stat['simpangan_baku']:.2f}", f"{stat['lulus']:.0%}", distribusi)
+
+        for iid in [iid for iid in self._baris_statistik if iid not in target]:
+            self.tree_statistik.delete(iid)
+            del self._baris_statistik[iid]
+        for posisi, (iid, values) in enumerate(target.items()):
+            lama = self._baris_statistik.get(iid)
+            if lama is None:
+                self.tree_statistik.insert("", posisi, iid=iid, values=values)
+            elif lama != values:
+                self.tree_statistik.item(iid, values=values)
+            self._baris_statistik[iid] = values
+
+    @_diukur
     def pilih_mahasiswa(self, event: tk.Event):
         """Mengaktifkan Mahasiswa yang dipilih dan memuat datanya ke input."""
         selected = self.tree_mhs.selection()
         if not selected: return
         
         try:
-            index = self.tree_mhs.index(selected)
-            self.mahasiswa_terpilih = self.data_mahasiswa[index]
+            # iid = id baris stabil, jadi tetap benar walau tree_mhs.index() bukan posisi di data
+            self.mahasiswa_terpilih = self.repo.cari_id(int(selected[0]))
+            if self.mahasiswa_terpilih is None: raise IndexError(selected[0])
+            self._iid_terpilih = selected[0]
 
             self.clear_input_mhs()
             self.entry_nama.insert(0, self.mahasiswa_terpilih.nama)
@@ -437,10 +1166,12 @@ class App:
         if not selected: return
         
         try:
-            matkul_nama, nilai_akhir_str, _ = self.tree_matkul.item(selected, 'values')
+            semester, matkul_nama, sks, nilai_akhir_str, _ = self.tree_matkul.item(selected, 'values')
             self.clear_input_matkul()
             self.entry_matkul.insert(0, matkul_nama)
             self.entry_nilai.insert(0, nilai_akhir_str)
+            self.entry_semester.insert(0, semester)
+            self.entry_sks.insert(0, sks)
         except Exception:
             self.clear_input_matkul()
 
@@ -450,12 +1181,33 @@ class App:
         self.entry_nim.delete(0, tk.END)
         
     def clear_input_matkul(self):
-        """Mengosongkan input Mata Kuliah dan Nilai."""
+        """Mengosongkan input Mata Kuliah, Nilai, Semester, dan SKS."""
         self.entry_matkul.delete(0, tk.END)
         self.entry_nilai.delete(0, tk.END)
+        self.entry_semester.delete(0, tk.END)
+        self.entry_sks.delete(0, tk.END)
+
+def main(argv: list[str] | None = None):
+    """Membuka GUI. Operasi tanpa GUI (CRUD, laporan, impor/ekspor) tersedia lewat `python -m akademik`."""
+    parser = argparse.ArgumentParser(description="Aplikasi Akademik Sederhana")
+    tambah_opsi_data(parser)
+    parser.add_argument("--profil", metavar="BERKAS.json", default=os.environ.get("AKADEMIK_PROFIL") or None,
+                        help="catat waktu handler CRUD dan refresh tabel, simpan ke BERKAS saat keluar "
+                             "(bawaan: $AKADEMIK_PROFIL); panel debug: F12")
+    args = parser.parse_args(argv)
+
+    repo = buat_repositori(args.backend, args.data)
+    try:
+        root = tk.Tk()
+        app = App(root, repo, profil=ProfilWaktu(args.profil) if args.profil else None)
+        root.mainloop()
+        app.penjadwal.tutup()
+        if app.profil is not None:
+            # Jendela sudah ditutup: simpan langsung tanpa notifikasi bilah status
+            app.profil.simpan_json(jumlah_mahasiswa=len(repo), virtual=app.virtual)
+    finally:
+        repo.tutup()
 
 # MAIN PROGRAM
 if __name__ == "__main__":
-    root = tk.Tk()
-    app = App(root)
-    root.mainloop()
\ No newline at end of file
+    main()
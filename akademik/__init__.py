@@ -0,0 +1,11 @@
+"""Inti aplikasi akademik tanpa GUI. Antarmuka: `Data.py` (GUI tkinter) dan `python -m akademik` (CLI)."""
+from akademik.inti import (
+    BACKEND_DATA, BATAS_LANGKAH_UNDO, BATAS_NILAI, BATAS_UNDO, FORMAT_EKSPOR, KATALOG_MATKUL, KOLOM_EKSPOR_CSV,
+    LOKASI_DATA, MAKS_SEMESTER, MAKS_SKS, NILAI_LULUS, SEMESTER_BAWAAN, SKS_BAWAAN, TABEL_HURUF_BOBOT,
+    UKURAN_BUFFER_EKSPOR,
+    BatchPerintah, DaftarMahasiswa, IndeksPencarian, KatalogMatkul, LaporanImpor, LogPerintah, Mahasiswa,
+    NilaiMatkul, RepositoriJurnal, RepositoriMemori, RepositoriSQLite, StatistikKohort, StatistikMatkul,
+    UrutanMahasiswa,
+    baris_transkrip, buat_repositori, cek_input, ekspor, format_dari_path, format_transkrip, impor_csv,
+    konversi_nilai_batch,
+)
@@ -0,0 +1,7 @@
+"""`python -m akademik <perintah>`, lihat akademik.cli."""
+import sys
+
+from akademik.cli import main
+
+if __name__ == "__main__":   # penjaga juga diperlukan oleh process pool ekspor (spawn)
+    sys.exit(main())
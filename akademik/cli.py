@@ -0,0 +1,187 @@
+"""Antarmuka baris perintah tanpa GUI: `python -m akademik <perintah> ...`.
+
+Perintah bekerja pada data persisten yang sama dengan GUI (--backend/--data, bawaan dari
+AKADEMIK_BACKEND/AKADEMIK_DATA) dan memakai aturan validasi yang sama dengan form input.
+"""
+import argparse
+import sys
+
+from akademik.inti import (BACKEND_DATA, FORMAT_EKSPOR, LOKASI_DATA, UrutanMahasiswa, buat_repositori,
+                           cek_input, ekspor, format_dari_path, format_transkrip, impor_csv)
+
+class ErrorPerintah(Exception):
+    """Input atau data tidak valid; dicetak ke stderr tanpa traceback."""
+
+def _validasi(*input_):
+    pesan = cek_input(*input_)
+    if pesan:
+        raise ErrorPerintah(pesan)
+
+def _cari(repo, nim: str):
+    mhs = repo.cari(nim)
+    if mhs is None:
+        raise ErrorPerintah(f"NIM {nim} tidak ditemukan!")
+    return mhs
+
+def _cetak_ringkasan(baris: list[tuple]):
+    print(f"{'NIM':<12} {'Nama':<30} {'Rata':>6} {'IPK':>5}")
+    for _, nama, nim, rata, ipk in baris:
+        print(f"{nim:<12} {nama:<30} {rata:>6.2f} {ipk:>5.2f}")
+
+# PERINTAH
+def perintah_tambah(repo, args):
+    nama, nim = args.nama.strip(), args.nim.strip()
+    _validasi(nama, nim)
+    if not nama or not nim:
+        raise ErrorPerintah("Nama dan NIM harus diisi!")
+    if nim in repo:
+        raise ErrorPerintah(f"NIM {nim} sudah terdaftar!")
+    repo.tambah_mahasiswa(nama, nim)
+    print("Mahasiswa berhasil ditambahkan!")
+
+def perintah_edit(repo, args):
+    mhs = _cari(repo, args.nim)
+    nama = mhs.nama if args.nama is None else args.nama.strip()
+    nim = mhs.nim if args.nim_baru is None else args.nim_baru.strip()
+    _validasi(nama, nim)
+    if not nama or not nim:
+        raise ErrorPerintah("Nama dan NIM harus diisi!")
+    if nim != mhs.nim and nim in repo:
+        raise ErrorPerintah(f"NIM {nim} sudah terdaftar pada data lain!")
+    repo.edit_mahasiswa(mhs, nama, nim)
+    print("Data Mahasiswa berhasil diedit!")
+
+def perintah_hapus(repo, args):
+    mhs = _cari(repo, args.nim)
+    if args.matkul is None:
+        repo.hapus_mahasiswa(mhs)
+        print("Mahasiswa berhasil dihapus!")
+    elif repo.hapus_nilai(mhs, args.matkul, args.semester):
+        print("Nilai berhasil dihapus!")
+    else:
+        raise ErrorPerintah(f"Nilai {args.matkul} tidak ditemukan!")
+
+def perintah_nilai(repo, args):
+    mhs = _cari(repo, args.nim)
+    matkul = args.matkul.strip()
+    _validasi("", "", matkul, args.nilai, args.semester, args.sks)
+    semester, sks = repo.simpan_nilai(mhs, matkul, int(args.nilai), int(args.semester) if args.semester else None,
+                                      int(args.sks) if args.sks else None)
+    print(f"Nilai {matkul} semester {semester} ({sks} SKS) berhasil disimpan untuk {mhs.nama}!")
+
+def perintah_lihat(repo, args):
+    print(format_transkrip(_cari(repo, args.nim).data_ekspor()), end="")
+
+def perintah_cari(repo, args):
+    if args.teks:
+        cocok = repo.cari_teks(args.teks)
+        if args.urut:
+            # Urutan hanya didefinisikan repositori: saring id_urut() dengan hasil pencarian (seperti GUI)
+            himpunan = set(cocok)
+            cocok = [i for i in repo.id_urut(args.urut, args.menurun) if i in himpunan]
+        total = len(cocok)
+        baris = repo.ringkasan_id(cocok[:args.batas])
+    else:
+        total = len(repo)
+        if args.urut:
+            baris = repo.ringkasan_id(repo.id_urut(args.urut, args.menurun, 0, args.batas))
+        else:
+            baris = repo.ringkasan_rentang(0, args.batas)
+    _cetak_ringkasan(baris)
+    print(f"{len(baris)} dari {total} Mahasiswa")
+
+def perintah_laporan(repo, args):
+    print(f"{len(repo)} Mahasiswa")
+    print(f"{'Mata Kuliah':<24} {'Jumlah':>7} {'Rata':>6} {'Median':>6} {'SD':>6} {'Lulus':>5}  Distribusi")
+    for matkul, stat in repo.statistik_matkul().items():
+        distribusi = " ".join(f"{huruf}:{banyak}" for huruf, banyak in stat["distribusi"].items() if banyak)
+        print(f"{matkul:<24} {stat['jumlah']:>7} {stat['rata']:>6.2f} {stat['median']:>6.1f} "
+              f"{stat['simpangan_baku']:>6.2f} {stat['lulus']:>5.0%}  {distribusi}")
+    if args.peringkat:
+        print(f"\n{args.peringkat} IPK tertinggi")
+        _cetak_ringkasan(repo.peringkat(args.peringkat))
+        print(f"\n{args.peringkat} IPK terendah")
+        _cetak_ringkasan(repo.peringkat(args.peringkat, terbawah=True))
+
+def perintah_impor(repo, args):
+    print(impor_csv(repo, args.path).ringkasan())
+
+def perintah_ekspor(repo, args):
+    jumlah = ekspor(repo, args.path, args.format or format_dari_path(args.path), args.pekerja)
+    print(f"{jumlah} Mahasiswa diekspor ke {args.path}")
+
+# PARSER
+def tambah_opsi_data(parser: argparse.ArgumentParser):
+    """Opsi lokasi data yang sama untuk GUI dan CLI."""
+    parser.add_argument("--backend", default=BACKEND_DATA, choices=["memori", "jurnal", "sqlite"])
+    parser.add_argument("--data", default=LOKASI_DATA, help="lokasi data (direktori jurnal/SQLite)")
+
+def buat_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m akademik", description="Aplikasi Akademik Sederhana (tanpa GUI)")
+    tambah_opsi_data(parser)
+    perintah = parser.add_subparsers(dest="perintah", required=True, metavar="perintah")
+
+    p = perintah.add_parser("tambah", help="tambah Mahasiswa")
+    p.add_argument("nim")
+    p.add_argument("nama")
+    p.set_defaults(fungsi=perintah_tambah)
+
+    p = perintah.add_parser("edit", help="ubah nama dan/atau NIM Mahasiswa")
+    p.add_argument("nim")
+    p.add_argument("--nama")
+    p.add_argument("--nim-baru")
+    p.set_defaults(fungsi=perintah_edit)
+
+    p = perintah.add_parser("hapus", help="hapus Mahasiswa, atau satu nilainya jika MATKUL diberikan")
+    p.add_argument("nim")
+    p.add_argument("matkul", nargs="?")
+    p.add_argument("--semester", type=int, help="semester nilai yang dihapus (bawaan: semua percobaan MATKUL)")
+    p.set_defaults(fungsi=perintah_hapus)
+
+    p = perintah.add_parser("nilai", help="tambah/ubah nilai mata kuliah (0-100)")
+    p.add_argument("nim")
+    p.add_argument("matkul")
+    p.add_argument("nilai")
+    p.add_argument("--semester", default="", help="bawaan: percobaan terakhir, atau semester 1")
+    p.add_argument("--sks", default="", help="bawaan: SKS percobaan terakhir, atau 3")
+    p.set_defaults(fungsi=perintah_nilai)
+
+    p = perintah.add_parser("lihat", help="tampilkan transkrip satu Mahasiswa")
+    p.add_argument("nim")
+    p.set_defaults(fungsi=perintah_lihat)
+
+    p = perintah.add_parser("cari", help="cari Mahasiswa (awalan NIM / bagian nama), opsional terurut")
+    p.add_argument("teks", nargs="?", default="")
+    p.add_argument("--urut", choices=list(UrutanMahasiswa.KUNCI))
+    p.add_argument("--menurun", action="store_true")
+    p.add_argument("--batas", type=int, default=50, help="jumlah baris maksimum (bawaan: 50)")
+    p.set_defaults(fungsi=perintah_cari)
+
+    p = perintah.add_parser("laporan", help="statistik per mata kuliah dan peringkat IPK")
+    p.add_argument("--peringkat", type=int, default=10, help="jumlah IPK tertinggi/terendah (0: tidak ditampilkan)")
+    p.set_defaults(fungsi=perintah_laporan)
+
+    p = perintah.add_parser("impor", help="impor CSV (nim, nama, matkul, nilai[, semester, sks])")
+    p.add_argument("path")
+    p.set_defaults(fungsi=perintah_impor)
+
+    p = perintah.add_parser("ekspor", help="ekspor roster/transkrip ke CSV, JSON Lines, atau teks")
+    p.add_argument("path")
+    p.add_argument("--format", choices=sorted(FORMAT_EKSPOR), help="bawaan: menurut ekstensi berkas")
+    p.add_argument("--pekerja", type=int, help="jumlah proses pemformat (bawaan: otomatis)")
+    p.set_defaults(fungsi=perintah_ekspor)
+    return parser
+
+def main(argv: list[str] | None = None) -> int:
+    args = buat_parser().parse_args(argv)
+    try:
+        repo = buat_repositori(args.backend, args.data)
+        try:
+            args.fungsi(repo, args)
+        finally:
+            repo.tutup()
+    except (ErrorPerintah, OSError, ValueError) as e:
+        # OSError/ValueError: berkas impor/ekspor atau data tidak dapat dibaca/ditulis
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 0
@@ -0,0 +1,2001 @@
+"""Inti aplikasi akademik: model Mahasiswa, repositori, validasi, impor/ekspor, dan statistik.
+
+Tidak mengimpor tkinter, jadi bisa dipakai dari skrip batch/CLI di server tanpa tampilan.
+"""
+import base64
+import bisect
+import csv
+import functools
+import gc
+import io
+import json
+import math
+import os
+import sys
+import threading
+from array import array
+from collections import deque
+from collections.abc import MutableMapping
+from contextlib import contextmanager
+from itertools import groupby
+from typing import Dict, Any, Iterable
+
+# Konfigurasi penyimpanan: "memori", "jurnal" (append-only + snapshot), atau "sqlite"
+BACKEND_DATA = os.environ.get("AKADEMIK_BACKEND", "jurnal")
+LOKASI_DATA = os.environ.get("AKADEMIK_DATA", "data_akademik")
+
+# Batas bawah Nilai Akhir untuk setiap Nilai Huruf dan Bobot Skala 4.00 (urut menurun)
+BATAS_NILAI = [(95, "A+", 4.0), (90, "A", 4.0), (85, "AB", 3.5), (75, "B", 3.0),
+               (70, "BC", 2.5), (65, "C", 2.0), (50, "D", 1.0), (0, "E", 0.0)]
+
+# Tabel 101 entri (nilai 0-100) -> (Nilai Huruf, Bobot), dihitung sekali saat modul dimuat
+TABEL_HURUF_BOBOT: tuple[tuple[str, float], ...] = tuple(
+    next((huruf, bobot) for batas, huruf, bobot in BATAS_NILAI if nilai >= batas)
+    for nilai in range(101)
+)
+_BOBOT_PER_NILAI = tuple(bobot for _, bobot in TABEL_HURUF_BOBOT)
+NILAI_LULUS = 65  # batas bawah lulus sebuah mata kuliah (minimal C)
+
+# Riwayat per semester: nilai tanpa semester/SKS dicatat di SEMESTER_BAWAAN dengan SKS_BAWAAN
+SEMESTER_BAWAAN = 1
+SKS_BAWAAN = 3
+MAKS_SEMESTER = 14
+MAKS_SKS = 24
+_MUTU2_PER_NILAI = tuple(int(bobot * 2) for bobot in _BOBOT_PER_NILAI)   # bobot x2, selalu bulat
+
+class KatalogMatkul:
+    """Memetakan nama mata kuliah (di-intern) ke ID bilangan bulat kecil, dipakai bersama semua Mahasiswa."""
+    def __init__(self):
+        self._id_per_nama: Dict[str, int] = {}
+        self._nama_per_id: list[str] = []
+
+    def id_matkul(self, nama: str) -> int:
+        """Mengembalikan ID mata kuliah, mendaftarkannya terlebih dahulu jika belum ada."""
+        id_matkul = self._id_per_nama.get(nama)
+        if id_matkul is None:
+            id_matkul = len(self._nama_per_id)
+            nama = sys.intern(nama)
+            self._id_per_nama[nama] = id_matkul
+            self._nama_per_id.append(nama)
+        return id_matkul
+
+    def cari_id(self, nama: str) -> int | None:
+        """Mengembalikan ID mata kuliah tanpa mendaftarkannya (None jika belum dikenal)."""
+        return self._id_per_nama.get(nama)
+
+    def nama_matkul(self, id_matkul: int) -> str:
+        return self._nama_per_id[id_matkul]
+
+KATALOG_MATKUL = KatalogMatkul()
+
+class NilaiMatkul(MutableMapping):
+    """Tampilan mirip dict {mata kuliah: nilai efektif} di atas penyimpanan array milik seorang Mahasiswa."""
+    __slots__ = ("_mhs",)
+
+    def __init__(self, mhs: "Mahasiswa"):
+        self._mhs = mhs
+
+    def __getitem__(self, matkul: str) -> int:
+        posisi = self._mhs._posisi(matkul)
+        if posisi < 0:
+            raise KeyError(matkul)
+        return self._mhs._nilai[posisi]
+
+    def __setitem__(self, matkul: str, nilai: int):
+        self._mhs.tambah_nilai_matkul(matkul, nilai)
+
+    def __delitem__(self, matkul: str):
+        if not self._mhs.hapus_nilai_matkul(matkul):
+            raise KeyError(matkul)
+
+    def __iter__(self):
+        nama_matkul = KATALOG_MATKUL.nama_matkul
+        return (nama_matkul(id_matkul) for id_matkul in self._mhs._id_matkul)
+
+    def __len__(self) -> int:
+        return len(self._mhs._nilai)
+
+    def __contains__(self, matkul: object) -> bool:
+        return isinstance(matkul, str) and self._mhs._posisi(matkul) >= 0
+
+    def items(self):
+        nama_matkul = KATALOG_MATKUL.nama_matkul
+        return [(nama_matkul(id_matkul), nilai) for id_matkul, nilai in zip(self._mhs._id_matkul, self._mhs._nilai)]
+
+    def values(self):
+        return list(self._mhs._nilai)
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+class Mahasiswa:
+    """Kelas untuk merepresentasikan data seorang Mahasiswa, kini dengan kamus nilai mata kuliah.
+
+    Nilai efektif (percobaan semester terakhir) tiap mata kuliah disimpan ringkas: ID mata kuliah di
+    array('H') dan nilai 0-100 di array('B') yang sejajar, sedangkan `matkul_nilai` tetap tersedia sebagai
+    tampilan mirip dict. Seluruh percobaan, termasuk pengulangan, ada di `_riwayat` (4 entri per percobaan:
+    ID mata kuliah, semester, SKS, nilai). `_per_semester` berisi 4 entri per semester: mutu dan SKS semester
+    itu (untuk IPS) serta prefix sum-nya (untuk IPK). Mutu disimpan x2 (bobot 3.5 -> 7) agar tetap bulat.
+    """
+    __slots__ = ("nama", "nim", "_id_matkul", "_nilai", "_riwayat", "_per_semester", "_total_nilai")
+
+    def __init__(self, nama: str, nim: str):                  #M4
+        self.nama = nama
+        self.nim = nim                                         
+        self._id_matkul = array("H")
+        self._nilai = array("B")
+        self._riwayat = array("H")
+        self._per_semester = array("i")
+        # Total berjalan agar rata-rata tidak dihitung ulang dari awal (IPK dibaca dari prefix sum)
+        self._total_nilai = 0
+
+    @property
+    def matkul_nilai(self) -> NilaiMatkul:
+        """Nilai efektif per mata kuliah sebagai tampilan mirip Dict[str, int]."""
+        return NilaiMatkul(self)
+
+    @classmethod
+    def dari_array(cls, nama: str, nim: str, id_matkul: array, nilai: array,
+                   riwayat: array | None = None, per_semester: array | None = None) -> "Mahasiswa":
+        """Membuat Mahasiswa langsung dari array (untuk memuat snapshot).
+
+        Tanpa riwayat (snapshot lama), setiap nilai dianggap semester 1 dengan SKS_BAWAAN.
+        """
+        mhs = cls.__new__(cls)
+        mhs.nama = nama
+        mhs.nim = nim
+        mhs._id_matkul = id_matkul
+        mhs._nilai = nilai
+        if riwayat is None:
+            mhs._riwayat = array("H")
+            for id_mk, n in zip(id_matkul, nilai):
+                mhs._riwayat.extend((id_mk, SEMESTER_BAWAAN, SKS_BAWAAN, n))
+            mhs.hitung_ulang_total()
+        else:
+            mhs._riwayat = riwayat
+            mhs._per_semester = per_semester
+            mhs._total_nilai = sum(nilai)
+        return mhs
+
+    def _posisi(self, matkul: str) -> int:
+        """Posisi mata kuliah di array nilai efektif, atau -1 jika belum ada."""
+        id_matkul = KATALOG_MATKUL.cari_id(matkul)
+        if id_matkul is None or id_matkul not in self._id_matkul:
+            return -1
+        return self._id_matkul.index(id_matkul)
+
+    def _percobaan(self, id_matkul: int) -> list[tuple[int, int, int, int]]:
+        """(semester, sks, nilai, posisi di _riwayat) untuk setiap percobaan satu mata kuliah."""
+        r = self._riwayat
+        return [(r[i + 1], r[i + 2], r[i + 3], i) for i in range(0, len(r), 4) if r[i] == id_matkul]
+
+    def tambah_nilai_matkul(self, matkul: str, nilai: int, semester: int | None = None,
+                            sks: int | None = None) -> tuple[int, int]:
+        """Menambahkan atau memperbarui Nilai Akhir (0-100) mata kuliah pada satu semester.
+
+        Tanpa semester/SKS, percobaan terakhir mata kuliah itu yang diperbarui (mata kuliah baru: semester
+        SEMESTER_BAWAAN, SKS_BAWAAN). Nilai pada semester lain dicatat sebagai pengulangan; yang berlaku
+        untuk IPK adalah percobaan semester terakhir. Mengembalikan (semester, sks) yang dipakai.
+        """
+        if not 0 <= nilai <= 100:
+            raise ValueError(f"Nilai {nilai} di luar rentang 0 - 100")
+        id_matkul = KATALOG_MATKUL.id_matkul(matkul)
+        percobaan = self._percobaan(id_matkul)
+        if semester is None:
+            semester = max(percobaan)[0] if percobaan else SEMESTER_BAWAAN
+        sama = next((p for p in percobaan if p[0] == semester), None)
+        if sks is None:
+            sks = sama[1] if sama else (max(percobaan)[1] if percobaan else SKS_BAWAAN)
+        if not 1 <= semester <= MAKS_SEMESTER:
+            raise ValueError(f"Semester {semester} di luar rentang 1 - {MAKS_SEMESTER}")
+        if not 1 <= sks <= MAKS_SKS:
+            raise ValueError(f"SKS {sks} di luar rentang 1 - {MAKS_SKS}")
+
+        lain = [p[:3] for p in percobaan if p[0] != semester]
+        if sama:
+            self._riwayat[sama[3] + 2] = sks
+            self._riwayat[sama[3] + 3] = nilai
+            self._ubah_semester(lain, semester, sama[1:3], (sks, nilai))
+        else:
+            self._riwayat.extend((id_matkul, semester, sks, nilai))
+            self._ubah_semester(lain, semester, None, (sks, nilai))
+        self._perbarui_efektif(id_matkul, lain + [(semester, sks, nilai)])
+        return semester, sks
+
+    def hapus_nilai_matkul(self, matkul: str, semester: int | None = None) -> bool:
+        """Menghapus nilai mata kuliah (semua percobaan, atau hanya satu semester).
+
+        Mengembalikan False jika tidak ada yang dihapus.
+        """
+        id_matkul = KATALOG_MATKUL.cari_id(matkul)
+        if id_matkul is None:
+            return False
+        percobaan = self._percobaan(id_matkul)
+        dihapus = [p for p in percobaan if semester is None or p[0] == semester]
+        if not dihapus:
+            return False
+        # Hapus dari posisi terbesar agar posisi percobaan lain di _riwayat tidak bergeser
+        for p in sorted(dihapus, key=lambda p: p[3], reverse=True):
+            del self._riwayat[p[3]:p[3] + 4]
+        sisa = [p[:3] for p in percobaan]
+        for p in dihapus:
+            sisa.remove(p[:3])
+            self._ubah_semester(sisa, p[0], p[1:3], None)
+        self._perbarui_efektif(id_matkul, sisa)
+        return True
+
+    def _ubah_semester(self, lain: list[tuple[int, int, int]], semester: int,
+                       lama: tuple[int, int] | None, baru: tuple[int, int] | None):
+        """Memperbarui IPS satu semester dan prefix sum IPK mulai semester itu saja.
+
+        `lain` berisi (semester, sks, nilai) percobaan lain mata kuliah yang sama; `lama`/`baru` adalah
+        (sks, nilai) percobaan di `semester` sebelum/sesudah perubahan (None = tidak ada).
+        """
+        def mutu_sks(p: tuple[int, int] | None) -> tuple[int, int]:
+            return (0, 0) if p is None else (p[0] * _MUTU2_PER_NILAI[p[1]], p[0])
+
+        ps = self._per_semester
+        while len(ps) < 4 * semester:
+            # Semester baru: prefix sum meneruskan nilai semester sebelumnya
+            ps.extend((0, 0, ps[-2] if ps else 0, ps[-1] if ps else 0))
+        i = 4 * (semester - 1)
+        (mutu_lama, sks_lama), (mutu_baru, sks_baru) = mutu_sks(lama), mutu_sks(baru)
+        ps[i] += mutu_baru - mutu_lama
+        ps[i + 1] += sks_baru - sks_lama
+
+        # Untuk IPK hanya percobaan terakhir yang berlaku: perubahan ini berpengaruh dari `semester`
+        # sampai sebelum pengulangan berikutnya. Jika percobaan di semester ini tidak ada, yang berlaku
+        # adalah percobaan sebelumnya (jika ada).
+        sebelumnya = max((p for p in lain if p[0] < semester), default=None)
+        pengganti = sebelumnya[1:] if sebelumnya else None
+        berikutnya = min((p[0] for p in lain if p[0] > semester), default=len(ps) // 4 + 1)
+        (mutu_lama, sks_lama) = mutu_sks(pengganti if lama is None else lama)
+        (mutu_baru, sks_baru) = mutu_sks(pengganti if baru is None else baru)
+        for j in range(i, 4 * (berikutnya - 1), 4):
+            ps[j + 2] += mutu_baru - mutu_lama
+            ps[j + 3] += sks_baru - sks_lama
+        while ps and ps[-3] == 0:   # buang semester kosong di akhir
+            del ps[-4:]
+
+    def _perbarui_efektif(self, id_matkul: int, percobaan: list[tuple[int, int, int]]):
+        """Menyelaraskan nilai efektif satu mata kuliah dengan percobaan semester terakhirnya."""
+        posisi = self._id_matkul.index(id_matkul) if id_matkul in self._id_matkul else -1
+        if percobaan:
+            nilai = max(percobaan)[2]
+            if posisi >= 0:
+                self._total_nilai += nilai - self._nilai[posisi]
+                self._nilai[posisi] = nilai
+            else:
+                self._id_matkul.append(id_matkul)
+                self._nilai.append(nilai)
+                self._total_nilai += nilai
+        elif posisi >= 0:
+            self._total_nilai -= self._nilai[posisi]
+            del self._id_matkul[posisi]
+            del self._nilai[posisi]
+
+    def hitung_ulang_total(self):
+        """Membangun ulang nilai efektif, total, dan data per semester dari riwayat (pemeriksaan/perbaikan cache).
+
+        Array baru dibangun pada objek sementara lalu dipasang sekaligus, jadi objek ini tidak pernah berisi
+        array kosong/setengah terisi; pembaca di thread lain tetap perlu memegang kunci repositori.
+        """
+        baru = Mahasiswa(self.nama, self.nim)
+        riwayat = self._riwayat
+        nama_matkul = KATALOG_MATKUL.nama_matkul
+        for i in range(0, len(riwayat), 4):
+            id_matkul, semester, sks, nilai = riwayat[i:i + 4]
+            baru.tambah_nilai_matkul(nama_matkul(id_matkul), nilai, semester, sks)
+        self._id_matkul, self._nilai, self._riwayat, self._per_semester, self._total_nilai = (
+            baru._id_matkul, baru._nilai, baru._riwayat, baru._per_semester, baru._total_nilai)
+
+    @staticmethod
+    def konversi_nilai_ke_huruf_dan_bobot(nilai: int) -> tuple[str, float]:
+        """Mengkonversi nilai (0-100) ke Nilai Huruf dan Bobot Skala 4.00 lewat tabel pencarian."""
+        if type(nilai) is int and 0 <= nilai <= 100:
+            return TABEL_HURUF_BOBOT[nilai]
+        # Batas nilai berupa bilangan bulat, jadi pembulatan ke bawah + clamp memberi hasil yang sama
+        return TABEL_HURUF_BOBOT[min(max(int(nilai), 0), 100)]
+
+    def hitung_rata_rata(self) -> float:
+        """Menghitung rata-rata nilai efektif (0-100) dari semua mata kuliah."""
+        if not self._nilai:
+            return 0.0
+        return self._total_nilai / len(self._nilai)
+
+    def hitung_ipk(self) -> float:
+        """Menghitung IPK (Indeks Prestasi Kumulatif) skala 4.00, berbobot SKS."""
+        if not self._per_semester:
+            return 0.0
+        return self._per_semester[-2] / (2 * self._per_semester[-1])
+
+    def hitung_ips(self, semester: int) -> float:
+        """IPS (Indeks Prestasi Semester) berbobot SKS, dari semua percobaan pada semester itu."""
+        i = 4 * (semester - 1)
+        if not 0 <= i < len(self._per_semester) or not self._per_semester[i + 1]:
+            return 0.0
+        return self._per_semester[i] / (2 * self._per_semester[i + 1])
+
+    def transkrip_semester(self) -> list[tuple[int, int, float, int, float]]:
+        """(semester, SKS semester, IPS, SKS kumulatif, IPK sampai semester itu), O(jumlah semester).
+
+        Semester tanpa nilai dilewati.
+        """
+        ps = self._per_semester
+        return [(i // 4 + 1, ps[i + 1], ps[i] / (2 * ps[i + 1]), ps[i + 3], ps[i + 2] / (2 * ps[i + 3]))
+                for i in range(0, len(ps), 4) if ps[i + 1]]
+
+    def percobaan_matkul(self, matkul: str) -> list[tuple[int, int, int]]:
+        """(semester, sks, nilai) setiap percobaan satu mata kuliah, urut semester."""
+        id_matkul = KATALOG_MATKUL.cari_id(matkul)
+        return [] if id_matkul is None else sorted(p[:3] for p in self._percobaan(id_matkul))
+
+    def riwayat_nilai(self) -> list[tuple[str, int, int, int]]:
+        """Semua percobaan (matkul, semester, sks, nilai), urut semester lalu urutan input."""
+        r, nama_matkul = self._riwayat, KATALOG_MATKUL.nama_matkul
+        semua = [(r[i + 1], i) for i in range(0, len(r), 4)]
+        return [(nama_matkul(r[i]), r[i + 1], r[i + 2], r[i + 3]) for _, i in sorted(semua)]
+
+    def data_ekspor(self) -> tuple:
+        """(nim, nama, rata-rata, IPK, riwayat_nilai(), transkrip_semester()) sebagai data biasa.
+
+        Tidak bergantung pada KATALOG_MATKUL, jadi aman dikirim ke proses lain untuk ekspor paralel.
+        """
+        return (self.nim, self.nama, self.hitung_rata_rata(), self.hitung_ipk(),
+                self.riwayat_nilai(), self.transkrip_semester())
+
+    def get_predikat_rata_rata(self) -> str:
+        """Dipertahankan di kelas untuk konsistensi, tapi tidak ditampilkan di UI."""
+        rata_rata = self.hitung_rata_rata()
+        if rata_rata >= 85: return "A"
+        elif rata_rata >= 75: return "B"
+        elif rata_rata >= 65: return "C"
+        else: return "D"
+
+def konversi_nilai_batch(daftar_nilai: Iterable[int]):
+    """Mengkonversi banyak nilai sekaligus ke (daftar Nilai Huruf, daftar Bobot).
+
+    Jika NumPy tersedia, hasilnya berupa dua array NumPy (pengindeksan vektor ke tabel);
+    jika tidak, hasilnya berupa dua list Python.
+    """
+    tabel = _tabel_numpy()
+    if tabel is not None:
+        np, huruf, bobot = tabel
+        if not hasattr(daftar_nilai, "__len__"):
+            daftar_nilai = list(daftar_nilai)   # generator/iterator: np.asarray akan membuat array objek 0-d
+        indeks = np.clip(np.asarray(daftar_nilai), 0, 100).astype(np.intp)
+        return huruf[indeks], bobot[indeks]
+    hasil = [Mahasiswa.konversi_nilai_ke_huruf_dan_bobot(nilai) for nilai in daftar_nilai]
+    return [huruf for huruf, _ in hasil], [bobot for _, bobot in hasil]
+
+@functools.cache
+def _tabel_numpy():
+    """(numpy, tabel huruf, tabel bobot), atau None tanpa NumPy; diimpor saat pertama dipakai agar modul cepat dimuat."""
+    try:
+        import numpy as np
+    except ImportError:  # NumPy opsional, hanya untuk konversi batch
+        return None
+    return (np, np.array([huruf for huruf, _ in TABEL_HURUF_BOBOT]),
+            np.array([bobot for _, bobot in TABEL_HURUF_BOBOT]))
+
+def baris_transkrip(riwayat: list[tuple[str, int, int, int]]) -> list[tuple[int, str, int, int, str]]:
+    """(semester, matkul, sks, nilai, huruf) per percobaan dari Mahasiswa.riwayat_nilai().
+
+    Percobaan yang sudah digantikan di semester berikutnya ditandai "(diulang)".
+    """
+    semester_efektif = {matkul: semester for matkul, semester, _, _ in riwayat}  # urut semester: terakhir berlaku
+    hasil = []
+    for matkul, semester, sks, nilai in riwayat:
+        huruf = TABEL_HURUF_BOBOT[nilai][0]
+        if semester != semester_efektif[matkul]:
+            huruf += " (diulang)"
+        hasil.append((semester, matkul, sks, nilai, huruf))
+    return hasil
+
+class DaftarMahasiswa:
+    """Registri Mahasiswa berindeks NIM: cek duplikat, pencarian, dan penghapusan O(1)."""
+    def __init__(self):
+        self._per_id: Dict[int, Mahasiswa] = {}   # urutan sisip = urutan baris tabel
+        self._id_per_nim: Dict[str, int] = {}
+        self._id_berikut = 0
+        self._urutan_id: list[int] | None = []   # cache posisi -> id; None = perlu dibangun ulang
+
+    def __len__(self) -> int:
+        return len(self._per_id)
+
+    def __iter__(self):
+        return iter(self._per_id.values())
+
+    def __contains__(self, nim: str) -> bool:
+        return nim in self._id_per_nim
+
+    def tambah(self, mhs: Mahasiswa) -> int:
+        """Mendaftarkan Mahasiswa baru dan mengembalikan id barisnya yang stabil."""
+        if mhs.nim in self._id_per_nim:
+            raise KeyError(f"NIM {mhs.nim} sudah terdaftar")
+        id_baris = self._id_berikut
+        self._id_berikut += 1
+        self._per_id[id_baris] = mhs
+        self._id_per_nim[mhs.nim] = id_baris
+        if self._urutan_id is not None:
+            self._urutan_id.append(id_baris)
+        return id_baris
+
+    def tambah_banyak(self, semua_mhs: list[Mahasiswa]):
+        """Mendaftarkan banyak Mahasiswa sekaligus (mis. saat memuat snapshot), urut seperti tambah()."""
+        awal = self._id_berikut
+        daftar_id = range(awal, awal + len(semua_mhs))
+        id_per_nim = dict(zip([mhs.nim for mhs in semua_mhs], daftar_id))
+        if len(id_per_nim) < len(semua_mhs) or not id_per_nim.keys().isdisjoint(self._id_per_nim):
+            raise KeyError("NIM ganda dalam data yang dimuat")
+        self._per_id.update(zip(daftar_id, semua_mhs))
+        self._id_per_nim.update(id_per_nim)
+        self._id_berikut += len(semua_mhs)
+        if self._urutan_id is not None:
+            self._urutan_id.extend(daftar_id)
+
+    def cari(self, nim: str) -> Mahasiswa | None:
+        """Mengambil Mahasiswa berdasarkan NIM (None jika tidak ada)."""
+        id_baris = self._id_per_nim.get(nim)
+        return None if id_baris is None else self._per_id[id_baris]
+
+    def cari_id(self, id_baris: int) -> Mahasiswa | None:
+        """Mengambil Mahasiswa berdasarkan id baris."""
+        return self._per_id.get(id_baris)
+
+    def id_dari(self, nim: str) -> int:
+        """Mengembalikan id baris milik NIM tertentu."""
+        return self._id_per_nim[nim]
+
+    def id_rentang(self, awal: int, jumlah: int) -> list[int]:
+        """Mengembalikan id baris pada posisi [awal, awal + jumlah) sesuai urutan tabel."""
+        if self._urutan_id is None:
+            self._urutan_id = list(self._per_id)
+        return self._urutan_id[awal:awal + jumlah]
+
+    def id_setelah(self, id_terakhir: int, jumlah: int) -> list[int]:
+        """Paling banyak `jumlah` id baris sesudah id_terakhir, sesuai urutan tabel.
+
+        Id baru selalu lebih besar dari yang sudah ada, jadi urutan tabel = urutan id. Berbeda dengan
+        id_rentang(), halaman berikutnya tidak bergeser jika ada baris yang dihapus di antara pemanggilan.
+        """
+        if self._urutan_id is None:
+            self._urutan_id = list(self._per_id)
+        awal = bisect.bisect_right(self._urutan_id, id_terakhir)
+        return self._urutan_id[awal:awal + jumlah]
+
+    def ganti_nim(self, nim_lama: str, nim_baru: str):
+        """Mengganti NIM Mahasiswa tanpa mengubah posisinya di tabel."""
+        if nim_lama == nim_baru:
+            return
+        if nim_baru in self._id_per_nim:
+            raise KeyError(f"NIM {nim_baru} sudah terdaftar")
+        id_baris = self._id_per_nim.pop(nim_lama)
+        self._id_per_nim[nim_baru] = id_baris
+        self._per_id[id_baris].nim = nim_baru
+
+    def hapus(self, nim: str) -> Mahasiswa:
+        """Menghapus Mahasiswa berdasarkan NIM dan mengembalikan objeknya."""
+        id_baris = self._id_per_nim.pop(nim)
+        self._urutan_id = None
+        return self._per_id.pop(id_baris)
+
+def _batas_atas_awalan(awalan: str) -> str:
+    """String terkecil yang lebih besar dari semua string berawalan `awalan` (batas eksklusif rentang)."""
+    return awalan[:-1] + chr(ord(awalan[-1]) + 1)
+
+def _trigram(teks: str) -> set[str]:
+    return {teks[i:i + 3] for i in range(len(teks) - 2)}
+
+class IndeksPencarian:
+    """Indeks pencarian Mahasiswa per id baris: array NIM terurut (bisect untuk rentang awalan)
+    dan indeks trigram nama (untuk substring). Diperbarui inkremental saat tambah/edit/hapus.
+    """
+    def __init__(self):
+        self._nim_urut: list[str] = []
+        self._id_per_nim: Dict[str, int] = {}
+        self._nama: Dict[int, str] = {}          # id -> nama huruf kecil
+        self._trigram: Dict[str, set[int]] = {}
+
+    def tambah(self, id_baris: int, nim: str, nama: str):
+        bisect.insort(self._nim_urut, nim)
+        self._id_per_nim[nim] = id_baris
+        nama = nama.lower()
+        self._nama[id_baris] = nama
+        for g in _trigram(nama):
+            self._trigram.setdefault(g, set()).add(id_baris)
+
+    def hapus(self, id_baris: int, nim: str):
+        del self._nim_urut[bisect.bisect_left(self._nim_urut, nim)]
+        del self._id_per_nim[nim]
+        for g in _trigram(self._nama.pop(id_baris)):
+            kumpulan = self._trigram[g]
+            kumpulan.discard(id_baris)
+            if not kumpulan:
+                del self._trigram[g]
+
+    def ubah(self, id_baris: int, nim_lama: str, nim: str, nama: str):
+        self.hapus(id_baris, nim_lama)
+        self.tambah(id_baris, nim, nama)
+
+    def cari_nim_awalan(self, awalan: str) -> list[int]:
+        """Id semua Mahasiswa yang NIM-nya berawalan `awalan`, O(log n + k)."""
+        kiri = bisect.bisect_left(self._nim_urut, awalan)
+        kanan = bisect.bisect_left(self._nim_urut, _batas_atas_awalan(awalan), kiri)
+        return sorted(self._id_per_nim[nim] for nim in self._nim_urut[kiri:kanan])
+
+    def cari_nama(self, teks: str) -> list[int]:
+        """Id semua Mahasiswa yang namanya memuat `teks` (tanpa membedakan huruf besar/kecil)."""
+        teks = teks.lower()
+        if len(teks) < 3:
+            return sorted(i for i, nama in self._nama.items() if teks in nama)   # ubah() menyisip ulang di akhir
+        kandidat = sorted((self._trigram.get(g, set()) for g in _trigram(teks)), key=len)
+        hasil = set.intersection(*kandidat)
+        # Trigram hanya menyaring kandidat; pastikan substring benar-benar ada
+        return sorted(i for i in hasil if teks in self._nama[i])
+
+    def cari(self, teks: str) -> list[int]:
+        """Teks berupa angka dicocokkan sebagai awalan NIM, selain itu sebagai bagian nama."""
+        return self.cari_nim_awalan(teks) if teks.isdigit() else self.cari_nama(teks)
+
+class UrutanMahasiswa:
+    """Daftar (kunci, id) yang selalu terurut untuk satu kolom tabel.
+
+    Perubahan satu Mahasiswa hanya memindahkan satu entri lewat bisect, tanpa mengurutkan ulang
+    seluruh daftar. Urutan menurun dibaca dari belakang daftar yang sama.
+    """
+    KUNCI = {
+        "nama": lambda m: m.nama.lower(),
+        "nim": lambda m: (len(m.nim), m.nim),   # urutan angka untuk NIM yang panjangnya berbeda
+        "rata": lambda m: m.hitung_rata_rata(),
+        "ipk": lambda m: m.hitung_ipk(),
+    }
+
+    def __init__(self, kolom: str, pasangan: Iterable[tuple[int, "Mahasiswa"]]):
+        self.kunci = self.KUNCI[kolom]
+        self._kunci_per_id = {id_baris: self.kunci(m) for id_baris, m in pasangan}
+        self._urut = sorted((k, id_baris) for id_baris, k in self._kunci_per_id.items())
+
+    def __len__(self) -> int:
+        return len(self._urut)
+
+    def perbarui(self, id_baris: int, mhs: "Mahasiswa"):
+        """Menyisipkan Mahasiswa baru atau memindahkan entrinya bila kuncinya berubah, O(log n)."""
+        baru = self.kunci(mhs)
+        if id_baris in self._kunci_per_id:
+            lama = self._kunci_per_id[id_baris]
+            if lama == baru:
+                return
+            del self._urut[bisect.bisect_left(self._urut, (lama, id_baris))]
+        self._kunci_per_id[id_baris] = baru
+        bisect.insort(self._urut, (baru, id_baris))
+
+    def hapus(self, id_baris: int):
+        lama = self._kunci_per_id.pop(id_baris)
+        del self._urut[bisect.bisect_left(self._urut, (lama, id_baris))]
+
+    def posisi(self, id_baris: int, menurun: bool = False) -> int:
+        posisi = bisect.bisect_left(self._urut, (self._kunci_per_id[id_baris], id_baris))
+        return len(self._urut) - 1 - posisi if menurun else posisi
+
+    def id_rentang(self, awal: int = 0, jumlah: int | None = None, menurun: bool = False) -> list[int]:
+        """Id baris pada posisi [awal, awal + jumlah) menurut urutan naik atau turun."""
+        n = len(self._urut)
+        akhir = n if jumlah is None else min(n, awal + jumlah)
+        if menurun:
+            potongan = self._urut[max(0, n - akhir):max(0, n - awal)][::-1]
+        else:
+            potongan = self._urut[awal:akhir]
+        return [id_baris for _, id_baris in potongan]
+
+def _akar_pecahan(pembilang: int, penyebut: int) -> float:
+    """Akar kuadrat pembilang/penyebut yang dibulatkan benar ke float (tanpa pembulatan ganda).
+
+    Akar bilangan bulat dihitung dengan ketelitian berlebih memakai round-to-odd, lalu dibulatkan
+    sekali saat dibagi; sama persis dengan statistics.pstdev untuk data bilangan bulat.
+    """
+    geser = (pembilang.bit_length() - penyebut.bit_length() - 2 * sys.float_info.mant_dig - 3) // 2
+    if geser >= 0:
+        pembilang_akar, penyebut_akar = _akar_bulat_ganjil(pembilang, penyebut << 2 * geser) << geser, 1
+    else:
+        pembilang_akar, penyebut_akar = _akar_bulat_ganjil(pembilang << -2 * geser, penyebut), 1 << -geser
+    return pembilang_akar / penyebut_akar
+
+def _akar_bulat_ganjil(pembilang: int, penyebut: int) -> int:
+    """Akar bulat pembilang/penyebut dengan round-to-odd (bit terakhir menandai sisa tak nol)."""
+    akar = math.isqrt(pembilang // penyebut)
+    return akar | (akar * akar * penyebut != pembilang)
+
+class StatistikMatkul:
+    """Jumlah nilai per ember 0-100 untuk satu mata kuliah.
+
+    Menambah/mengurangi satu nilai O(1); rata-rata, median, simpangan baku, distribusi huruf
+    dan tingkat kelulusan dihitung dari 101 ember, tidak bergantung pada jumlah Mahasiswa.
+    """
+    __slots__ = ("ember", "jumlah")
+
+    def __init__(self):
+        self.ember = array('I', bytes(4 * 101))
+        self.jumlah = 0
+
+    def tambah(self, nilai: int, banyak: int = 1):
+        self.ember[nilai] += banyak
+        self.jumlah += banyak
+
+    def kurangi(self, nilai: int):
+        self.ember[nilai] -= 1
+        self.jumlah -= 1
+
+    def rata_rata(self) -> float:
+        if not self.jumlah:
+            return 0.0
+        return sum(nilai * banyak for nilai, banyak in enumerate(self.ember)) / self.jumlah
+
+    def _nilai_pada_peringkat(self, peringkat: int) -> int:
+        """Nilai ke-`peringkat` (mulai 0) bila semua nilai diurutkan naik."""
+        kumulatif = 0
+        for nilai, banyak in enumerate(self.ember):
+            kumulatif += banyak
+            if kumulatif > peringkat:
+                return nilai
+        raise IndexError(peringkat)
+
+    def median(self) -> float:
+        if not self.jumlah:
+            return 0.0
+        bawah = self._nilai_pada_peringkat((self.jumlah - 1) // 2)
+        atas = self._nilai_pada_peringkat(self.jumlah // 2)
+        return (bawah + atas) / 2
+
+    def simpangan_baku(self) -> float:
+        """Simpangan baku populasi, dihitung dari jumlah dan jumlah kuadrat bilangan bulat (tanpa galat akumulasi)."""
+        if not self.jumlah:
+            return 0.0
+        total = sum(nilai * banyak for nilai, banyak in enumerate(self.ember))
+        total_kuadrat = sum(nilai * nilai * banyak for nilai, banyak in enumerate(self.ember))
+        return _akar_pecahan(self.jumlah * total_kuadrat - total * total, self.jumlah * self.jumlah)
+
+    def distribusi_huruf(self) -> Dict[str, int]:
+        """Jumlah Mahasiswa per Nilai Huruf, urut dari A+ ke E."""
+        distribusi = {huruf: 0 for _, huruf, _ in BATAS_NILAI}
+        for nilai, banyak in enumerate(self.ember):
+            if banyak:
+                distribusi[TABEL_HURUF_BOBOT[nilai][0]] += banyak
+        return distribusi
+
+    def tingkat_lulus(self) -> float:
+        """Proporsi (0-1) nilai yang mencapai NILAI_LULUS."""
+        if not self.jumlah:
+            return 0.0
+        return sum(self.ember[NILAI_LULUS:]) / self.jumlah
+
+    def ringkasan(self) -> Dict[str, Any]:
+        return {"jumlah": self.jumlah, "rata": self.rata_rata(), "median": self.median(),
+                "simpangan_baku": self.simpangan_baku(), "distribusi": self.distribusi_huruf(),
+                "lulus": self.tingkat_lulus()}
+
+class StatistikKohort:
+    """Statistik per mata kuliah untuk seluruh Mahasiswa, diperbarui setiap kali satu nilai berubah."""
+    def __init__(self):
+        self._per_matkul: Dict[str, StatistikMatkul] = {}
+
+    @classmethod
+    def dari_mahasiswa(cls, daftar: Iterable[Mahasiswa]) -> "StatistikKohort":
+        """Membangun statistik langsung dari array nilai setiap Mahasiswa."""
+        per_id: Dict[int, StatistikMatkul] = {}
+        for m in daftar:
+            for id_matkul, nilai in zip(m._id_matkul, m._nilai):
+                statistik = per_id.get(id_matkul)
+                if statistik is None:
+                    statistik = per_id[id_matkul] = StatistikMatkul()
+                statistik.tambah(nilai)
+        kohort = cls()
+        kohort._per_matkul = {KATALOG_MATKUL.nama_matkul(i): s for i, s in per_id.items()}
+        return kohort
+
+    @classmethod
+    def dari_hitungan(cls, baris: Iterable[tuple[str, int, int]]) -> "StatistikKohort":
+        """Membangun statistik dari baris (matkul, nilai, banyak), mis. hasil GROUP BY."""
+        kohort = cls()
+        for matkul, nilai, banyak in baris:
+            statistik = kohort._per_matkul.get(matkul)
+            if statistik is None:
+                statistik = kohort._per_matkul[matkul] = StatistikMatkul()
+            statistik.tambah(nilai, banyak)
+        return kohort
+
+    def ganti(self, matkul: str, lama: int | None, baru: int | None):
+        """Mencatat perubahan satu nilai: lama=None berarti nilai baru, baru=None berarti nilai dihapus."""
+        if lama == baru:
+            return
+        if lama is not None:
+            statistik = self._per_matkul[matkul]
+            statistik.kurangi(lama)
+            if not statistik.jumlah:
+                del self._per_matkul[matkul]
+        if baru is not None:
+            statistik = self._per_matkul.get(matkul)
+            if statistik is None:
+                statistik = self._per_matkul[matkul] = StatistikMatkul()
+            statistik.tambah(baru)
+
+    def hapus_mahasiswa(self, mhs: Mahasiswa):
+        for matkul, nilai in mhs.matkul_nilai.items():
+            self.ganti(matkul, nilai, None)
+
+    def ringkasan(self) -> Dict[str, Dict[str, Any]]:
+        """Statistik setiap mata kuliah, urut menurut nama mata kuliah."""
+        return {matkul: self._per_matkul[matkul].ringkasan() for matkul in sorted(self._per_matkul)}
+
+def _terkunci(metode):
+    """Dekorator: menjalankan metode repositori sambil memegang self.kunci (aman dipanggil dari thread lain)."""
+    @functools.wraps(metode)
+    def pembungkus(self, *args, **kwargs):
+        with self.kunci:
+            return metode(self, *args, **kwargs)
+    return pembungkus
+
+class RepositoriMemori:
+    """Lapisan penyimpanan di belakang operasi CRUD; versi ini hanya menyimpan data di memori."""
+    def __init__(self):
+        self.daftar = DaftarMahasiswa()
+        # Dipegang oleh setiap operasi; tugas latar belakang memegangnya per batch lewat kelompok()
+        self.kunci = threading.RLock()
+        self._indeks: IndeksPencarian | None = None   # dibangun saat pencarian pertama
+        self._urutan: Dict[str, UrutanMahasiswa] = {}  # per kolom, dibangun saat diurutkan pertama kali
+        self._statistik: StatistikKohort | None = None  # dibangun saat statistik diminta pertama kali
+
+    # BACA DATA
+    @_terkunci
+    def __len__(self) -> int:
+        return len(self.daftar)
+
+    @_terkunci
+    def __contains__(self, nim: str) -> bool:
+        return nim in self.daftar
+
+    def __iter__(self):
+        with self.kunci:
+            yield from self.daftar
+
+    @_terkunci
+    def cari(self, nim: str) -> Mahasiswa | None:
+        return self.daftar.cari(nim)
+
+    @_terkunci
+    def cari_id(self, id_baris: int) -> Mahasiswa | None:
+        return self.daftar.cari_id(id_baris)
+
+    @_terkunci
+    def id_dari(self, nim: str) -> int:
+        return self.daftar.id_dari(nim)
+
+    def ringkasan(self):
+        """Mengalirkan (id, nama, nim, rata-rata, IPK) per Mahasiswa sesuai urutan tabel."""
+        with self.kunci:
+            for id_baris, m in self.daftar._per_id.items():
+                yield id_baris, m.nama, m.nim, m.hitung_rata_rata(), m.hitung_ipk()
+
+    @_terkunci
+    def ringkasan_rentang(self, awal: int, jumlah: int) -> list[tuple]:
+        """Seperti ringkasan(), tetapi hanya untuk baris pada posisi [awal, awal + jumlah)."""
+        per_id = self.daftar._per_id
+        return [(id_baris, m.nama, m.nim, m.hitung_rata_rata(), m.hitung_ipk())
+                for id_baris, m in ((i, per_id[i]) for i in self.daftar.id_rentang(awal, jumlah))]
+
+    @_terkunci
+    def ringkasan_id(self, daftar_id: list[int]) -> list[tuple]:
+        """Seperti ringkasan(), tetapi untuk id baris tertentu (urutan mengikuti daftar_id)."""
+        per_id = self.daftar._per_id
+        return [(i, m.nama, m.nim, m.hitung_rata_rata(), m.hitung_ipk())
+                for i, m in ((i, per_id.get(i)) for i in daftar_id) if m is not None]
+
+    @_terkunci
+    def data_ekspor_setelah(self, id_terakhir: int, jumlah: int) -> tuple[int, list[tuple]]:
+        """Mahasiswa.data_ekspor() untuk paling banyak `jumlah` baris sesudah id_terakhir, plus id baris terakhirnya."""
+        per_id = self.daftar._per_id
+        daftar_id = self.daftar.id_setelah(id_terakhir, jumlah)
+        return daftar_id[-1] if daftar_id else id_terakhir, [per_id[i].data_ekspor() for i in daftar_id]
+
+    @_terkunci
+    def percobaan_matkul(self, nim: str, matkul: str) -> list[tuple[int, int, int]]:
+        """(semester, sks, nilai) setiap percobaan satu mata kuliah milik NIM, urut semester."""
+        mhs = self.daftar.cari(nim)
+        return mhs.percobaan_matkul(matkul) if mhs is not None else []
+
+    @_terkunci
+    def cari_teks(self, teks: str) -> list[int]:
+        """Id baris yang cocok dengan awalan NIM / bagian nama, sesuai urutan tabel."""
+        if self._indeks is None:
+            self._indeks = IndeksPencarian()
+            for id_baris, m in self.daftar._per_id.items():
+                self._indeks.tambah(id_baris, m.nim, m.nama)
+        return self._indeks.cari(teks)
+
+    def _urutan_kolom(self, kolom: str) -> UrutanMahasiswa:
+        urutan = self._urutan.get(kolom)
+        if urutan is None:
+            urutan = self._urutan[kolom] = UrutanMahasiswa(kolom, self.daftar._per_id.items())
+        return urutan
+
+    def _perbarui_urutan(self, id_baris: int, mhs: Mahasiswa):
+        for urutan in self._urutan.values():
+            urutan.perbarui(id_baris, mhs)
+
+    @_terkunci
+    def id_urut(self, kolom: str, menurun: bool = False, awal: int = 0, jumlah: int | None = None) -> list[int]:
+        """Id baris terurut menurut kolom ("nama", "nim", "rata", "ipk") pada posisi [awal, awal + jumlah)."""
+        return self._urutan_kolom(kolom).id_rentang(awal, jumlah, menurun)
+
+    @_terkunci
+    def posisi_urut(self, id_baris: int, kolom: str, menurun: bool = False) -> int:
+        return self._urutan_kolom(kolom).posisi(id_baris, menurun)
+
+    @_terkunci
+    def peringkat(self, n: int, kolom: str = "ipk", terbawah: bool = False) -> list[tuple]:
+        """Ringkasan n Mahasiswa teratas (atau terbawah) menurut kolom, mis. daftar dekan atau masa percobaan."""
+        return self.ringkasan_id(self.id_urut(kolom, menurun=not terbawah, jumlah=n))
+
+    @_terkunci
+    def statistik_matkul(self) -> Dict[str, Dict[str, Any]]:
+        """Statistik per mata kuliah (lihat StatistikMatkul.ringkasan), diperbarui inkremental."""
+        if self._statistik is None:
+            self._statistik = StatistikKohort.dari_mahasiswa(self.daftar)
+        return self._statistik.ringkasan()
+
+    @_terkunci
+    def hitung_ulang_setelah(self, id_terakhir: int, jumlah: int) -> list[tuple]:
+        """Menghitung ulang total rata-rata/IPK dari data mentah untuk paling banyak `jumlah` baris sesudah
+        id_terakhir; mengembalikan ringkasan baris-baris itu."""
+        daftar_id = self.daftar.id_setelah(id_terakhir, jumlah)
+        for id_baris in daftar_id:
+            mhs = self.daftar._per_id[id_baris]
+            mhs.hitung_ulang_total()
+            self._perbarui_urutan(id_baris, mhs)
+        return self.ringkasan_id(daftar_id)
+
+    # TULIS DATA
+    def _pastikan_terdaftar(self, mhs: Mahasiswa):
+        """Menolak objek Mahasiswa yang sudah tidak terdaftar (mis. dihapus di thread lain) sebelum apa pun diubah."""
+        if self.daftar.cari(mhs.nim) is not mhs:
+            raise KeyError(f"Mahasiswa {mhs.nim} tidak terdaftar")
+
+    @_terkunci
+    def tambah_mahasiswa(self, nama: str, nim: str) -> Mahasiswa:
+        mhs = Mahasiswa(nama, nim)
+        id_baris = self.daftar.tambah(mhs)
+        if self._indeks is not None:
+            self._indeks.tambah(id_baris, nim, nama)
+        self._perbarui_urutan(id_baris, mhs)
+        return mhs
+
+    @_terkunci
+    def edit_mahasiswa(self, mhs: Mahasiswa, nama: str, nim: str):
+        self._pastikan_terdaftar(mhs)
+        nim_lama = mhs.nim
+        self.daftar.ganti_nim(nim_lama, nim)
+        mhs.nama = nama
+        id_baris = self.daftar.id_dari(nim)
+        if self._indeks is not None:
+            self._indeks.ubah(id_baris, nim_lama, nim, nama)
+        self._perbarui_urutan(id_baris, mhs)
+
+    @_terkunci
+    def hapus_mahasiswa(self, mhs: Mahasiswa):
+        self._pastikan_terdaftar(mhs)
+        id_baris = self.daftar.id_dari(mhs.nim)
+        self.daftar.hapus(mhs.nim)
+        if self._statistik is not None:
+            self._statistik.hapus_mahasiswa(mhs)
+        if self._indeks is not None:
+            self._indeks.hapus(id_baris, mhs.nim)
+        for urutan in self._urutan.values():
+            urutan.hapus(id_baris)
+
+    @_terkunci
+    def simpan_nilai(self, mhs: Mahasiswa, matkul: str, nilai: int, semester: int | None = None,
+                     sks: int | None = None) -> tuple[int, int]:
+        """Lihat Mahasiswa.tambah_nilai_matkul; mengembalikan (semester, sks) yang dipakai."""
+        self._pastikan_terdaftar(mhs)
+        lama = mhs.matkul_nilai.get(matkul)
+        semester, sks = mhs.tambah_nilai_matkul(matkul, nilai, semester, sks)
+        if self._statistik is not None:
+            self._statistik.ganti(matkul, lama, mhs.matkul_nilai.get(matkul))
+        if self._urutan:
+            self._perbarui_urutan(self.daftar.id_dari(mhs.nim), mhs)
+        return semester, sks
+
+    @_terkunci
+    def hapus_nilai(self, mhs: Mahasiswa, matkul: str, semester: int | None = None) -> bool:
+        self._pastikan_terdaftar(mhs)
+        lama = mhs.matkul_nilai.get(matkul)
+        if not mhs.hapus_nilai_matkul(matkul, semester):
+            return False
+        if self._statistik is not None:
+            self._statistik.ganti(matkul, lama, mhs.matkul_nilai.get(matkul))
+        if self._urutan:
+            self._perbarui_urutan(self.daftar.id_dari(mhs.nim), mhs)
+        return True
+
+    @contextmanager
+    def kelompok(self):
+        """Mengelompokkan banyak mutasi (mis. impor massal) sambil memegang kunci repositori."""
+        with self.kunci:
+            yield
+
+    @_terkunci
+    def tutup(self):
+        pass
+
+class RepositoriJurnal(RepositoriMemori):
+    """Penyimpanan persisten: setiap mutasi ditambahkan ke jurnal (append-only), lalu dipadatkan ke snapshot.
+
+    Saat dibuka, snapshot dimuat lalu jurnal diputar ulang. Baris jurnal yang terpotong akibat
+    crash di tengah penulisan diabaikan dan dipangkas, sehingga data tetap konsisten.
+    """
+    NAMA_SNAPSHOT = "mahasiswa.snapshot.json"
+    NAMA_JURNAL = "mahasiswa.jurnal"
+
+    def __init__(self, direktori: str, batas_kompaksi: int = 10_000, fsync: bool = True):
+        super().__init__()
+        self.direktori = direktori
+        self.batas_kompaksi = batas_kompaksi
+        self.fsync = fsync
+        self._path_snapshot = os.path.join(direktori, self.NAMA_SNAPSHOT)
+        self._path_jurnal = os.path.join(direktori, self.NAMA_JURNAL)
+        self._seq = 0                 # nomor urut mutasi terakhir
+        self._op_sejak_snapshot = 0
+        self._tunda_sinkron = 0
+
+        os.makedirs(direktori, exist_ok=True)
+        # GC dimatikan sementara: memuat ratusan ribu objek tidak membentuk siklus referensi
+        gc_aktif = gc.isenabled()
+        gc.disable()
+        try:
+            self._muat_snapshot()
+            self._putar_ulang_jurnal()
+        finally:
+            if gc_aktif:
+                gc.enable()
+        self._jurnal = open(self._path_jurnal, "ab")
+
+    # MUAT DATA
+    def _muat_snapshot(self):
+        if not os.path.exists(self._path_snapshot):
+            return
+        with open(self._path_snapshot, "rb") as f:
+            snapshot = json.load(f)
+        self._seq = snapshot["seq"]
+        # Seluruh ID mata kuliah dan nilai disimpan sebagai dua blok biner; tiap Mahasiswa mengambil irisannya
+        semua_id = array("H", base64.b64decode(snapshot["id_matkul"]))
+        if snapshot["urutan_byte"] != sys.byteorder:
+            semua_id.byteswap()
+        peta_id = [KATALOG_MATKUL.id_matkul(nama) for nama in snapshot["matkul"]]
+        if peta_id != list(range(len(peta_id))):
+            semua_id = array("H", (peta_id[i] for i in semua_id))
+        semua_nilai = array("B", base64.b64decode(snapshot["nilai"]))
+
+        dari_array, semua_mhs = Mahasiswa.dari_array, []
+        tambah = semua_mhs.append
+        if snapshot.get("versi", 1) < 2:
+            # Snapshot sebelum riwayat semester: riwayat dibentuk dari nilai efektif
+            awal = 0
+            for nim, nama, jumlah in snapshot["mahasiswa"]:
+                akhir = awal + jumlah
+                tambah(dari_array(nama, nim, semua_id[awal:akhir], semua_nilai[awal:akhir]))
+                awal = akhir
+            self.daftar.tambah_banyak(semua_mhs)
+            return
+
+        semua_riwayat = array("H", base64.b64decode(snapshot["riwayat"]))
+        semua_semester = array("i", base64.b64decode(snapshot["per_semester"]))
+        if snapshot["urutan_byte"] != sys.byteorder:
+            semua_riwayat.byteswap()
+            semua_semester.byteswap()
+        if peta_id != list(range(len(peta_id))):
+            semua_riwayat[0::4] = array("H", (peta_id[i] for i in semua_riwayat[0::4]))
+        awal = awal_riwayat = awal_semester = 0
+        for nim, nama, jumlah, jumlah_riwayat, jumlah_semester in snapshot["mahasiswa"]:
+            akhir, akhir_riwayat = awal + jumlah, awal_riwayat + 4 * jumlah_riwayat
+            akhir_semester = awal_semester + 4 * jumlah_semester
+            tambah(dari_array(nama, nim, semua_id[awal:akhir], semua_nilai[awal:akhir],
+                              semua_riwayat[awal_riwayat:akhir_riwayat], semua_semester[awal_semester:akhir_semester]))
+            awal, awal_riwayat, awal_semester = akhir, akhir_riwayat, akhir_semester
+        self.daftar.tambah_banyak(semua_mhs)
+
+    def _putar_ulang_jurnal(self):
+        if not os.path.exists(self._path_jurnal):
+            return
+        with open(self._path_jurnal, "rb") as f:
+            isi = f.read()
+        posisi_valid = isi.rfind(b"\n") + 1   # sisa sesudah newline terakhir: penulisan terakhir terpotong
+        daftar_baris = isi[:posisi_valid].splitlines(keepends=True)
+        try:
+            # Satu json.loads untuk seluruh jurnal jauh lebih cepat daripada satu per baris
+            semua_entri = json.loads(b"[" + b",".join(daftar_baris) + b"]")
+        except ValueError:
+            # Ada baris rusak: ambil entri sampai baris valid terakhir sebelum baris itu
+            semua_entri, posisi_valid = [], 0
+            for baris in daftar_baris:
+                try:
+                    semua_entri.append(json.loads(baris))
+                except ValueError:
+                    break
+                posisi_valid += len(baris)
+        for seq, op, *argumen in semua_entri:
+            if seq > self._seq:
+                self._terapkan(op, argumen)
+                self._seq = seq
+                self._op_sejak_snapshot += 1
+        if posisi_valid < len(isi):
+            with open(self._path_jurnal, "r+b") as f:
+                f.truncate(posisi_valid)
+
+    def _terapkan(self, op: str, argumen: list):
+        if op == "tambah":
+            super().tambah_mahasiswa(*argumen)
+            return
+        if op not in ("edit", "hapus", "nilai", "hapus_nilai"):
+            raise ValueError(f"Operasi jurnal tidak dikenal: {op}")
+        mhs = self.daftar.cari(argumen[0])
+        if mhs is None:
+            # Entri untuk NIM yang tidak terdaftar (ditulis versi lama lewat objek basi) tidak bisa diterapkan;
+            # dilewati agar penyimpanan tetap bisa dibuka
+            return
+        if op == "edit":
+            super().edit_mahasiswa(mhs, *argumen[1:])
+        elif op == "hapus":
+            super().hapus_mahasiswa(mhs)
+        elif op == "nilai":
+            super().simpan_nilai(mhs, *argumen[1:])   # jurnal lama tanpa semester/SKS
+        else:
+            super().hapus_nilai(mhs, *argumen[1:])
+
+    # TULIS JURNAL
+    def _catat(self, op: str, *argumen):
+        self._seq += 1
+        baris = json.dumps([self._seq, op, *argumen], ensure_ascii=False, separators=(",", ":"))
+        self._jurnal.write(baris.encode("utf-8") + b"\n")
+        self._op_sejak_snapshot += 1
+        if not self._tunda_sinkron:
+            self._sinkron()
+            if self._perlu_kompaksi():
+                self.kompaksi()
+
+    def _perlu_kompaksi(self) -> bool:
+        # Ambang ikut tumbuh dengan jumlah data: biaya kompaksi teramortisasi O(1) per mutasi. Jurnal dijaga
+        # pendek (1/20 data) karena pemutaran ulang (~20 us/entri) lebih mahal daripada memuat snapshot per Mahasiswa
+        return self._op_sejak_snapshot >= max(self.batas_kompaksi, len(self.daftar) // 20)
+
+    def _sinkron(self):
+        self._jurnal.flush()
+        if self.fsync:
+            os.fsync(self._jurnal.fileno())
+
+    def _fsync_direktori(self):
+        """Mem-fsync entri direktori (hasil os.replace); tidak didukung di Windows, di sana dilewati."""
+        if not hasattr(os, "O_DIRECTORY"):
+            return
+        fd = os.open(self.direktori, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    @contextmanager
+    def kelompok(self):
+        """Menunda flush/fsync jurnal sampai seluruh mutasi dalam blok selesai ditulis."""
+        with self.kunci:
+            self._tunda_sinkron += 1
+            try:
+                yield
+            finally:
+                self._tunda_sinkron -= 1
+                if not self._tunda_sinkron:
+                    self._sinkron()
+                    if self._perlu_kompaksi():
+                        self.kompaksi()
+
+    @_terkunci
+    def tambah_mahasiswa(self, nama: str, nim: str) -> Mahasiswa:
+        mhs = super().tambah_mahasiswa(nama, nim)
+        self._catat("tambah", nama, nim)
+        return mhs
+
+    @_terkunci
+    def edit_mahasiswa(self, mhs: Mahasiswa, nama: str, nim: str):
+        nim_lama = mhs.nim
+        super().edit_mahasiswa(mhs, nama, nim)
+        self._catat("edit", nim_lama, nama, nim)
+
+    @_terkunci
+    def hapus_mahasiswa(self, mhs: Mahasiswa):
+        super().hapus_mahasiswa(mhs)
+        self._catat("hapus", mhs.nim)
+
+    @_terkunci
+    def simpan_nilai(self, mhs: Mahasiswa, matkul: str, nilai: int, semester: int | None = None,
+                     sks: int | None = None) -> tuple[int, int]:
+        semester, sks = super().simpan_nilai(mhs, matkul, nilai, semester, sks)
+        self._catat("nilai", mhs.nim, matkul, nilai, semester, sks)
+        return semester, sks
+
+    @_terkunci
+    def hapus_nilai(self, mhs: Mahasiswa, matkul: str, semester: int | None = None) -> bool:
+        if not super().hapus_nilai(mhs, matkul, semester):
+            return False
+        if semester is None:
+            self._catat("hapus_nilai", mhs.nim, matkul)
+        else:
+            self._catat("hapus_nilai", mhs.nim, matkul, semester)
+        return True
+
+    # KOMPAKSI
+    @_terkunci
+    def kompaksi(self):
+        """Menulis seluruh data ke snapshot baru secara atomik, lalu mengosongkan jurnal."""
+        self._sinkron()
+        mahasiswa, semua_id, semua_nilai = [], array("H"), array("B")
+        semua_riwayat, semua_semester = array("H"), array("i")
+        for m in self.daftar:
+            mahasiswa.append([m.nim, m.nama, len(m._nilai), len(m._riwayat) // 4, len(m._per_semester) // 4])
+            semua_id.extend(m._id_matkul)
+            semua_nilai.extend(m._nilai)
+            semua_riwayat.extend(m._riwayat)
+            semua_semester.extend(m._per_semester)
+        snapshot = {"versi": 2, "seq": self._seq, "urutan_byte": sys.byteorder,
+                    "matkul": KATALOG_MATKUL._nama_per_id, "mahasiswa": mahasiswa,
+                    "id_matkul": base64.b64encode(semua_id.tobytes()).decode("ascii"),
+                    "nilai": base64.b64encode(semua_nilai.tobytes()).decode("ascii"),
+                    "riwayat": base64.b64encode(semua_riwayat.tobytes()).decode("ascii"),
+                    "per_semester": base64.b64encode(semua_semester.tobytes()).decode("ascii")}
+        path_sementara = self._path_snapshot + ".tmp"
+        with open(path_sementara, "w", encoding="utf-8") as f:
+            # json.dumps (encoder C) jauh lebih cepat daripada json.dump yang menulis potongan demi potongan
+            f.write(json.dumps(snapshot, ensure_ascii=False, separators=(",", ":")))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(path_sementara, self._path_snapshot)
+        # Rename harus tahan listrik padam sebelum jurnal dikosongkan: jika tidak, setelah padam bisa tersisa
+        # snapshot lama dengan jurnal kosong. Crash sebelum jurnal dikosongkan aman: entri lama dilewati lewat seq.
+        self._fsync_direktori()
+        self._jurnal.truncate(0)
+        self._sinkron()
+        self._op_sejak_snapshot = 0
+
+    @_terkunci
+    def tutup(self):
+        """Menutup jurnal setelah flush/fsync; snapshot hanya ditulis ulang jika ambang kompaksi tercapai."""
+        if self._jurnal.closed:
+            return
+        self._sinkron()
+        if self._perlu_kompaksi():
+            self.kompaksi()
+        self._jurnal.close()
+
+class RepositoriSQLite:
+    """Repositori Mahasiswa berbasis SQLite (modul standar sqlite3) untuk data yang lebih besar dari RAM.
+
+    Tabel `mahasiswa` berindeks unik pada NIM, tabel `nilai` berkunci (nim, matkul, semester). Rata-rata
+    serta IPK (berbobot SKS, dari view `nilai_efektif`) dihitung dengan agregat SQL setiap kali nilai satu
+    Mahasiswa berubah dan disimpan di kolom berindeks `mahasiswa.rata`/`ipk`, sehingga ringkasan dan
+    pengurutan tidak perlu GROUP BY atas seluruh tabel. Objek Mahasiswa dibuat sesuai kebutuhan saat dibaca.
+    """
+    SKEMA = f"""
+        CREATE TABLE IF NOT EXISTS mahasiswa (
+            id   INTEGER PRIMARY KEY,
+            nim  TEXT NOT NULL UNIQUE,
+            nama TEXT NOT NULL,
+            rata REAL NOT NULL DEFAULT 0.0,
+            ipk  REAL NOT NULL DEFAULT 0.0
+        );
+        CREATE TABLE IF NOT EXISTS nilai (
+            nim      TEXT NOT NULL REFERENCES mahasiswa(nim) ON UPDATE CASCADE ON DELETE CASCADE,
+            matkul   TEXT NOT NULL,
+            semester INTEGER NOT NULL CHECK (semester BETWEEN 1 AND {MAKS_SEMESTER}),
+            sks      INTEGER NOT NULL CHECK (sks BETWEEN 1 AND {MAKS_SKS}),
+            nilai    INTEGER NOT NULL CHECK (nilai BETWEEN 0 AND 100),
+            PRIMARY KEY (nim, matkul, semester)
+        );
+        -- Percobaan semester terakhir per mata kuliah; dipakai rata-rata, IPK, dan statistik
+        CREATE VIEW IF NOT EXISTS nilai_efektif AS
+            SELECT n.nim, n.matkul, n.semester, n.sks, n.nilai FROM nilai n
+            WHERE n.semester = (SELECT MAX(t.semester) FROM nilai t WHERE t.nim = n.nim AND t.matkul = n.matkul);
+        CREATE TABLE IF NOT EXISTS bobot_nilai (
+            nilai INTEGER PRIMARY KEY,
+            huruf TEXT NOT NULL,
+            bobot REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_mahasiswa_nama ON mahasiswa (lower(nama));
+        CREATE INDEX IF NOT EXISTS idx_mahasiswa_nim_urut ON mahasiswa (length(nim), nim);
+        CREATE INDEX IF NOT EXISTS idx_mahasiswa_rata ON mahasiswa (rata);
+        CREATE INDEX IF NOT EXISTS idx_mahasiswa_ipk ON mahasiswa (ipk);
+    """
+    # Rata-rata nilai efektif dan IPK berbobot SKS, ditulis ke kolom tersimpan; ditambah klausa WHERE
+    SQL_PERBARUI_AGREGAT = """
+        UPDATE mahasiswa SET (rata, ipk) = (
+            SELECT COALESCE(AVG(n.nilai), 0.0), COALESCE(SUM(n.sks * b.bobot) / SUM(n.sks), 0.0)
+            FROM nilai_efektif n LEFT JOIN bobot_nilai b ON b.nilai = n.nilai
+            WHERE n.nim = mahasiswa.nim
+        )
+    """
+    SQL_RINGKASAN = "SELECT id, nama, nim, rata, ipk FROM mahasiswa"
+    SQL_HITUNGAN_NILAI = "SELECT matkul, nilai, COUNT(*) FROM nilai_efektif GROUP BY matkul, nilai"
+
+    def __init__(self, path: str):
+        import sqlite3   # dimuat hanya jika backend SQLite dipakai, agar impor modul inti tetap cepat
+        self.path = path
+        # autocommit; transaksi diatur manual. Koneksi dipakai bersama thread GUI dan tugas latar belakang,
+        # akses selalu diserialkan oleh self.kunci
+        self.conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self.kunci = threading.RLock()
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        kolom_mhs = [baris[1] for baris in self.conn.execute("PRAGMA table_info(mahasiswa)")]
+        isi_agregat = bool(kolom_mhs) and "rata" not in kolom_mhs
+        if isi_agregat:
+            # Basis data lama tanpa kolom agregat: tambahkan, lalu isi setelah skema dan tabel bobot siap
+            self.conn.execute("ALTER TABLE mahasiswa ADD COLUMN rata REAL NOT NULL DEFAULT 0.0")
+            self.conn.execute("ALTER TABLE mahasiswa ADD COLUMN ipk REAL NOT NULL DEFAULT 0.0")
+        kolom_nilai = [baris[1] for baris in self.conn.execute("PRAGMA table_info(nilai)")]
+        if kolom_nilai and "semester" not in kolom_nilai:
+            self._migrasi_riwayat()
+        self.conn.executescript(self.SKEMA)
+        self.conn.executemany("INSERT OR REPLACE INTO bobot_nilai VALUES (?, ?, ?)",
+                              ((nilai, huruf, bobot) for nilai, (huruf, bobot) in enumerate(TABEL_HURUF_BOBOT)))
+        if isi_agregat:
+            self.conn.execute(self.SQL_PERBARUI_AGREGAT)
+        self._kedalaman_transaksi = 0
+        self._agregat_basi: set[str] = set()   # NIM yang kolom rata/IPK-nya dihitung ulang di akhir kelompok()
+        self._statistik: StatistikKohort | None = None  # dibangun saat statistik diminta pertama kali
+        # Selama GROUP BY pertama berjalan di koneksi baca terpisah: perubahan (matkul, lama, baru) sesudah snapshot
+        self._delta_statistik: list[tuple[str, int | None, int | None]] | None = None
+
+    def _migrasi_riwayat(self):
+        """Basis data lama (satu nilai per mata kuliah): salin ke tabel berkunci semester, semua di semester bawaan."""
+        self.conn.executescript(f"""
+            BEGIN;
+            ALTER TABLE nilai RENAME TO nilai_lama;
+            {self.SKEMA}
+            INSERT INTO nilai (nim, matkul, semester, sks, nilai)
+                SELECT nim, matkul, {SEMESTER_BAWAAN}, {SKS_BAWAAN}, nilai FROM nilai_lama ORDER BY rowid;
+            DROP TABLE nilai_lama;
+            COMMIT;
+        """)
+
+    def _perbarui_agregat(self, nim: str):
+        """Menghitung ulang rata/IPK tersimpan satu Mahasiswa; di dalam kelompok() ditunda sampai sebelum COMMIT,
+        sehingga impor massal menghitung setiap Mahasiswa sekali, bukan sekali per nilai."""
+        if self._kedalaman_transaksi:
+            self._agregat_basi.add(nim)
+        else:
+            self.conn.execute(f"{self.SQL_PERBARUI_AGREGAT} WHERE nim = ?", (nim,))
+
+    def _sinkron_agregat(self):
+        """Dipanggil sebelum membaca kolom rata/IPK dan sebelum COMMIT."""
+        if self._agregat_basi:
+            self.conn.executemany(f"{self.SQL_PERBARUI_AGREGAT} WHERE nim = ?", ((nim,) for nim in self._agregat_basi))
+            self._agregat_basi.clear()
+
+    # BACA DATA
+    @_terkunci
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM mahasiswa").fetchone()[0]
+
+    @_terkunci
+    def __contains__(self, nim: str) -> bool:
+        return self.conn.execute("SELECT 1 FROM mahasiswa WHERE nim = ?", (nim,)).fetchone() is not None
+
+    def __iter__(self):
+        """Mengalirkan semua Mahasiswa (beserta nilainya) dengan satu query berurutan."""
+        with self.kunci:
+            yield from self._kelompokkan(self.conn.execute("""
+                SELECT m.nim, m.nama, n.matkul, n.nilai, n.semester, n.sks
+                FROM mahasiswa m LEFT JOIN nilai n ON n.nim = m.nim
+                ORDER BY m.id, n.semester, n.rowid
+            """))
+
+    @staticmethod
+    def _kelompokkan(baris):
+        """Menyusun baris (nim, nama, matkul, nilai, semester, sks) yang urut per Mahasiswa menjadi objek."""
+        mhs = None
+        for nim, nama, matkul, nilai, semester, sks in baris:
+            if mhs is None or mhs.nim != nim:
+                if mhs is not None:
+                    yield mhs
+                mhs = Mahasiswa(nama, nim)
+            if matkul is not None:
+                mhs.tambah_nilai_matkul(matkul, nilai, semester, sks)
+        if mhs is not None:
+            yield mhs
+
+    def _muat(self, baris) -> Mahasiswa | None:
+        if baris is None:
+            return None
+        nim, nama = baris
+        mhs = Mahasiswa(nama, nim)
+        for matkul, nilai, semester, sks in self.conn.execute(
+                "SELECT matkul, nilai, semester, sks FROM nilai WHERE nim = ? ORDER BY semester, rowid", (nim,)):
+            mhs.tambah_nilai_matkul(matkul, nilai, semester, sks)
+        return mhs
+
+    @_terkunci
+    def cari(self, nim: str) -> Mahasiswa | None:
+        return self._muat(self.conn.execute("SELECT nim, nama FROM mahasiswa WHERE nim = ?", (nim,)).fetchone())
+
+    @_terkunci
+    def cari_id(self, id_baris: int) -> Mahasiswa | None:
+        return self._muat(self.conn.execute("SELECT nim, nama FROM mahasiswa WHERE id = ?", (id_baris,)).fetchone())
+
+    @_terkunci
+    def id_dari(self, nim: str) -> int:
+        baris = self.conn.execute("SELECT id FROM mahasiswa WHERE nim = ?", (nim,)).fetchone()
+        if baris is None:
+            raise KeyError(nim)
+        return baris[0]
+
+    def ringkasan(self):
+        """Mengalirkan (id, nama, nim, rata-rata, IPK) per Mahasiswa dari kolom agregat tersimpan."""
+        with self.kunci:
+            self._sinkron_agregat()
+            yield from self.conn.execute(f"{self.SQL_RINGKASAN} ORDER BY id")
+
+    @_terkunci
+    def ringkasan_rentang(self, awal: int, jumlah: int) -> list[tuple]:
+        """Seperti ringkasan(), tetapi hanya baris pada posisi [awal, awal + jumlah)."""
+        self._sinkron_agregat()
+        return self.conn.execute(f"{self.SQL_RINGKASAN} ORDER BY id LIMIT ? OFFSET ?", (jumlah, awal)).fetchall()
+
+    @_terkunci
+    def ringkasan_id(self, daftar_id: list[int]) -> list[tuple]:
+        """Seperti ringkasan(), tetapi untuk id baris tertentu (urutan mengikuti daftar_id)."""
+        self._sinkron_agregat()
+        per_id = {}
+        for i in range(0, len(daftar_id), 500):   # batas jumlah parameter SQLite
+            potongan = daftar_id[i:i + 500]
+            per_id.update((baris[0], baris) for baris in self.conn.execute(
+                f"{self.SQL_RINGKASAN} WHERE id IN ({','.join('?' * len(potongan))})", potongan))
+        return [per_id[i] for i in daftar_id if i in per_id]
+
+    @_terkunci
+    def data_ekspor_setelah(self, id_terakhir: int, jumlah: int) -> tuple[int, list[tuple]]:
+        """Satu query (rentang kunci primer, bukan OFFSET) untuk paling banyak `jumlah` Mahasiswa sesudah
+        id_terakhir beserta semua percobaan nilainya, plus id baris terakhirnya."""
+        baris = self.conn.execute("""
+            SELECT m.id, m.nim, m.nama, n.matkul, n.nilai, n.semester, n.sks
+            FROM (SELECT id, nim, nama FROM mahasiswa WHERE id > ? ORDER BY id LIMIT ?) m
+            LEFT JOIN nilai n ON n.nim = m.nim
+            ORDER BY m.id, n.semester, n.rowid
+        """, (id_terakhir, jumlah)).fetchall()
+        if not baris:
+            return id_terakhir, []
+        return baris[-1][0], [mhs.data_ekspor() for mhs in self._kelompokkan(b[1:] for b in baris)]
+
+    @_terkunci
+    def percobaan_matkul(self, nim: str, matkul: str) -> list[tuple[int, int, int]]:
+        """(semester, sks, nilai) setiap percobaan satu mata kuliah milik NIM, dibaca dari kunci primer tabel nilai."""
+        return self.conn.execute(
+            "SELECT semester, sks, nilai FROM nilai WHERE nim = ? AND matkul = ? ORDER BY semester", (nim, matkul)
+        ).fetchall()
+
+    @_terkunci
+    def cari_teks(self, teks: str) -> list[int]:
+        """Awalan NIM memakai rentang pada indeks unik NIM; bagian nama memakai pemindaian instr()."""
+        if teks.isdigit():
+            baris = self.conn.execute("SELECT id FROM mahasiswa WHERE nim >= ? AND nim < ? ORDER BY id",
+                                      (teks, _batas_atas_awalan(teks)))
+        else:
+            baris = self.conn.execute("SELECT id FROM mahasiswa WHERE instr(lower(nama), ?) > 0 ORDER BY id",
+                                      (teks.lower(),))
+        return [i for (i,) in baris]
+
+    # Ekspresi ORDER BY per kolom, masing-masing tercakup indeks (id sebagai pemecah seri ada di setiap indeks)
+    URUTAN_SQL = {"nama": ("lower(nama)",), "nim": ("length(nim)", "nim"), "rata": ("rata",), "ipk": ("ipk",)}
+
+    @_terkunci
+    def id_urut(self, kolom: str, menurun: bool = False, awal: int = 0, jumlah: int | None = None) -> list[int]:
+        """Id baris terurut menurut kolom ("nama", "nim", "rata", "ipk") pada posisi [awal, awal + jumlah)."""
+        self._sinkron_agregat()
+        arah = " DESC" if menurun else ""
+        urutan = ", ".join(f"{ekspresi}{arah}" for ekspresi in self.URUTAN_SQL[kolom] + ("id",))
+        baris = self.conn.execute(f"SELECT id FROM mahasiswa ORDER BY {urutan} LIMIT ? OFFSET ?",
+                                  (-1 if jumlah is None else jumlah, awal))
+        return [i for (i,) in baris]
+
+    @_terkunci
+    def posisi_urut(self, id_baris: int, kolom: str, menurun: bool = False) -> int:
+        """Banyaknya baris sebelum id_baris menurut kolom, dihitung pada rentang indeks kolom itu."""
+        self._sinkron_agregat()
+        kunci = ", ".join(self.URUTAN_SQL[kolom] + ("id",))
+        nilai = self.conn.execute(f"SELECT {kunci} FROM mahasiswa WHERE id = ?", (id_baris,)).fetchone()
+        if nilai is None:
+            raise KeyError(id_baris)
+        banding = ">" if menurun else "<"
+        return self.conn.execute(
+            f"SELECT COUNT(*) FROM mahasiswa WHERE ({kunci}) {banding} ({', '.join('?' * len(nilai))})", nilai
+        ).fetchone()[0]
+
+    @_terkunci
+    def peringkat(self, n: int, kolom: str = "ipk", terbawah: bool = False) -> list[tuple]:
+        """Ringkasan n Mahasiswa teratas (atau terbawah) menurut kolom, mis. daftar dekan atau masa percobaan."""
+        return self.ringkasan_id(self.id_urut(kolom, menurun=not terbawah, jumlah=n))
+
+    def statistik_matkul(self) -> Dict[str, Dict[str, Any]]:
+        """Ember nilai dibaca sekali dengan GROUP BY, lalu diperbarui inkremental oleh operasi tulis.
+
+        GROUP BY pertama (detik-an untuk ratusan ribu nilai) berjalan di koneksi baca sendiri tanpa memegang
+        self.kunci: snapshot WAL dikunci di bawah self.kunci, perubahan sesudahnya dicatat di _delta_statistik,
+        lalu diterapkan ke hasil GROUP BY sebelum dipasang. Di dalam kelompok() (data belum di-commit) atau untuk
+        basis data di memori, GROUP BY tetap dijalankan di koneksi utama."""
+        import sqlite3
+        with self.kunci:
+            if self._statistik is None and (self._kedalaman_transaksi or self._delta_statistik is not None
+                                            or self.path in ("", ":memory:")):
+                self._statistik = StatistikKohort.dari_hitungan(self.conn.execute(self.SQL_HITUNGAN_NILAI))
+            if self._statistik is not None:
+                return self._statistik.ringkasan()
+            baca = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+            baca.execute("BEGIN")
+            baca.execute("SELECT COUNT(*) FROM sqlite_master")   # membuka snapshot baca sekarang
+            self._delta_statistik = []
+        try:
+            kohort = StatistikKohort.dari_hitungan(baca.execute(self.SQL_HITUNGAN_NILAI))
+        except BaseException:
+            with self.kunci:
+                self._delta_statistik = None
+            raise
+        finally:
+            baca.close()
+        with self.kunci:
+            delta, self._delta_statistik = self._delta_statistik, None
+            if self._statistik is None:   # bisa sudah dibangun pemanggil lain di koneksi utama
+                for matkul, lama, baru in delta:
+                    kohort.ganti(matkul, lama, baru)
+                self._statistik = kohort
+            return self._statistik.ringkasan()
+
+    @_terkunci
+    def hitung_ulang_setelah(self, id_terakhir: int, jumlah: int) -> list[tuple]:
+        """Menghitung ulang kolom rata/IPK tersimpan dari tabel nilai untuk paling banyak `jumlah` baris sesudah
+        id_terakhir, lalu mengembalikan ringkasannya."""
+        daftar_id = [i for (i,) in self.conn.execute("SELECT id FROM mahasiswa WHERE id > ? ORDER BY id LIMIT ?",
+                                                     (id_terakhir, jumlah))]
+        if not daftar_id:
+            return []
+        self._sinkron_agregat()
+        rentang = (daftar_id[0], daftar_id[-1])
+        self.conn.execute(f"{self.SQL_PERBARUI_AGREGAT} WHERE id BETWEEN ? AND ?", rentang)
+        return self.conn.execute(f"{self.SQL_RINGKASAN} WHERE id BETWEEN ? AND ? ORDER BY id", rentang).fetchall()
+
+    # TULIS DATA
+    @_terkunci
+    def tambah_mahasiswa(self, nama: str, nim: str) -> Mahasiswa:
+        try:
+            self.conn.execute("INSERT INTO mahasiswa (nim, nama) VALUES (?, ?)", (nim, nama))
+        except self.conn.IntegrityError:
+            raise KeyError(f"NIM {nim} sudah terdaftar") from None
+        return Mahasiswa(nama, nim)
+
+    @_terkunci
+    def edit_mahasiswa(self, mhs: Mahasiswa, nama: str, nim: str):
+        try:
+            self.conn.execute("UPDATE mahasiswa SET nim = ?, nama = ? WHERE nim = ?", (nim, nama, mhs.nim))
+        except self.conn.IntegrityError:
+            raise KeyError(f"NIM {nim} sudah terdaftar") from None
+        if mhs.nim in self._agregat_basi:
+            self._agregat_basi.discard(mhs.nim)
+            self._agregat_basi.add(nim)
+        mhs.nim = nim
+        mhs.nama = nama
+
+    # Objek Mahasiswa milik pemanggil bisa basi (dibaca sebelum mutasi lain), jadi nilai lama, semester/SKS
+    # bawaan, dan delta statistik selalu diambil dari tabel nilai; objek itu hanya ikut diperbarui.
+    @_terkunci
+    def hapus_mahasiswa(self, mhs: Mahasiswa):
+        efektif = self.conn.execute("SELECT matkul, nilai FROM nilai_efektif WHERE nim = ?", (mhs.nim,)).fetchall()
+        self.conn.execute("DELETE FROM mahasiswa WHERE nim = ?", (mhs.nim,))
+        for matkul, nilai in efektif:
+            self._ganti_statistik(matkul, nilai, None)
+
+    @_terkunci
+    def simpan_nilai(self, mhs: Mahasiswa, matkul: str, nilai: int, semester: int | None = None,
+                     sks: int | None = None) -> tuple[int, int]:
+        percobaan = self.percobaan_matkul(mhs.nim, matkul)
+        if not percobaan and mhs.nim not in self:
+            raise KeyError(f"Mahasiswa {mhs.nim} tidak terdaftar")
+        if semester is None:
+            semester = percobaan[-1][0] if percobaan else SEMESTER_BAWAAN
+        if sks is None:
+            sama = next((p for p in percobaan if p[0] == semester), None)
+            sks = sama[1] if sama else (percobaan[-1][1] if percobaan else SKS_BAWAAN)
+        semester, sks = mhs.tambah_nilai_matkul(matkul, nilai, semester, sks)   # juga memeriksa rentang
+        self.conn.execute("""
+            INSERT INTO nilai (nim, matkul, semester, sks, nilai) VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (nim, matkul, semester) DO UPDATE SET sks = excluded.sks, nilai = excluded.nilai
+        """, (mhs.nim, matkul, semester, sks, nilai))
+        self._perbarui_agregat(mhs.nim)
+        baru = max([p for p in percobaan if p[0] != semester] + [(semester, sks, nilai)])
+        self._ganti_statistik(matkul, percobaan[-1][2] if percobaan else None, baru[2])
+        return semester, sks
+
+    @_terkunci
+    def hapus_nilai(self, mhs: Mahasiswa, matkul: str, semester: int | None = None) -> bool:
+        percobaan = self.percobaan_matkul(mhs.nim, matkul)
+        sisa = [p for p in percobaan if semester is not None and p[0] != semester]
+        mhs.hapus_nilai_matkul(matkul, semester)
+        if len(sisa) == len(percobaan):
+            return False
+        if semester is None:
+            self.conn.execute("DELETE FROM nilai WHERE nim = ? AND matkul = ?", (mhs.nim, matkul))
+        else:
+            self.conn.execute("DELETE FROM nilai WHERE nim = ? AND matkul = ? AND semester = ?",
+                              (mhs.nim, matkul, semester))
+        self._perbarui_agregat(mhs.nim)
+        self._ganti_statistik(matkul, percobaan[-1][2], sisa[-1][2] if sisa else None)
+        return True
+
+    def _ganti_statistik(self, matkul: str, lama: int | None, baru: int | None):
+        """Meneruskan perubahan satu nilai efektif ke statistik kohort, dan ke _delta_statistik jika statistik
+        pertama sedang dibangun di koneksi baca."""
+        if self._statistik is not None:
+            self._statistik.ganti(matkul, lama, baru)
+        if self._delta_statistik is not None:
+            self._delta_statistik.append((matkul, lama, baru))
+
+    @contextmanager
+    def kelompok(self):
+        """Menjalankan banyak mutasi dalam satu transaksi (jauh lebih cepat untuk sisipan massal)."""
+        with self.kunci:
+            if self._kedalaman_transaksi == 0:
+                self.conn.execute("BEGIN")
+            self._kedalaman_transaksi += 1
+            try:
+                yield
+            except BaseException:
+                self._kedalaman_transaksi -= 1
+                if self._kedalaman_transaksi == 0:
+                    self._agregat_basi.clear()
+                    self.conn.execute("ROLLBACK")
+                raise
+            self._kedalaman_transaksi -= 1
+            if self._kedalaman_transaksi == 0:
+                self._sinkron_agregat()
+                self.conn.execute("COMMIT")
+
+    @_terkunci
+    def tutup(self):
+        self.conn.close()
+
+def buat_repositori(backend: str = BACKEND_DATA, lokasi: str = LOKASI_DATA):
+    """Membuat repositori sesuai konfigurasi: "memori", "jurnal", atau "sqlite"."""
+    if backend == "memori":
+        return RepositoriMemori()
+    if backend == "jurnal":
+        return RepositoriJurnal(lokasi)
+    if backend == "sqlite":
+        os.makedirs(lokasi, exist_ok=True)
+        return RepositoriSQLite(os.path.join(lokasi, "mahasiswa.db"))
+    raise ValueError(f"Backend data tidak dikenal: {backend}")
+
+# UNDO/REDO
+BATAS_UNDO = 100                # jumlah batch yang bisa di-undo
+BATAS_LANGKAH_UNDO = 200_000    # batch lebih besar dari ini (mis. impor raksasa) tidak dicatat
+
+class BatchPerintah:
+    """Satu unit undo/redo: operasi maju (urut) dan kebalikannya (diterapkan dari belakang)."""
+    __slots__ = ("nama", "maju", "mundur", "terlalu_besar")
+
+    def __init__(self, nama: str):
+        self.nama = nama
+        self.maju: list[tuple] = []
+        self.mundur: list[tuple] = []
+        self.terlalu_besar = False
+
+    def __len__(self) -> int:
+        return len(self.maju) + len(self.mundur)
+
+class LogPerintah:
+    """Lapisan mutasi berpola command di atas repositori, dengan tumpukan undo/redo terbatas.
+
+    Setiap mutasi dicatat sebagai operasi (op, nim, ...) beserta kebalikannya, dengan Mahasiswa
+    dirujuk lewat NIM agar tetap berlaku setelah objeknya dibuat ulang. Mutasi di dalam `batch()`
+    (per thread, boleh bersarang) menjadi satu unit undo, mis. seluruh impor CSV. Operasi baca (termasuk
+    len(), `in`, dan iterasi) serta kelompok() diteruskan ke repositori, jadi objek ini bisa dipakai di
+    tempat repositori (impor_csv, ekspor).
+    Undo/redo diterapkan langsung ke repositori; langkah yang targetnya sudah tidak ada dilewati.
+    """
+    UKURAN_KELOMPOK = 1_000   # langkah per repo.kelompok() saat undo/redo, agar kunci cepat dilepas
+
+    def __init__(self, repo, batas: int = BATAS_UNDO, batas_langkah: int = BATAS_LANGKAH_UNDO):
+        self.repo = repo
+        self.batas_langkah = batas_langkah
+        self._undo: deque[BatchPerintah] = deque(maxlen=batas)
+        self._redo: list[BatchPerintah] = []
+        self._kunci = threading.Lock()
+        self._lokal = threading.local()   # batch yang sedang terbuka di thread ini
+
+    def __getattr__(self, nama: str):
+        return getattr(self.repo, nama)
+
+    # Metode khusus dicari pada kelas, tidak lewat __getattr__
+    def __len__(self) -> int:
+        return len(self.repo)
+
+    def __contains__(self, nim: str) -> bool:
+        return nim in self.repo
+
+    def __iter__(self):
+        return iter(self.repo)
+
+    @contextmanager
+    def batch(self, nama: str):
+        """Mengelompokkan semua mutasi di dalam blok menjadi satu unit undo (juga jika blok gagal/dibatalkan)."""
+        if getattr(self._lokal, "batch", None) is not None:
+            yield   # batch bersarang bergabung dengan batch terluar
+            return
+        batch = self._lokal.batch = BatchPerintah(nama)
+        try:
+            yield
+        finally:
+            self._lokal.batch = None
+            with self._kunci:
+                if batch.terlalu_besar:
+                    # Riwayat sebelum batch ini tidak bisa lagi dibalik dengan aman
+                    self._undo.clear()
+                    self._redo.clear()
+                elif batch.maju:
+                    self._undo.append(batch)
+                    self._redo.clear()
+
+    def _catat(self, maju: tuple, *mundur: tuple):
+        batch = self._lokal.batch
+        if batch.terlalu_besar:
+            return
+        batch.maju.append(maju)
+        batch.mundur.extend(mundur)
+        if len(batch) > self.batas_langkah:
+            batch.terlalu_besar = True
+            batch.maju.clear()
+            batch.mundur.clear()
+
+    # MUTASI
+    def tambah_mahasiswa(self, nama: str, nim: str) -> Mahasiswa:
+        with self.batch(f"Tambah Mahasiswa {nim}"), self.repo.kunci:
+            mhs = self.repo.tambah_mahasiswa(nama, nim)
+            self._catat(("tambah", nim, nama, []), ("hapus", nim))
+            return mhs
+
+    def edit_mahasiswa(self, mhs: Mahasiswa, nama: str, nim: str):
+        with self.batch(f"Edit Mahasiswa {nim}"), self.repo.kunci:
+            nama_lama, nim_lama = mhs.nama, mhs.nim
+            self.repo.edit_mahasiswa(mhs, nama, nim)
+            self._catat(("edit", nim_lama, nama, nim), ("edit", nim, nama_lama, nim_lama))
+
+    def hapus_mahasiswa(self, mhs: Mahasiswa):
+        with self.batch(f"Hapus Mahasiswa {mhs.nim}"), self.repo.kunci:
+            lama = self.repo.cari(mhs.nim) or mhs   # objek di tangan pemanggil bisa basi (SQLite)
+            self.repo.hapus_mahasiswa(mhs)
+            self._catat(("hapus", lama.nim), ("tambah", lama.nim, lama.nama, lama.riwayat_nilai()))
+
+    def simpan_nilai(self, mhs: Mahasiswa, matkul: str, nilai: int, semester: int | None = None,
+                     sks: int | None = None) -> tuple[int, int]:
+        with self.batch(f"Nilai {matkul} ({mhs.nim})"), self.repo.kunci:
+            percobaan = {p[0]: p for p in self.repo.percobaan_matkul(mhs.nim, matkul)}
+            semester, sks = self.repo.simpan_nilai(mhs, matkul, nilai, semester, sks)
+            sama = percobaan.get(semester)
+            self._catat(("nilai", mhs.nim, matkul, nilai, semester, sks),
+                        ("nilai", mhs.nim, matkul, sama[2], semester, sama[1]) if sama
+                        else ("hapus_nilai", mhs.nim, matkul, semester))
+            return semester, sks
+
+    def hapus_nilai(self, mhs: Mahasiswa, matkul: str, semester: int | None = None) -> bool:
+        with self.batch(f"Hapus Nilai {matkul} ({mhs.nim})"), self.repo.kunci:
+            dihapus = [p for p in self.repo.percobaan_matkul(mhs.nim, matkul) if semester is None or p[0] == semester]
+            if not self.repo.hapus_nilai(mhs, matkul, semester):
+                return False
+            self._catat(("hapus_nilai", mhs.nim, matkul, semester),
+                        *[("nilai", mhs.nim, matkul, nilai, smt, sks) for smt, sks, nilai in dihapus])
+            return True
+
+    # UNDO/REDO
+    @property
+    def label_undo(self) -> str | None:
+        """Nama batch yang akan dibatalkan oleh undo(), atau None jika tumpukan kosong."""
+        with self._kunci:
+            return self._undo[-1].nama if self._undo else None
+
+    @property
+    def label_redo(self) -> str | None:
+        with self._kunci:
+            return self._redo[-1].nama if self._redo else None
+
+    def ukuran_undo(self, redo: bool = False) -> int:
+        """Jumlah langkah batch teratas (untuk memutuskan apakah perlu dijalankan di latar belakang)."""
+        with self._kunci:
+            tumpukan = self._redo if redo else self._undo
+            return len(tumpukan[-1]) if tumpukan else 0
+
+    def undo(self, progres=None) -> str | None:
+        """Membalik batch terakhir; mengembalikan namanya, atau None jika tidak ada yang bisa di-undo."""
+        with self._kunci:
+            if not self._undo:
+                return None
+            batch = self._undo.pop()
+        self._terapkan_semua(batch.mundur[::-1], progres)
+        with self._kunci:
+            self._redo.append(batch)
+        return batch.nama
+
+    def redo(self, progres=None) -> str | None:
+        """Menerapkan ulang batch yang terakhir di-undo."""
+        with self._kunci:
+            if not self._redo:
+                return None
+            batch = self._redo.pop()
+        self._terapkan_semua(batch.maju, progres)
+        with self._kunci:
+            self._undo.append(batch)
+        return batch.nama
+
+    def _terapkan_semua(self, operasi: list[tuple], progres=None):
+        """`progres(selesai, total)` dipanggil setelah setiap kelompok langkah."""
+        for awal in range(0, len(operasi), self.UKURAN_KELOMPOK):
+            with self.repo.kelompok():
+                for op in operasi[awal:awal + self.UKURAN_KELOMPOK]:
+                    self._terapkan(*op)
+            if progres is not None:
+                progres(min(awal + self.UKURAN_KELOMPOK, len(operasi)), len(operasi))
+
+    def _terapkan(self, op: str, nim: str, *argumen):
+        repo = self.repo
+        if op == "tambah":
+            nama, riwayat = argumen
+            if nim in repo:
+                return
+            mhs = repo.tambah_mahasiswa(nama, nim)
+            for matkul, semester, sks, nilai in riwayat:
+                repo.simpan_nilai(mhs, matkul, nilai, semester, sks)
+            return
+        mhs = repo.cari(nim)
+        if mhs is None:
+            return
+        if op == "hapus":
+            repo.hapus_mahasiswa(mhs)
+        elif op == "edit":
+            nama, nim_baru = argumen
+            if nim_baru == nim or nim_baru not in repo:
+                repo.edit_mahasiswa(mhs, nama, nim_baru)
+        elif op == "nilai":
+            repo.simpan_nilai(mhs, *argumen)
+        elif op == "hapus_nilai":
+            repo.hapus_nilai(mhs, *argumen)
+        else:
+            raise ValueError(f"Operasi tidak dikenal: {op}")
+
+def cek_input(nama: str, nim: str, matkul: str | None = None, nilai: str | None = None,
+              semester: str | None = None, sks: str | None = None) -> str | None:
+    """Aturan validasi input Mahasiswa dan Nilai Matkul. Mengembalikan pesan error, atau None jika valid.
+
+    Semester dan SKS boleh kosong (memakai percobaan terakhir atau nilai bawaan).
+    """
+    if nama and not all(c.isalpha() or c.isspace() or c == '.' for c in nama):
+        return "Nama hanya boleh huruf, spasi, atau titik!"
+    if nim and not nim.isdigit():
+        return "NIM harus berisi angka!"
+
+    if matkul or nilai:
+        if not matkul:
+            return "Nama Mata Kuliah tidak boleh kosong!"
+        if not nilai or not nilai.isdecimal():
+            return "Nilai harus berupa angka (0 - 100)!"
+        if not (0 <= int(nilai) <= 100):
+            return "Nilai harus berada dalam rentang 0 - 100!"
+        if semester and not (semester.isdecimal() and 1 <= int(semester) <= MAKS_SEMESTER):
+            return f"Semester harus berupa angka (1 - {MAKS_SEMESTER})!"
+        if sks and not (sks.isdecimal() and 1 <= int(sks) <= MAKS_SKS):
+            return f"SKS harus berupa angka (1 - {MAKS_SKS})!"
+    return None
+
+class LaporanImpor:
+    """Ringkasan hasil impor massal beserta error per baris (hanya BATAS_ERROR_DISIMPAN pertama yang disimpan)."""
+    BATAS_ERROR_DISIMPAN = 1_000
+
+    def __init__(self, byte_total: int = 0):
+        self.byte_total = byte_total
+        self.byte_terbaca = 0
+        self.baris_diproses = 0
+        self.mahasiswa_baru = 0
+        self.nilai_disimpan = 0
+        self.jumlah_error = 0
+        self.error: list[tuple[int, str]] = []
+
+    def catat_error(self, nomor_baris: int, pesan: str):
+        self.jumlah_error += 1
+        if len(self.error) < self.BATAS_ERROR_DISIMPAN:
+            self.error.append((nomor_baris, pesan))
+
+    def ringkasan(self) -> str:
+        teks = (f"{self.baris_diproses} baris diproses, {self.mahasiswa_baru} Mahasiswa baru, "
+                f"{self.nilai_disimpan} nilai disimpan, {self.jumlah_error} baris gagal.")
+        for nomor_baris, pesan in self.error[:10]:
+            teks += f"\nBaris {nomor_baris}: {pesan}"
+        if self.jumlah_error > 10:
+            teks += f"\n... dan {self.jumlah_error - 10} error lainnya"
+        return teks
+
+def _baris_teks(f_biner, laporan: LaporanImpor):
+    """Membaca berkas biner baris demi baris sambil mencatat jumlah byte terbaca (untuk progress bar)."""
+    for nomor, baris in enumerate(f_biner):
+        laporan.byte_terbaca += len(baris)
+        teks = baris.decode("utf-8", errors="replace")
+        yield teks.lstrip("\ufeff") if nomor == 0 else teks
+
+def impor_csv(repo, path: str, ukuran_batch: int = 5_000, progres=None) -> LaporanImpor:
+    """Mengimpor CSV (nim, nama, matkul, nilai[, semester, sks]) secara streaming ke repositori.
+
+    Baris divalidasi dengan aturan yang sama dengan form input (tanpa dialog), error dikumpulkan
+    ke laporan, dan baris valid disimpan per batch dalam satu `repo.kelompok()`. Memori yang dipakai
+    konstan terhadap ukuran berkas. `progres(laporan)` dipanggil setelah setiap batch.
+
+    Kunci repositori dilepas di antara batch (CRUD GUI bisa berjalan), jadi Mahasiswa dicari ulang di
+    setiap batch; baris untuk Mahasiswa yang dihapus di tengah impor dicatat sebagai error baris.
+    """
+    laporan = LaporanImpor(os.path.getsize(path))
+    with open(path, "rb") as f:
+        pembaca = csv.reader(_baris_teks(f, laporan))
+        selesai = False
+        while not selesai:
+            with repo.kelompok():
+                mhs_terakhir: Mahasiswa | None = None   # baris berurutan biasanya milik Mahasiswa yang sama
+                for _ in range(ukuran_batch):
+                    kolom = next(pembaca, None)
+                    if kolom is None:
+                        selesai = True
+                        break
+                    nomor_baris = pembaca.line_num
+                    nim, nama, matkul, nilai, semester, sks = [k.strip() for k in (kolom + [""] * 6)[:6]]
+                    if nomor_baris == 1 and nim.lower() == "nim":
+                        continue   # baris header
+                    laporan.baris_diproses += 1
+
+                    pesan = cek_input(nama, nim, matkul, nilai, semester, sks)
+                    if pesan is None and not nim:
+                        pesan = "NIM harus diisi!"
+                    if pesan:
+                        laporan.catat_error(nomor_baris, pesan)
+                        continue
+
+                    if mhs_terakhir is None or mhs_terakhir.nim != nim:
+                        mhs_terakhir = repo.cari(nim)
+                    if mhs_terakhir is None:
+                        if not nama:
+                            laporan.catat_error(nomor_baris, f"NIM {nim} belum terdaftar dan Nama kosong!")
+                            continue
+                        mhs_terakhir = repo.tambah_mahasiswa(nama, nim)
+                        laporan.mahasiswa_baru += 1
+                    if matkul:
+                        try:
+                            repo.simpan_nilai(mhs_terakhir, matkul, int(nilai),
+                                              int(semester) if semester else None, int(sks) if sks else None)
+                        except KeyError:
+                            laporan.catat_error(nomor_baris, f"NIM {nim} sudah tidak terdaftar!")
+                            mhs_terakhir = None
+                            continue
+                        laporan.nilai_disimpan += 1
+            if progres is not None:
+                progres(laporan)
+    return laporan
+
+# EKSPOR
+KOLOM_EKSPOR_CSV = ["nim", "nama", "rata_rata", "ipk", "sks", "jumlah_matkul"]
+UKURAN_BUFFER_EKSPOR = 1 << 20
+
+def _format_csv(potongan: list[tuple]) -> str:
+    """Roster: satu baris per Mahasiswa."""
+    buffer = io.StringIO()
+    penulis = csv.writer(buffer)
+    for nim, nama, rata, ipk, riwayat, transkrip in potongan:
+        penulis.writerow([nim, nama, f"{rata:.2f}", f"{ipk:.2f}", transkrip[-1][3] if transkrip else 0,
+                          len({matkul for matkul, _, _, _ in riwayat})])
+    return buffer.getvalue()
+
+def _format_jsonl(potongan: list[tuple]) -> str:
+    """Roster beserta transkrip lengkap: satu objek JSON per baris."""
+    return "".join(json.dumps({
+        "nim": nim, "nama": nama, "rata_rata": rata, "ipk": ipk,
+        "nilai": [{"semester": semester, "matkul": matkul, "sks": sks, "nilai": nilai, "huruf": huruf}
+                  for semester, matkul, sks, nilai, huruf in baris_transkrip(riwayat)],
+        "semester": [{"semester": semester, "sks": sks, "ips": ips, "sks_kumulatif": sks_kum, "ipk": ipk_kum}
+                     for semester, sks, ips, sks_kum, ipk_kum in transkrip],
+    }, ensure_ascii=False) + "\n" for nim, nama, rata, ipk, riwayat, transkrip in potongan)
+
+def format_transkrip(data: tuple) -> str:
+    """Transkrip teks polos satu Mahasiswa dari Mahasiswa.data_ekspor(), dikelompokkan per semester."""
+    nim, nama, rata, ipk, riwayat, transkrip = data
+    per_semester = {baris[0]: baris for baris in transkrip}
+    baris = ["TRANSKRIP NILAI", f"Nama : {nama}", f"NIM  : {nim}", ""]
+    for semester, percobaan in groupby(baris_transkrip(riwayat), key=lambda b: b[0]):
+        baris.append(f"Semester {semester}")
+        for _, matkul, sks, nilai, huruf in percobaan:
+            baris.append(f"  {matkul:<30} {sks:>2} SKS  {nilai:>3}  {huruf}")
+        _, sks, ips, sks_kum, ipk_kum = per_semester[semester]
+        baris.append(f"  IPS {ips:.2f} ({sks} SKS), IPK {ipk_kum:.2f} ({sks_kum} SKS)")
+        baris.append("")
+    baris.append(f"Rata-rata: {rata:.2f}  IPK: {ipk:.2f}  Total SKS: {transkrip[-1][3] if transkrip else 0}")
+    baris.append("=" * 60)
+    return "\n".join(baris) + "\n\n"
+
+def _format_txt(potongan: list[tuple]) -> str:
+    return "".join(map(format_transkrip, potongan))
+
+# Fungsi pemformat harus di level modul agar bisa dikirim ke process pool
+FORMAT_EKSPOR = {"csv": _format_csv, "jsonl": _format_jsonl, "txt": _format_txt}
+
+def format_dari_path(path: str) -> str:
+    """Format ekspor menurut ekstensi berkas ("csv", "jsonl", "txt"); selain itu CSV."""
+    ekstensi = os.path.splitext(path)[1].lower().lstrip(".")
+    return ekstensi if ekstensi in FORMAT_EKSPOR else "csv"
+
+def ekspor(repo, path: str, format: str = "csv", pekerja: int | None = None, ukuran_potongan: int = 1_000,
+           progres=None) -> int:
+    """Mengekspor seluruh Mahasiswa ke CSV (roster), JSON Lines (roster + transkrip), atau teks (transkrip).
+
+    Data diambil per potongan lewat repo.data_ekspor_setelah() (kunci hanya dipegang per potongan) dan ditulis
+    lewat buffer besar, jadi memori konstan terhadap jumlah Mahasiswa. Potongan berikutnya dimulai sesudah id
+    baris terakhir, bukan sesudah posisi, sehingga penghapusan selama ekspor (CRUD tetap berjalan) tidak
+    membuat Mahasiswa lain terlewat. Dengan pekerja > 1 potongan diformat di process pool, paling banyak 2 x
+    pekerja potongan menunggu, dan hasilnya ditulis sesuai urutan. Bawaan pekerja: satu proses untuk CSV
+    (pemformatan lebih murah dari pengiriman data antar proses), semua CPU untuk format transkrip. Berkas
+    ditulis ke path sementara lalu diganti secara atomik, sehingga ekspor yang gagal/dibatalkan tidak
+    meninggalkan berkas setengah jadi. `progres(jumlah, total)` dipanggil setelah setiap potongan ditulis.
+    Mengembalikan jumlah Mahasiswa yang diekspor.
+    """
+    format_potongan = FORMAT_EKSPOR[format]
+    if pekerja is None:
+        pekerja = 1 if format == "csv" else os.cpu_count() or 1
+    total = len(repo)
+    jumlah = 0
+    path_sementara = path + ".tmp"
+    pool = None
+    if pekerja > 1:
+        import multiprocessing   # hanya dimuat jika benar-benar dipakai
+        from concurrent.futures import ProcessPoolExecutor
+        # spawn: fork dari proses yang punya thread (Tk, pekerja latar belakang) bisa deadlock
+        pool = ProcessPoolExecutor(pekerja, mp_context=multiprocessing.get_context("spawn"))
+    try:
+        with open(path_sementara, "w", encoding="utf-8", newline="", buffering=UKURAN_BUFFER_EKSPOR) as f:
+            def tulis(teks: str, banyak: int):
+                nonlocal jumlah
+                f.write(teks)
+                jumlah += banyak
+                if progres is not None:
+                    progres(jumlah, total)
+
+            if format == "csv":
+                csv.writer(f).writerow(KOLOM_EKSPOR_CSV)
+            tertunda = deque()
+            id_terakhir = -1
+            while True:
+                id_terakhir, potongan = repo.data_ekspor_setelah(id_terakhir, ukuran_potongan)
+                if not potongan:
+                    break
+                if pool is None:
+                    tulis(format_potongan(potongan), len(potongan))
+                    continue
+                tertunda.append((pool.submit(format_potongan, potongan), len(potongan)))
+                if len(tertunda) >= 2 * pekerja:
+                    hasil, banyak = tertunda.popleft()
+                    tulis(hasil.result(), banyak)
+            while tertunda:
+                hasil, banyak = tertunda.popleft()
+                tulis(hasil.result(), banyak)
+        os.replace(path_sementara, path)
+    except BaseException:
+        if os.path.exists(path_sementara):
+            os.remove(path_sementara)
+        raise
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+    return jumlah
@@ -0,0 +1,691 @@
+"""Benchmark sederhana untuk model data Mahasiswa (tanpa membuka jendela GUI).
+
+`python benchmark.py` menjalankan mikro-benchmark; `python benchmark.py --skala` menjalankan suite skala
+(roster sintetis 1k - 1M Mahasiswa, operasi model + refresh Treeview, puncak memori tracemalloc).
+"""
+import argparse
+import compileall
+import gc
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import types
+
+from akademik import (Mahasiswa, DaftarMahasiswa, LogPerintah, RepositoriJurnal, RepositoriMemori, RepositoriSQLite,
+                  MAKS_SEMESTER, NILAI_LULUS, cek_input, ekspor, konversi_nilai_batch)
+
+UKURAN_SKALA = (1_000, 10_000, 100_000, 1_000_000)
+NAMA_DEPAN = ("Budi", "Ani", "Siti", "Agus", "Dewi", "Rudi", "Wati", "Joko")
+NAMA_BELAKANG = ("Santoso", "Wijaya", "Lestari", "Pratama", "Hidayat")
+TEMPLAT_ROSTER = 1_000       # pola nilai berbeda pada roster sintetis
+SEMESTER_ROSTER = 8
+
+
+def bench_tambah_mahasiswa(ukuran=(1_000, 10_000, 50_000), sampel: int = 1_000):
+    """Mengukur biaya rata-rata tambah + cek duplikat NIM saat jumlah Mahasiswa bertambah.
+
+    Dengan registri berindeks NIM, biaya per sisipan harus tetap datar (O(1)).
+    """
+    hasil = []
+    for n in ukuran:
+        daftar = DaftarMahasiswa()
+        for i in range(n):
+            daftar.tambah(Mahasiswa(f"Mahasiswa {i}", str(i)))
+
+        mulai = time.perf_counter()
+        for i in range(n, n + sampel):
+            nim = str(i)
+            if nim not in daftar:
+                daftar.tambah(Mahasiswa(f"Mahasiswa {i}", nim))
+        durasi = time.perf_counter() - mulai
+        hasil.append((n, durasi / sampel * 1e6))
+    return hasil
+
+
+def bench_konversi_nilai(jumlah: int = 1_000_000):
+    """Membandingkan konversi nilai satu per satu dengan konversi batch."""
+    daftar_nilai = [i % 101 for i in range(jumlah)]
+    konversi = Mahasiswa.konversi_nilai_ke_huruf_dan_bobot
+    konversi_nilai_batch(daftar_nilai[:1])   # pemanasan: NumPy baru diimpor saat batch pertama
+
+    mulai = time.perf_counter()
+    for nilai in daftar_nilai:
+        konversi(nilai)
+    satuan = time.perf_counter() - mulai
+
+    mulai = time.perf_counter()
+    konversi_nilai_batch(daftar_nilai)
+    batch = time.perf_counter() - mulai
+    return satuan, batch
+
+
+class _MahasiswaDict:
+    """Tata letak lama (sebelum __slots__/array) sebagai pembanding memori."""
+    def __init__(self, nama: str, nim: str):
+        self.nama = nama
+        self.nim = nim
+        self.matkul_nilai = {}
+
+
+def _ukur_memori(buat, jumlah_mhs: int, jumlah_matkul: int) -> int:
+    tracemalloc.start()
+    data = []
+    for i in range(jumlah_mhs):
+        mhs = buat(f"Mahasiswa {i}", str(i))
+        for j in range(jumlah_matkul):
+            # Nama dibuat ulang per Mahasiswa, seperti string hasil input/baca berkas
+            mhs.matkul_nilai["".join(("Mata Kuliah ", str(j)))] = (i + j) % 101
+        data.append(mhs)
+    puncak = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return puncak
+
+
+def bench_memori(jumlah_mhs: int = 10_000, jumlah_matkul: int = 40):
+    """Membandingkan memori tata letak dict lama dengan __slots__ + array per Mahasiswa."""
+    return _ukur_memori(_MahasiswaDict, jumlah_mhs, jumlah_matkul), _ukur_memori(Mahasiswa, jumlah_mhs, jumlah_matkul)
+
+
+def bench_muat_jurnal(jumlah_mhs: int = 100_000, jumlah_matkul: int = 10, entri_jurnal: int = 9_000):
+    """Mengukur waktu memuat snapshot + memutar ulang jurnal (target di bawah 1 detik untuk 100k Mahasiswa,
+    versi berskala diuji di tests/test_jurnal.py).
+
+    Setelah snapshot terbentuk, entri_jurnal perubahan nilai ditulis ke jurnal (di bawah ambang kompaksi,
+    sehingga tetap di jurnal saat ditutup) agar waktu muat juga mencakup pemutaran ulang.
+    """
+    with tempfile.TemporaryDirectory() as direktori:
+        repo = RepositoriJurnal(direktori, fsync=False)
+        with repo.kelompok():
+            for i in range(jumlah_mhs):
+                mhs = repo.tambah_mahasiswa(f"Mahasiswa {i}", str(i))
+                for j in range(jumlah_matkul):
+                    repo.simpan_nilai(mhs, f"Mata Kuliah {j}", (i + j) % 101)
+        repo.tutup()
+
+        repo = RepositoriJurnal(direktori, fsync=False)
+        with repo.kelompok():
+            for k in range(entri_jurnal):
+                repo.simpan_nilai(repo.cari(str(k % jumlah_mhs)), "Mata Kuliah 0", k % 101)
+        repo.tutup()
+
+        mulai = time.perf_counter()
+        repo = RepositoriJurnal(direktori)
+        detik = time.perf_counter() - mulai
+        repo.tutup()
+        return detik
+
+
+def bench_cari(jumlah_mhs: int = 100_000, kueri=("1000", "100012", "ani", "budi santoso", "wijaya 9")):
+    """Mengukur latensi filter (awalan NIM / bagian nama) lewat indeks pencarian repositori."""
+    nama_depan = ("Budi", "Ani", "Siti", "Agus", "Dewi", "Rudi", "Wati", "Joko")
+    nama_belakang = ("Santoso", "Wijaya", "Lestari", "Pratama", "Hidayat")
+    repo = RepositoriMemori()
+    for i in range(jumlah_mhs):
+        repo.tambah_mahasiswa(f"{nama_depan[i % 8]} {nama_belakang[i % 5]} {i}", str(10_000_000 + i * 7))
+
+    mulai = time.perf_counter()
+    repo.cari_teks("0")  # membangun indeks
+    bangun = time.perf_counter() - mulai
+
+    hasil = []
+    for teks in kueri:
+        mulai = time.perf_counter()
+        cocok = repo.cari_teks(teks)
+        hasil.append((teks, len(cocok), (time.perf_counter() - mulai) * 1e3))
+    return bangun, hasil
+
+
+def bench_urutan(jumlah_mhs: int = 100_000, perubahan: int = 1_000, n: int = 10):
+    """Membandingkan peringkat IPK setelah tiap perubahan nilai: struktur terurut vs sorted() penuh."""
+    repo = RepositoriMemori()
+    semua = []
+    for i in range(jumlah_mhs):
+        mhs = repo.tambah_mahasiswa(f"Mahasiswa {i}", str(i))
+        for j in range(5):
+            repo.simpan_nilai(mhs, f"Mata Kuliah {j}", (i * 7 + j * 13) % 101)
+        semua.append(mhs)
+    repo.peringkat(n)  # membangun struktur terurut
+
+    mulai = time.perf_counter()
+    for i in range(perubahan):
+        repo.simpan_nilai(semua[i * 97 % jumlah_mhs], "Mata Kuliah 0", i % 101)
+        repo.peringkat(n)
+        repo.peringkat(n, terbawah=True)
+    terurut = (time.perf_counter() - mulai) / perubahan
+
+    sampel = max(1, perubahan // 100)  # sorted() penuh jauh lebih lambat; cukup beberapa sampel
+    mulai = time.perf_counter()
+    for i in range(sampel):
+        repo.simpan_nilai(semua[i * 97 % jumlah_mhs], "Mata Kuliah 0", i % 101)
+        urut = sorted(repo.daftar, key=Mahasiswa.hitung_ipk)
+        urut[-n:], urut[:n]
+    naif = (time.perf_counter() - mulai) / sampel
+    return terurut, naif
+
+
+def bench_urutan_sqlite(jumlah_mhs: int = 100_000, perubahan: int = 200, n: int = 50):
+    """Satu perubahan nilai lalu n baris teratas menurut IPK dan posisi baris itu di RepositoriSQLite
+    (kolom agregat tersimpan berindeks), seperti tabel virtual GUI setelah CRUD."""
+    with tempfile.TemporaryDirectory() as direktori:
+        repo = RepositoriSQLite(os.path.join(direktori, "bench.db"))
+        with repo.kelompok():
+            for i in range(jumlah_mhs):
+                mhs = repo.tambah_mahasiswa(f"Mahasiswa {i}", str(i))
+                for j in range(5):
+                    repo.simpan_nilai(mhs, f"Mata Kuliah {j}", (i * 7 + j * 13) % 101)
+        mulai = time.perf_counter()
+        for i in range(perubahan):
+            nim = str(i * 97 % jumlah_mhs)
+            repo.simpan_nilai(repo.cari(nim), "Mata Kuliah 0", i % 101)
+            repo.id_urut("ipk", True, 0, n)
+            repo.posisi_urut(repo.id_dari(nim), "ipk", True)
+        waktu = (time.perf_counter() - mulai) / perubahan
+        repo.tutup()
+    return waktu
+
+
+def _statistik_brute_force(repo) -> dict:
+    """Statistik per mata kuliah dengan mengulang semua nilai setiap Mahasiswa (pembanding)."""
+    per_matkul = {}
+    for mhs in repo:
+        for matkul, nilai in mhs.matkul_nilai.items():
+            per_matkul.setdefault(matkul, []).append(nilai)
+    hasil = {}
+    for matkul in sorted(per_matkul):
+        daftar_nilai = per_matkul[matkul]
+        distribusi = {huruf: 0 for huruf in ("A+", "A", "AB", "B", "BC", "C", "D", "E")}
+        for nilai in daftar_nilai:
+            distribusi[Mahasiswa.konversi_nilai_ke_huruf_dan_bobot(nilai)[0]] += 1
+        hasil[matkul] = {"jumlah": len(daftar_nilai), "rata": float(statistics.mean(daftar_nilai)),
+                         "median": float(statistics.median(daftar_nilai)),
+                         "simpangan_baku": statistics.pstdev(daftar_nilai), "distribusi": distribusi,
+                         "lulus": sum(nilai >= NILAI_LULUS for nilai in daftar_nilai) / len(daftar_nilai)}
+    return hasil
+
+
+def bench_statistik(jumlah_mhs: int = 100_000, jumlah_matkul: int = 10, perubahan: int = 100):
+    """Statistik per mata kuliah setelah satu perubahan nilai: ember inkremental vs hitung ulang penuh.
+
+    Kesamaan hasil keduanya diuji di tests/test_statistik.py.
+    """
+    repo = RepositoriMemori()
+    semua = []
+    for i in range(jumlah_mhs):
+        mhs = repo.tambah_mahasiswa(f"Mahasiswa {i}", str(i))
+        for j in range(jumlah_matkul):
+            repo.simpan_nilai(mhs, f"Mata Kuliah {j}", (i * 7 + j * 13) % 101)
+        semua.append(mhs)
+    repo.statistik_matkul()  # membangun ember
+
+    mulai = time.perf_counter()
+    for i in range(perubahan):
+        repo.simpan_nilai(semua[i * 97 % jumlah_mhs], "Mata Kuliah 0", i % 101)
+        repo.statistik_matkul()
+    inkremental_durasi = (time.perf_counter() - mulai) / perubahan
+
+    mulai = time.perf_counter()
+    _statistik_brute_force(repo)
+    brute_force_durasi = time.perf_counter() - mulai
+    return inkremental_durasi, brute_force_durasi
+
+
+def bench_transkrip(matkul_per_semester: int = 40, perubahan: int = 1_000):
+    """Mengubah satu nilai lalu membaca transkrip (IPS/IPK per semester) untuk riwayat panjang.
+
+    Membandingkan prefix sum per semester yang diperbarui inkremental dengan membangun ulang
+    seluruh transkrip dari riwayat setiap kali.
+    """
+    mhs = Mahasiswa("Mahasiswa", "1")
+    for semester in range(1, MAKS_SEMESTER + 1):
+        for j in range(matkul_per_semester):
+            # Sebagian mata kuliah diulang di semester berikutnya
+            matkul = f"Mata Kuliah {j}" if j % 5 == 0 else f"Mata Kuliah {semester}-{j}"
+            mhs.tambah_nilai_matkul(matkul, (semester * 7 + j * 13) % 101, semester, 1 + j % 4)
+
+    mulai = time.perf_counter()
+    for i in range(perubahan):
+        mhs.tambah_nilai_matkul(f"Mata Kuliah {i % MAKS_SEMESTER + 1}-1", i % 101, i % MAKS_SEMESTER + 1, 3)
+        mhs.transkrip_semester()
+    inkremental = (time.perf_counter() - mulai) / perubahan
+
+    sampel = max(1, perubahan // 100)
+    mulai = time.perf_counter()
+    for i in range(sampel):
+        mhs.tambah_nilai_matkul(f"Mata Kuliah {i % MAKS_SEMESTER + 1}-1", i % 101, i % MAKS_SEMESTER + 1, 3)
+        mhs.hitung_ulang_total()
+        mhs.transkrip_semester()
+    bangun_ulang = (time.perf_counter() - mulai) / sampel
+    return len(mhs._riwayat) // 4, inkremental, bangun_ulang
+
+
+def bench_ekspor(jumlah_mhs: int = 100_000, jumlah_matkul: int = 10):
+    """Waktu ekspor per format (satu proses vs process pool) dan puncak memori ekspor streaming.
+
+    Puncak memori diukur dengan tracemalloc pada ekspor satu proses; nilainya harus jauh di bawah
+    ukuran berkas hasil karena data ditulis per potongan.
+    """
+    repo = RepositoriMemori()
+    with repo.kelompok():
+        for i in range(jumlah_mhs):
+            mhs = repo.tambah_mahasiswa(f"Mahasiswa {i}", str(i))
+            for j in range(jumlah_matkul):
+                repo.simpan_nilai(mhs, f"Mata Kuliah {j}", (i * 7 + j * 13) % 101, 1 + j % 8, 1 + j % 4)
+
+    cpu = os.cpu_count() or 1
+    hasil = []
+    with tempfile.TemporaryDirectory() as direktori:
+        for format in ("csv", "jsonl", "txt"):
+            path = os.path.join(direktori, f"ekspor.{format}")
+            for pekerja in sorted({1, cpu}):
+                mulai = time.perf_counter()
+                ekspor(repo, path, format, pekerja=pekerja)
+                hasil.append((format, pekerja, time.perf_counter() - mulai, os.path.getsize(path)))
+
+        tracemalloc.start()
+        ekspor(repo, os.path.join(direktori, "ekspor.txt"), "txt", pekerja=1)
+        puncak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return hasil, puncak
+
+
+def bench_log_perintah(jumlah_mhs: int = 1_000, jumlah_matkul: int = 20):
+    """Biaya pencatatan undo per simpan_nilai (repositori langsung vs lewat LogPerintah) dan waktu undo batch."""
+    def isi(target):
+        mulai = time.perf_counter()
+        for i in range(jumlah_mhs):
+            mhs = target.tambah_mahasiswa(f"Mahasiswa {i}", str(i))
+            for j in range(jumlah_matkul):
+                target.simpan_nilai(mhs, f"Mata Kuliah {j}", (i * 7 + j * 13) % 101)
+        return (time.perf_counter() - mulai) / (jumlah_mhs * (jumlah_matkul + 1))
+
+    langsung = isi(RepositoriMemori())
+    log = LogPerintah(RepositoriMemori())
+    with log.batch("isi"):
+        tercatat = isi(log)
+    mulai = time.perf_counter()
+    log.undo()
+    undo = time.perf_counter() - mulai
+    assert len(log.repo) == 0, "undo batch tidak mengembalikan repositori ke kosong"
+    return langsung, tercatat, undo
+
+
+def bench_waktu_impor(modul: str = "akademik.cli", ulang: int = 5) -> float:
+    """Waktu impor kumulatif paket akademik (ms) menurut `python -X importtime`, minimum dari beberapa proses.
+
+    Anggarannya (dan bahwa inti tidak memuat tkinter maupun NumPy) diuji di tests/test_impor.py.
+    """
+    direktori = os.path.dirname(os.path.abspath(__file__))
+    # Ukur dengan bytecode tersimpan seperti instalasi biasa (tidak termasuk waktu kompilasi sumber)
+    compileall.compile_dir(os.path.join(direktori, "akademik"), quiet=1)
+    kode = f"import {modul}"
+    hasil = []
+    for _ in range(ulang):
+        proses = subprocess.run([sys.executable, "-X", "importtime", "-c", kode], capture_output=True, text=True,
+                                cwd=direktori, check=True)
+        # Baris tingkat atas: "import time: <sendiri> | <kumulatif> | akademik..." (tanpa indentasi nama)
+        hasil.append(sum(int(baris.split("|")[1]) for baris in proses.stderr.splitlines()
+                         if baris.split("|")[-1].startswith(" akademik")) / 1e3)
+    return min(hasil)
+
+
+# SUITE SKALA
+def buat_roster(jumlah_mhs: int, matkul_min: int = 5, matkul_max: int = 60, seed: int = 0) -> RepositoriMemori:
+    """Roster sintetis yang dapat diulang: tiap Mahasiswa mengambil matkul_min..matkul_max mata kuliah berurutan
+    (mulai acak) dari "Mata Kuliah 0".."Mata Kuliah {matkul_max - 1}", tersebar di SEMESTER_ROSTER semester
+    dengan SKS 2-4 dan nilai acak 0-100.
+
+    Hanya TEMPLAT_ROSTER pola nilai yang dibangun lewat tambah_nilai_matkul; Mahasiswa lain menyalin array
+    salah satu pola seperti saat memuat snapshot, sehingga 1 juta Mahasiswa tetap dibangun dalam hitungan
+    detik. Indeks pencarian, urutan, dan statistik repositori baru dibangun saat pertama dipakai.
+    """
+    acak = random.Random(seed)
+    templat = []
+    for _ in range(min(jumlah_mhs, TEMPLAT_ROSTER)):
+        mhs = Mahasiswa("", "")
+        awal, jumlah = acak.randrange(matkul_max), acak.randint(matkul_min, matkul_max)
+        for j in range(jumlah):
+            mhs.tambah_nilai_matkul(f"Mata Kuliah {(awal + j) % matkul_max}", acak.randrange(101),
+                                    1 + j * SEMESTER_ROSTER // jumlah, acak.randint(2, 4))
+        templat.append(mhs)
+
+    repo = RepositoriMemori()
+    tambah, dari_array = repo.daftar.tambah, Mahasiswa.dari_array
+    for i in range(jumlah_mhs):
+        pola = templat[acak.randrange(len(templat))]
+        tambah(dari_array(f"{acak.choice(NAMA_DEPAN)} {acak.choice(NAMA_BELAKANG)} {i}", str(10_000_000 + i),
+                          pola._id_matkul[:], pola._nilai[:], pola._riwayat[:], pola._per_semester[:]))
+    return repo
+
+
+def _pasang_tk_tiruan():
+    """Memasang tkinter tiruan di sys.modules agar App bisa dibuat tanpa tampilan (server/CI tanpa X).
+
+    Treeview tiruan hanya menyimpan baris di dict + list, jadi angka yang dihasilkan mengukur sisi Python App
+    (cache baris, panggilan repositori), bukan biaya gambar Tk; untuk itu pakai `--tk asli` di bawah Xvfb.
+    """
+    class Widget:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def __getattr__(self, nama):
+            return lambda *args, **kwargs: None   # pack, grid, config, bind, after, ...
+
+    class Entry(Widget):
+        def __init__(self, *args, **kwargs):
+            self._teks = ""
+
+        def get(self):
+            return self._teks
+
+        def insert(self, indeks, teks):
+            self._teks = str(teks) + self._teks if indeks == 0 else self._teks + str(teks)
+
+        def delete(self, awal, akhir=None):
+            self._teks = ""
+
+    class StringVar:
+        def __init__(self, master=None, value=""):
+            self._nilai = value
+
+        def get(self):
+            return self._nilai
+
+        def set(self, nilai):
+            self._nilai = nilai
+
+        def trace_add(self, *args):
+            pass
+
+    class Treeview(Widget):
+        def __init__(self, *args, **kwargs):
+            self._baris: dict = {}
+            self._urutan: list = []
+            self._pilihan: tuple = ()
+
+        def insert(self, induk, indeks, iid=None, values=()):
+            self._baris[iid] = tuple(values)
+            if indeks == "end":
+                self._urutan.append(iid)
+            else:
+                self._urutan.insert(int(indeks), iid)
+            return iid
+
+        def delete(self, *iids):
+            for iid in iids:
+                del self._baris[iid]
+                if iid in self._urutan:
+                    self._urutan.remove(iid)
+            self._pilihan = tuple(iid for iid in self._pilihan if iid in self._baris)
+
+        def detach(self, *iids):
+            for iid in iids:
+                self._urutan.remove(iid)
+
+        def move(self, iid, induk, indeks):
+            if iid in self._urutan:
+                self._urutan.remove(iid)
+            self._urutan.insert(int(indeks), iid)
+
+        def index(self, iid):
+            return self._urutan.index(iid)
+
+        def item(self, iid, option=None, **kwargs):
+            if "values" in kwargs:
+                self._baris[iid] = tuple(kwargs["values"])
+                return None
+            return self._baris[iid] if option == "values" else {"values": self._baris[iid]}
+
+        def get_children(self, item=""):
+            return tuple(self._urutan)
+
+        def selection(self):
+            return self._pilihan
+
+        def selection_set(self, *iids):
+            self._pilihan = iids
+
+    tk = types.ModuleType("tkinter")
+    tk.Tk = tk.Toplevel = tk.Frame = tk.Label = Widget
+    tk.Entry, tk.StringVar, tk.END, tk.Event = Entry, StringVar, "end", object
+    ttk = types.ModuleType("tkinter.ttk")
+    ttk.Style = ttk.Button = ttk.Scrollbar = ttk.Progressbar = Widget
+    ttk.Treeview = Treeview
+    messagebox = types.ModuleType("tkinter.messagebox")
+    messagebox.showinfo = messagebox.showwarning = messagebox.showerror = lambda *args, **kwargs: None
+    messagebox.askyesno = lambda *args, **kwargs: True
+    filedialog = types.ModuleType("tkinter.filedialog")
+    filedialog.askopenfilename = filedialog.asksaveasfilename = lambda **kwargs: ""
+    tk.ttk, tk.messagebox, tk.filedialog = ttk, messagebox, filedialog
+    sys.modules.update({"tkinter": tk, "tkinter.ttk": ttk, "tkinter.messagebox": messagebox,
+                        "tkinter.filedialog": filedialog})
+
+
+def _modul_gui(tk_asli: bool):
+    """Mengimpor Data.py dengan tkinter asli (butuh DISPLAY, mis. Xvfb) atau tiruan."""
+    if not tk_asli and "Data" not in sys.modules:
+        _pasang_tk_tiruan()
+    import Data
+    # Dialog konfirmasi (hapus) dijawab otomatis agar benchmark tidak menunggu pengguna
+    Data.messagebox.askyesno = lambda *args, **kwargs: True
+    return Data
+
+
+def _ukur(fungsi, lacak_memori: bool) -> tuple[float, int]:
+    """Menjalankan fungsi sekali: (detik, puncak byte di atas memori sebelum pemanggilan, 0 jika tidak dilacak)."""
+    if lacak_memori:
+        tracemalloc.reset_peak()
+        sebelum = tracemalloc.get_traced_memory()[0]
+    mulai = time.perf_counter()
+    fungsi()
+    detik = time.perf_counter() - mulai
+    return detik, tracemalloc.get_traced_memory()[1] - sebelum if lacak_memori else 0
+
+
+def _per_operasi(fungsi, argumen: list) -> float:
+    """Rata-rata waktu fungsi(a) dalam mikrodetik untuk setiap a dalam argumen."""
+    mulai = time.perf_counter()
+    for a in argumen:
+        fungsi(a)
+    return (time.perf_counter() - mulai) / len(argumen) * 1e6
+
+
+def _bench_operasi_model(repo: RepositoriMemori, sampel: int) -> dict:
+    """Operasi model hangat (indeks/urutan/statistik sudah dibangun), rata-rata per panggilan dalam us."""
+    acak = random.Random(1)
+    mhs = acak.sample(list(repo), min(sampel, len(repo)))
+    # Separuh NIM terdaftar, separuh belum (jalur tambah Mahasiswa baru)
+    nim_uji = [m.nim for m in mhs[:len(mhs) // 2]] + [str(i) for i in range(len(mhs) - len(mhs) // 2)]
+    return {
+        "hitung_ipk": _per_operasi(Mahasiswa.hitung_ipk, mhs),
+        "hitung_rata_rata": _per_operasi(Mahasiswa.hitung_rata_rata, mhs),
+        "cek_nim_duplikat": _per_operasi(repo.__contains__, nim_uji),
+        "cek_input": _per_operasi(lambda m: cek_input("Budi Santoso", m.nim, "Mata Kuliah 0", "85", "2", "3"), mhs),
+        "cari_teks": _per_operasi(repo.cari_teks, [m.nim[:6] for m in mhs[:100]]),
+        # Termasuk pembaruan inkremental indeks urutan dan statistik yang sudah dibangun
+        "simpan_nilai": _per_operasi(lambda m: repo.simpan_nilai(m, "Mata Kuliah 0", acak.randrange(101)), mhs),
+        "peringkat_10": _per_operasi(lambda _: repo.peringkat(10), range(100)),
+    }
+
+
+def _bench_operasi_tabel(Data, app, sampel: int, tk_asli: bool) -> dict:
+    """Menjalankan handler CRUD dan refresh tabel App seperti klik pengguna; waktu diambil dari app.profil."""
+    # Statistik pertama dibangun di thread pekerja (App.muat_statistik); Tk tiruan tidak menjalankan after(),
+    # jadi antrean penjadwal dipompa langsung sampai tabel statistik terisi
+    while not app._statistik_siap:
+        app.penjadwal._polling()
+        time.sleep(0.01)
+    app.profil.reset()
+
+    def gambar():
+        # Tk asli: biaya gambar ulang widget dicatat terpisah dari waktu handler
+        if tk_asli:
+            mulai = time.perf_counter()
+            app.root.update()
+            app.profil.catat("gambar_tk", time.perf_counter() - mulai)
+
+    def pilih(i: int):
+        terlihat = app.tree_mhs.get_children()
+        app.tree_mhs.selection_set(terlihat[i % min(len(terlihat), Data.TINGGI_TABEL_MHS)])
+        app.pilih_mahasiswa(None)
+
+    for _ in range(3):
+        app.update_mahasiswa_table()
+        gambar()
+    for i in range(sampel):
+        app.clear_input_mhs()
+        app.entry_nama.insert(0, "Mahasiswa Baru")
+        app.entry_nim.insert(0, str(90_000_000 + i))
+        app.tambah_mahasiswa()
+        gambar()
+    for i in range(sampel):
+        pilih(i)
+        app.entry_matkul.insert(0, "Mata Kuliah 1")
+        app.entry_nilai.insert(0, str(i % 101))
+        app.tambah_edit_nilai()
+        gambar()
+    for i in range(sampel):
+        pilih(i)
+        app.entry_nama.delete(0, Data.tk.END)
+        app.entry_nama.insert(0, f"Nama Diedit {chr(65 + i % 26)}")
+        app.edit_mahasiswa()
+        gambar()
+    for teks in ("1000", "budi", ""):
+        app.var_cari.set(teks)
+        app.terapkan_filter()
+        gambar()
+    for _ in range(3):   # naik, turun, kembali ke urutan input
+        app.urutkan_kolom("ipk")
+        gambar()
+    for i in range(sampel):
+        pilih(i)
+        app.hapus_mahasiswa()
+        gambar()
+    app.undo()
+    gambar()
+    return app.profil.ringkasan()
+
+
+def bench_skala(jumlah_mhs: int, matkul_min: int = 5, matkul_max: int = 60, sampel: int = 1_000,
+                sampel_tabel: int = 100, tk_asli: bool = False) -> dict:
+    """Suite skala untuk satu ukuran roster, dalam dua putaran pada roster yang sama (seed tetap).
+
+    Putaran waktu: membangun roster, langkah "dingin" (indeks pencarian, urutan IPK, statistik, membuka App)
+    lalu operasi model hangat dan handler App. Putaran memori: langkah yang sama di bawah tracemalloc (yang
+    memperlambat eksekusi, sehingga waktunya tidak dipakai) untuk puncak memori tiap langkah.
+    """
+    Data = _modul_gui(tk_asli)
+    hasil = {"mahasiswa": jumlah_mhs, "matkul": [matkul_min, matkul_max], "tk": "asli" if tk_asli else "tiruan"}
+    for lacak_memori in (False, True):
+        objek = {}
+        langkah = {
+            "bangun_roster": lambda: objek.update(repo=buat_roster(jumlah_mhs, matkul_min, matkul_max)),
+            "indeks_cari": lambda: objek["repo"].cari_teks("1000"),
+            "urutan_ipk": lambda: objek["repo"].peringkat(10),
+            "statistik": lambda: objek["repo"].statistik_matkul(),
+            "buka_app": lambda: objek.update(app=Data.App(Data.tk.Tk(), objek["repo"], profil=Data.ProfilWaktu())),
+        }
+        if lacak_memori:
+            tracemalloc.start()
+        ukuran = {nama: _ukur(fungsi, lacak_memori) for nama, fungsi in langkah.items()}
+        if lacak_memori:
+            tracemalloc.stop()
+            hasil["memori_mib"] = {nama: puncak / 2**20 for nama, (_, puncak) in ukuran.items()}
+        else:
+            hasil["nilai"] = sum(len(m.matkul_nilai) for m in objek["repo"])
+            hasil["langkah_ms"] = {nama: detik * 1e3 for nama, (detik, _) in ukuran.items()}
+            hasil["model_us"] = _bench_operasi_model(objek["repo"], sampel)
+            hasil["tabel"] = _bench_operasi_tabel(Data, objek["app"], sampel_tabel, tk_asli)
+        objek["app"].penjadwal.tutup()
+        objek["app"].root.destroy()
+        objek.clear()
+        gc.collect()
+    return hasil
+
+
+def cetak_skala(hasil: dict):
+    print(f"Skala {hasil['mahasiswa']:,} Mahasiswa x {hasil['matkul'][0]}-{hasil['matkul'][1]} mata kuliah "
+          f"({hasil['nilai']:,} nilai), Tk {hasil['tk']}")
+    print(f"  {'langkah':<26}{'waktu (ms)':>12}{'memori (MiB)':>14}")
+    for nama, milidetik in hasil["langkah_ms"].items():
+        print(f"  {nama:<26}{milidetik:12.1f}{hasil['memori_mib'][nama]:14.1f}")
+    print("  model (us/operasi): " + ", ".join(f"{nama} {us:.2f}" for nama, us in hasil["model_us"].items()))
+    print(f"  {'handler / refresh App':<26}{'N':>6}{'rata (ms)':>11}{'p95 (ms)':>10}{'maks (ms)':>11}")
+    for nama, s in hasil["tabel"].items():
+        print(f"  {nama:<26}{s['jumlah']:6}{s['rata_ms']:11.3f}{s['p95_ms']:10.3f}{s['maks_ms']:11.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark model Mahasiswa dan tabel GUI")
+    parser.add_argument("--skala", action="store_true",
+                        help="suite skala: roster sintetis, operasi model, refresh Treeview, puncak memori")
+    parser.add_argument("--ukuran", type=int, nargs="+", default=UKURAN_SKALA, help="jumlah Mahasiswa per putaran")
+    parser.add_argument("--matkul", type=int, nargs=2, default=(5, 60), metavar=("MIN", "MAKS"),
+                        help="rentang jumlah mata kuliah per Mahasiswa")
+    parser.add_argument("--tk", choices=("auto", "asli", "tiruan"), default="auto",
+                        help="Tk asli butuh DISPLAY (mis. `xvfb-run`); auto = asli jika DISPLAY ada")
+    parser.add_argument("--json", metavar="BERKAS", help="simpan hasil suite skala ke BERKAS")
+    args = parser.parse_args()
+
+    if args.skala:
+        tk_asli = args.tk == "asli" or (args.tk == "auto" and bool(os.environ.get("DISPLAY")))
+        semua = []
+        for n in args.ukuran:
+            semua.append(bench_skala(n, *args.matkul, tk_asli=tk_asli))
+            cetak_skala(semua[-1])
+        if args.json:
+            with open(args.json, "w", encoding="utf-8") as f:
+                json.dump(semua, f, indent=2)
+        sys.exit(0)
+
+    waktu_impor = bench_waktu_impor()
+    print(f"Impor akademik.cli tanpa GUI: {waktu_impor:.1f} ms")
+
+    print("Tambah Mahasiswa (cek duplikat + sisip)")
+    for n, mikrodetik in bench_tambah_mahasiswa():
+        print(f"  {n:>8} mahasiswa: {mikrodetik:8.3f} us/sisipan")
+
+    satuan, batch = bench_konversi_nilai()
+    print("Konversi 1.000.000 nilai")
+    print(f"  satu per satu: {satuan:.3f} s, batch: {batch:.3f} s")
+
+    lama, baru = bench_memori()
+    print("Memori 10.000 mahasiswa x 40 mata kuliah")
+    print(f"  dict: {lama / 2**20:.1f} MiB, __slots__ + array: {baru / 2**20:.1f} MiB")
+
+    print("Muat snapshot 100.000 mahasiswa x 10 mata kuliah + putar ulang 9.000 entri jurnal")
+    print(f"  {bench_muat_jurnal():.3f} s")
+
+    bangun, hasil = bench_cari()
+    print(f"Pencarian 100.000 mahasiswa (bangun indeks: {bangun:.3f} s)")
+    for teks, jumlah, milidetik in hasil:
+        print(f"  {teks!r:>16}: {jumlah:>6} cocok, {milidetik:7.2f} ms")
+
+    terurut, naif = bench_urutan()
+    print("Top-10/bottom-10 IPK setelah satu perubahan nilai, 100.000 mahasiswa")
+    print(f"  struktur terurut: {terurut * 1e3:.3f} ms, sorted() penuh: {naif * 1e3:.3f} ms")
+    print(f"  SQLite (top-50 + posisi baris, kolom IPK berindeks): {bench_urutan_sqlite() * 1e3:.3f} ms")
+
+    inkremental, brute_force = bench_statistik()
+    print("Statistik 10 mata kuliah setelah satu perubahan nilai, 100.000 mahasiswa")
+    print(f"  ember inkremental: {inkremental * 1e3:.3f} ms, hitung ulang penuh: {brute_force * 1e3:.1f} ms")
+
+    percobaan, inkremental, bangun_ulang = bench_transkrip()
+    print(f"Ubah satu nilai + baca transkrip, riwayat {percobaan} percobaan dalam {MAKS_SEMESTER} semester")
+    print(f"  prefix sum inkremental: {inkremental * 1e3:.3f} ms, bangun ulang: {bangun_ulang * 1e3:.1f} ms")
+
+    hasil, puncak = bench_ekspor()
+    print("Ekspor 100.000 mahasiswa x 10 mata kuliah")
+    for format, pekerja, detik, ukuran in hasil:
+        print(f"  {format:>5}, {pekerja} proses: {detik:.3f} s ({ukuran / 2**20:.1f} MiB)")
+    print(f"  puncak memori ekspor teks satu proses: {puncak / 2**20:.1f} MiB")
+
+    langsung, tercatat, undo = bench_log_perintah()
+    print("Mutasi 1.000 mahasiswa x 20 nilai dengan pencatatan undo/redo")
+    print(f"  langsung: {langsung * 1e6:.2f} us/operasi, lewat LogPerintah: {tercatat * 1e6:.2f} us/operasi, "
+          f"undo satu batch: {undo:.3f} s")
@@ -0,0 +1,28 @@
+"""Uji CLI `python -m akademik` lewat main() pada data persisten sementara."""
+import pytest
+
+from akademik.cli import main
+
+
+@pytest.fixture(params=["jurnal", "sqlite"])
+def jalankan(request, tmp_path, capsys):
+    def jalankan(*argumen: str) -> list[str]:
+        assert main(["--backend", request.param, "--data", str(tmp_path), *argumen]) == 0
+        return capsys.readouterr().out.splitlines()
+    return jalankan
+
+
+def test_cari_terurut_menyaring_urutan_repositori(jalankan):
+    for nim, nama, nilai in [("1", "Ani", "90"), ("2", "Dani", "60"), ("3", "Budi", "75"), ("4", "Nana", "70")]:
+        jalankan("tambah", nim, nama)
+        jalankan("nilai", nim, "Kalkulus", nilai)
+
+    def nim_hasil(*argumen: str) -> list[str]:
+        keluaran = jalankan("cari", *argumen)
+        return [baris.split()[0] for baris in keluaran[1:-1]]
+
+    assert nim_hasil("an", "--urut", "ipk", "--menurun") == ["1", "4", "2"]
+    assert nim_hasil("an", "--urut", "nama") == ["1", "2", "4"]
+    assert nim_hasil("an", "--urut", "rata", "--batas", "2") == ["2", "4"]
+    assert jalankan("cari", "an", "--urut", "rata", "--batas", "2")[-1] == "2 dari 3 Mahasiswa"
+    assert nim_hasil("--urut", "rata") == ["2", "4", "3", "1"]
@@ -0,0 +1,172 @@
+"""Uji RepositoriJurnal: crash di tengah penulisan, entri jurnal rusak/yatim, kompaksi, dan waktu muat."""
+import os
+import random
+import shutil
+import subprocess
+import sys
+import time
+
+import pytest
+
+from akademik import Mahasiswa, RepositoriJurnal
+
+DIREKTORI_REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BATAS_MUAT_DETIK_PER_MHS = 1.0 / 100_000   # target: snapshot + jurnal 100k Mahasiswa dimuat di bawah 1 detik
+
+
+def _isi(repo) -> list[tuple[str, str, list]]:
+    return [(mhs.nim, mhs.nama, mhs.riwayat_nilai()) for mhs in repo.daftar]
+
+
+def test_crash_penulis_jurnal(tmp_path):
+    """Membunuh (SIGKILL) proses penulis di titik acak, lalu membuka ulang dan memeriksa data.
+
+    Penulis mencetak nomor Mahasiswa setelah tambah + simpan_nilai-nya di-fsync; setiap Mahasiswa yang sudah
+    dikonfirmasi harus ada beserta nilainya, paling banyak satu operasi setelahnya boleh ikut tersimpan, dan
+    cache rata-rata/IPK harus sama dengan hasil hitung ulang. Ambang kompaksi kecil agar kill juga mengenai
+    kompaksi.
+    """
+    acak = random.Random(0)
+    kode = ("import sys, itertools\n"
+            "from akademik import RepositoriJurnal\n"
+            "repo = RepositoriJurnal(sys.argv[1], batas_kompaksi=100)\n"
+            "for i in itertools.count(len(repo)):\n"
+            "    mhs = repo.tambah_mahasiswa(f'Mahasiswa {i}', str(i))\n"
+            "    repo.simpan_nilai(mhs, 'Kalkulus', i % 101, 1 + i % 8, 1 + i % 4)\n"
+            "    print(i, flush=True)\n")
+    terkonfirmasi = -1
+    tanpa_nilai = set()   # Mahasiswa yang tersimpan tanpa nilai karena kill jatuh di antara dua operasinya
+    for _ in range(4):
+        proses = subprocess.Popen([sys.executable, "-c", kode, str(tmp_path)], stdout=subprocess.PIPE, text=True,
+                                  cwd=DIREKTORI_REPO)
+        try:
+            for _ in range(acak.randint(20, 300)):
+                baris = proses.stdout.readline()
+                assert baris, "penulis jurnal berhenti sebelum dibunuh"
+                terkonfirmasi = int(baris)
+        finally:
+            proses.kill()
+            proses.wait()
+            proses.stdout.close()
+
+        for _ in range(2):   # pembukaan kedua memeriksa jurnal yang sudah dipangkas
+            repo = RepositoriJurnal(str(tmp_path))
+            n = len(repo)
+            assert terkonfirmasi + 1 <= n <= terkonfirmasi + 2
+            for i in range(n):
+                mhs = repo.cari(str(i))
+                assert mhs is not None and mhs.nama == f"Mahasiswa {i}"
+                if i <= terkonfirmasi and i not in tanpa_nilai:
+                    assert mhs.percobaan_matkul("Kalkulus") == [(1 + i % 8, 1 + i % 4, i % 101)]
+                rata, ipk = mhs.hitung_rata_rata(), mhs.hitung_ipk()
+                mhs.hitung_ulang_total()
+                assert (rata, ipk) == (mhs.hitung_rata_rata(), mhs.hitung_ipk())
+            repo.tutup()
+        tanpa_nilai.update(i for i in range(terkonfirmasi + 1, n) if not repo.cari(str(i)).matkul_nilai)
+        terkonfirmasi = n - 1   # penulis berikutnya melanjutkan dari data yang tersimpan
+
+
+def test_baris_terpotong_dipangkas(tmp_path):
+    repo = RepositoriJurnal(str(tmp_path), fsync=False)
+    mhs = repo.tambah_mahasiswa("Ani", "1")
+    repo.simpan_nilai(mhs, "Kalkulus", 80, 2, 3)
+    repo.tutup()
+    path_jurnal = tmp_path / RepositoriJurnal.NAMA_JURNAL
+    ukuran = path_jurnal.stat().st_size
+    with open(path_jurnal, "ab") as f:
+        f.write(b'[3,"nilai","1","Fisika",7')   # penulisan terakhir terpotong crash
+
+    repo = RepositoriJurnal(str(tmp_path), fsync=False)
+    assert repo.cari("1").riwayat_nilai() == [("Kalkulus", 2, 3, 80)]
+    assert path_jurnal.stat().st_size == ukuran
+    repo.tutup()
+
+
+def test_tulis_lewat_objek_basi_ditolak(tmp_path):
+    repo = RepositoriJurnal(str(tmp_path), fsync=False)
+    basi = repo.tambah_mahasiswa("Ani", "1")
+    repo.hapus_mahasiswa(basi)
+    repo.tambah_mahasiswa("Ani Baru", "1")
+    with pytest.raises(KeyError):
+        repo.simpan_nilai(basi, "Kalkulus", 80)
+    with pytest.raises(KeyError):
+        repo.edit_mahasiswa(basi, "Ani", "2")
+    with pytest.raises(KeyError):
+        repo.hapus_mahasiswa(Mahasiswa("Budi", "9"))
+    sebelum = _isi(repo)
+    repo.tutup()
+
+    repo = RepositoriJurnal(str(tmp_path), fsync=False)
+    assert _isi(repo) == sebelum == [("1", "Ani Baru", [])]
+    repo.tutup()
+
+
+def test_entri_jurnal_yatim_dilewati(tmp_path):
+    """Entri untuk NIM yang tidak terdaftar (ditulis versi lama lewat objek basi) tidak menggagalkan pembukaan."""
+    (tmp_path / RepositoriJurnal.NAMA_JURNAL).write_bytes(
+        b'[1,"tambah","Ani","1"]\n'
+        b'[2,"nilai","9","Kalkulus",80,1,3]\n'
+        b'[3,"hapus_nilai","9","Kalkulus",null]\n'
+        b'[4,"nilai","1","Kalkulus",70,1,3]\n')
+    repo = RepositoriJurnal(str(tmp_path), fsync=False)
+    assert _isi(repo) == [("1", "Ani", [("Kalkulus", 1, 3, 70)])]
+    repo.tutup()
+
+
+def test_kompaksi_lalu_buka_ulang(tmp_path):
+    acak = random.Random(1)
+    repo = RepositoriJurnal(str(tmp_path), batas_kompaksi=50, fsync=False)
+    for i in range(200):
+        mhs = repo.tambah_mahasiswa(f"Mahasiswa {i}", str(i))
+        for j in range(acak.randint(0, 4)):
+            repo.simpan_nilai(mhs, f"Mata Kuliah {j}", acak.randint(0, 100), acak.randint(1, 4))
+    for i in range(0, 200, 7):
+        repo.hapus_mahasiswa(repo.cari(str(i)))
+    for i in range(1, 200, 5):
+        if str(i) in repo:
+            repo.hapus_nilai(repo.cari(str(i)), "Mata Kuliah 0")
+    repo.edit_mahasiswa(repo.cari("1"), "Ganti Nama", "1000")
+    sebelum = _isi(repo)
+    repo.tutup()
+    assert (tmp_path / RepositoriJurnal.NAMA_SNAPSHOT).exists()
+
+    repo = RepositoriJurnal(str(tmp_path), batas_kompaksi=50, fsync=False)
+    assert _isi(repo) == sebelum
+    repo.kompaksi()
+    repo.tutup()
+    assert (tmp_path / RepositoriJurnal.NAMA_JURNAL).stat().st_size == 0
+    repo = RepositoriJurnal(str(tmp_path), fsync=False)
+    assert _isi(repo) == sebelum
+    repo.tutup()
+
+
+def test_waktu_muat_snapshot_dan_jurnal(tmp_path):
+    """Target 1 detik untuk 100k Mahasiswa (10 mata kuliah, jurnal 10k entri tepat di bawah ambang kompaksi),
+    diskalakan ke 20k Mahasiswa dan 2k entri jurnal; diambil yang tercepat dari beberapa pembukaan."""
+    jumlah_mhs = 20_000
+    repo = RepositoriJurnal(str(tmp_path), fsync=False)
+    with repo.kelompok():
+        for i in range(jumlah_mhs):
+            mhs = repo.tambah_mahasiswa(f"Mahasiswa {i}", str(i))
+            for j in range(10):
+                repo.simpan_nilai(mhs, f"Mata Kuliah {j}", (i + j) % 101)
+    repo.tutup()
+    repo = RepositoriJurnal(str(tmp_path), fsync=False)
+    with repo.kelompok():
+        for k in range(jumlah_mhs // 10):
+            repo.simpan_nilai(repo.cari(str(k % jumlah_mhs)), "Mata Kuliah 0", k % 101)
+    repo.tutup()
+    assert (tmp_path / RepositoriJurnal.NAMA_JURNAL).stat().st_size
+
+    salinan = tmp_path / "salinan"
+    waktu = []
+    for _ in range(3):
+        shutil.rmtree(salinan, ignore_errors=True)
+        shutil.copytree(tmp_path, salinan, ignore=shutil.ignore_patterns("salinan"))
+        mulai = time.perf_counter()
+        repo = RepositoriJurnal(str(salinan))
+        waktu.append(time.perf_counter() - mulai)
+        assert len(repo) == jumlah_mhs
+        repo.tutup()
+    batas = BATAS_MUAT_DETIK_PER_MHS * jumlah_mhs
+    assert min(waktu) < batas, f"muat {min(waktu):.3f} s, batas {batas:.3f} s"
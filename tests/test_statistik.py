@@ -0,0 +1,116 @@
+"""Uji statistik kohort per mata kuliah: hasil inkremental harus sama persis dengan hitung ulang penuh."""
+import random
+import statistics
+import threading
+
+import pytest
+
+from akademik import (LogPerintah, Mahasiswa, NILAI_LULUS, RepositoriJurnal, RepositoriMemori, RepositoriSQLite,
+                      StatistikKohort)
+
+
+def _statistik_brute_force(repo) -> dict:
+    """Statistik per mata kuliah dengan mengulang semua nilai efektif setiap Mahasiswa (pembanding)."""
+    per_matkul = {}
+    for mhs in repo:
+        for matkul, nilai in mhs.matkul_nilai.items():
+            per_matkul.setdefault(matkul, []).append(nilai)
+    hasil = {}
+    for matkul in sorted(per_matkul):
+        daftar_nilai = per_matkul[matkul]
+        distribusi = {huruf: 0 for huruf in ("A+", "A", "AB", "B", "BC", "C", "D", "E")}
+        for nilai in daftar_nilai:
+            distribusi[Mahasiswa.konversi_nilai_ke_huruf_dan_bobot(nilai)[0]] += 1
+        hasil[matkul] = {"jumlah": len(daftar_nilai), "rata": float(statistics.mean(daftar_nilai)),
+                         "median": float(statistics.median(daftar_nilai)),
+                         "simpangan_baku": statistics.pstdev(daftar_nilai), "distribusi": distribusi,
+                         "lulus": sum(nilai >= NILAI_LULUS for nilai in daftar_nilai) / len(daftar_nilai)}
+    return hasil
+
+
+@pytest.fixture(params=["memori", "jurnal", "sqlite"])
+def repo(request, tmp_path):
+    if request.param == "memori":
+        repo = RepositoriMemori()
+    elif request.param == "jurnal":
+        repo = RepositoriJurnal(str(tmp_path), fsync=False)
+    else:
+        repo = RepositoriSQLite(str(tmp_path / "mahasiswa.db"))
+    yield repo
+    repo.tutup()
+
+
+def _isi_acak(repo, acak: random.Random, jumlah_mhs: int):
+    with repo.kelompok():
+        for i in range(jumlah_mhs):
+            mhs = repo.tambah_mahasiswa(f"Mahasiswa {i}", str(i))
+            for j in acak.sample(range(12), acak.randint(0, 6)):
+                repo.simpan_nilai(mhs, f"Mata Kuliah {j}", acak.randint(0, 100), acak.randint(1, 4))
+
+
+def _ubah_acak(repo, acak: random.Random, jumlah_mhs: int):
+    """Satu mutasi acak: tambah/ulang/ubah nilai, hapus nilai (satu semester atau semua), hapus Mahasiswa."""
+    nim = str(acak.randrange(jumlah_mhs))
+    mhs = repo.cari(nim)
+    if mhs is None:
+        repo.tambah_mahasiswa(f"Mahasiswa {nim}", nim)
+        return
+    matkul = f"Mata Kuliah {acak.randrange(12)}"
+    peluang = acak.random()
+    if peluang < 0.6:
+        repo.simpan_nilai(mhs, matkul, acak.randint(0, 100), acak.choice([None, 1, 2, 3, 4]))
+    elif peluang < 0.9:
+        repo.hapus_nilai(mhs, matkul, acak.choice([None, 1, 2, 3, 4]))
+    else:
+        repo.hapus_mahasiswa(mhs)
+
+
+def test_statistik_sama_dengan_hitung_ulang(repo):
+    acak = random.Random(0)
+    _isi_acak(repo, acak, 300)
+    assert repo.statistik_matkul() == _statistik_brute_force(repo)
+    for langkah in range(600):
+        _ubah_acak(repo, acak, 300)
+        if langkah % 50 == 0:
+            assert repo.statistik_matkul() == _statistik_brute_force(repo)
+    assert repo.statistik_matkul() == _statistik_brute_force(repo)
+
+
+def test_statistik_setelah_undo_redo(repo):
+    acak = random.Random(1)
+    _isi_acak(repo, acak, 100)
+    awal = repo.statistik_matkul()
+    log = LogPerintah(repo)
+    with log.batch("Ubah massal"):
+        for _ in range(200):
+            _ubah_acak(log, acak, 100)
+    diubah = repo.statistik_matkul()
+    assert diubah == _statistik_brute_force(repo)
+    log.undo()
+    assert repo.statistik_matkul() == awal == _statistik_brute_force(repo)
+    log.redo()
+    assert repo.statistik_matkul() == diubah
+
+
+def test_statistik_sqlite_menerapkan_perubahan_selama_group_by(tmp_path, monkeypatch):
+    """GROUP BY pertama berjalan di snapshot terpisah tanpa kunci; perubahan selama itu harus ikut terhitung."""
+    repo = RepositoriSQLite(str(tmp_path / "mahasiswa.db"))
+    acak = random.Random(2)
+    _isi_acak(repo, acak, 200)
+    dari_hitungan = StatistikKohort.dari_hitungan
+
+    def sambil_menulis(baris):
+        # Dijalankan tanpa kunci repositori: tulis dari thread lain harus bisa selesai sekarang
+        penulis = threading.Thread(target=lambda: [_ubah_acak(repo, acak, 200) for _ in range(100)])
+        penulis.start()
+        penulis.join(timeout=10)
+        assert not penulis.is_alive(), "penulis terblokir oleh pembangunan statistik"
+        return dari_hitungan(baris)
+
+    monkeypatch.setattr(StatistikKohort, "dari_hitungan", sambil_menulis)
+    assert repo.statistik_matkul() == _statistik_brute_force(repo)
+    monkeypatch.undo()
+    for _ in range(50):
+        _ubah_acak(repo, acak, 200)
+    assert repo.statistik_matkul() == _statistik_brute_force(repo)
+    repo.tutup()